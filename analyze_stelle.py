@@ -10,26 +10,78 @@ Verwendung:
   python3 analyze_stelle.py < anzeige.txt      # Aus Datei
   cat anzeige.txt | python3 analyze_stelle.py  # Via Pipe
   python3 analyze_stelle.py --no-llm           # Ohne LLM
+  python3 analyze_stelle.py --batch input/     # Alle Anzeigen eines Ordners
+  python3 analyze_stelle.py --rank             # Rangliste aller gespeicherten Analysen
+  python3 analyze_stelle.py --embeddings       # Zusätzlich semantisches Skill-Matching
 
 Autor: Marcus Moser
 Datum: 04.02.2026
 """
 
 import sys
+import time
 import argparse
 from pathlib import Path
 
 # Füge data-Verzeichnis zum Pfad hinzu
 sys.path.insert(0, str(Path(__file__).parent / "data"))
 
+# Ablage von StellenanzeigenAnalyzer.save_analysis
+ANALYSEN_DIR = Path(__file__).parent / "output" / "analysen"
+
 from data.bewerbungs_firma import (
     StellenanzeigenAnalyzer,
     print_analysis_report,
     input_stellenanzeige,
+    print_batch_report,
+    find_batch_files,
+    rank_analyses,
+    print_ranking,
+    RanglistenCache,
+    configure_llm_cache,
+    configure_embeddings,
     OllamaClient
 )
 
 
+def run_batch(verzeichnis: Path, use_llm: bool, jobs, llm_jobs: int) -> int:
+    """Analysiert alle Stellenanzeigen eines Verzeichnisses"""
+    if not verzeichnis.is_dir():
+        print(f"❌ Verzeichnis nicht gefunden: {verzeichnis}")
+        return 1
+    
+    dateien = find_batch_files(verzeichnis)
+    if not dateien:
+        print(f"❌ Keine Stellenanzeigen in {verzeichnis} gefunden")
+        return 1
+    
+    print(f"📂 {len(dateien)} Stellenanzeigen in {verzeichnis}")
+    
+    start = time.perf_counter()
+    analyzer = StellenanzeigenAnalyzer(use_llm=use_llm)
+    eintraege = analyzer.analyze_batch(dateien, jobs=jobs, llm_jobs=llm_jobs)
+    print_batch_report(eintraege, time.perf_counter() - start)
+    
+    return 0 if all(e.result is not None for e in eintraege) else 1
+
+
+def run_rank(verzeichnis: Path, limit: int) -> int:
+    """Rangliste aller gespeicherten Analysen nach aktuellem Deckungsgrad"""
+    if not verzeichnis.is_dir():
+        print(f"❌ Verzeichnis nicht gefunden: {verzeichnis}")
+        return 1
+    
+    start = time.perf_counter()
+    cache = RanglistenCache(verzeichnis)
+    eintraege = rank_analyses(verzeichnis, cache=cache)
+    if not eintraege:
+        print(f"❌ Keine Analysen in {verzeichnis} gefunden")
+        return 1
+    
+    print_ranking(eintraege, time.perf_counter() - start, limit or None, cache.gelesen)
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analysiert Stellenanzeigen und führt Skill-Matching durch."
@@ -54,12 +106,69 @@ def main():
         action="store_true",
         help="Generiert Anschreiben-Text mit LLM"
     )
+    parser.add_argument(
+        "--batch", "-b",
+        type=str,
+        metavar="VERZEICHNIS",
+        help="Analysiert alle Stellenanzeigen eines Verzeichnisses (speichert jede als JSON)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Anzahl paralleler Prozesse im Batch-Modus (Standard: CPU-Kerne)"
+    )
+    parser.add_argument(
+        "--llm-jobs",
+        type=int,
+        default=2,
+        help="Maximal gleichzeitige LLM-Abfragen im Batch-Modus (Standard: 2); "
+             "nach jeder LLM-Antwort läuft das Skill-Matching erneut im Hauptprozess"
+    )
+    parser.add_argument(
+        "--rank", "-r",
+        nargs="?",
+        const=str(ANALYSEN_DIR),
+        metavar="VERZEICHNIS",
+        help="Rangliste der gespeicherten Analysen nach Deckungsgrad (ohne LLM, Standard: output/analysen)"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Anzahl Einträge der Rangliste (0 = alle, Standard: 20)"
+    )
+    parser.add_argument(
+        "--embeddings", "-e",
+        nargs="?",
+        const="",
+        metavar="MODELL",
+        help="Semantisches Skill-Matching über Ollama-Embeddings, wenn keine Regel greift "
+             "(Standard-Modell: nomic-embed-text)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM-Antwort-Cache weder lesen noch schreiben"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="LLM neu abfragen und Cache-Einträge überschreiben"
+    )
     
     args = parser.parse_args()
+    configure_llm_cache(enabled=not args.no_cache, refresh=args.refresh_cache)
+    if args.embeddings is not None:
+        configure_embeddings(enabled=True, model=args.embeddings or None)
     
     print("\n🚀 Stellenanzeigen-Analyzer")
     print("-" * 40)
     
+    # Rangliste: nur gespeicherte Analysen, kein LLM nötig
+    if args.rank:
+        return run_rank(Path(args.rank), args.top)
+    
     # Prüfe Ollama
     client = OllamaClient()
     use_llm = not args.no_llm and client.is_available()
@@ -73,6 +182,10 @@ def main():
         else:
             print("⚠️  Ollama nicht verfügbar - nutze nur Regex")
     
+    # Batch-Modus: ganzes Verzeichnis analysieren
+    if args.batch:
+        return run_batch(Path(args.batch), use_llm, args.jobs, args.llm_jobs)
+    
     # Stellenanzeige einlesen
     if args.file:
         # Aus Datei
@@ -109,14 +222,22 @@ def main():
     # Optional: Anschreiben-Text generieren
     if args.generate_text and use_llm:
         print("\n🤖 Generiere Anschreiben-Text...")
-        text = analyzer.generate_anschreiben_text(result)
-        if text:
-            print("\n" + "="*50)
-            print("📝 GENERIERTER ABSATZ:")
-            print("="*50)
-            print(text)
-            print("="*50)
-        else:
+        print("\n" + "="*50)
+        print("📝 GENERIERTER ABSATZ:")
+        print("="*50)
+        # Text erscheint live, während das LLM ihn erzeugt
+        metriken = analyzer.llm_analyzer.client.metriken
+        vorher = len(metriken)
+        text = analyzer.generate_anschreiben_text(
+            result,
+            on_chunk=lambda chunk: print(chunk, end="", flush=True)
+        )
+        print("\n" + "="*50)
+        
+        # Nur Metriken dieser Abfrage (ohne LLM-Aufruf kommt keine dazu)
+        if len(metriken) > vorher:
+            print(f"⏱️  {metriken[-1]}")
+        if not text:
             print("⚠️  Konnte keinen Text generieren")
     
     # Bewerbungsdaten ausgeben
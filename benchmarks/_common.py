@@ -0,0 +1,127 @@
+"""
+Gemeinsame Hilfsfunktionen für die Benchmarks
+=============================================
+Beispiel-Stellenanzeigen, Zeitmessung und Laden eines älteren Modulstands
+aus Git (für Vorher/Nachher-Vergleiche).
+"""
+
+import sys
+import time
+import subprocess
+import tempfile
+import importlib.util
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+INPUT_DIR = BASE_DIR / "input"
+
+# Projektpfade wie in analyze_stelle.py / generator.py
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(DATA_DIR))
+
+
+BEISPIEL_ANZEIGEN = [
+    """Full-Stack Developer (m/w/d)
+
+Beispiel Software GmbH
+Musterstraße 12
+68159 Mannheim
+
+Deine Aufgaben
+- Entwicklung von Webanwendungen mit Vue.js und Node.js
+- Betrieb unserer Microservices auf Kubernetes
+
+Dein Profil
+
+- Abgeschlossene Ausbildung als Fachinformatiker oder Studium
+- Erfahrung mit Python, Django und REST APIs
+- Kenntnisse in Docker, Kubernetes und PostgreSQL
+- Sicherer Umgang mit Git, GitHub Actions und Jira
+- Idealerweise Erfahrung mit React, Redux oder TypeScript
+- Teamfähig, kommunikativ und selbstständig
+
+Wir bieten
+- 30 Tage Urlaub, Homeoffice, 55.000 € bis 65.000 € Gehalt
+
+Kontakt: Frau Anna Schmidt
+jobs@beispiel-software.de
+www.beispiel-software.de
+""",
+    """React & Java- / TypeScript Developer (m/w/d)
+Bei der Acme Tech AG
+Julius-Hatry-Straße 1
+68163 Mannheim
+
+Anforderungen:
+Sehr gute Kenntnisse in TypeScript, JavaScript und Java (Spring Boot)
+Erfahrung mit Angular oder Vue, CI/CD mit GitLab CI und Jenkins
+Testing mit Cypress, Playwright und JUnit, Jira Xray von Vorteil
+Agile Methoden (Scrum, Kanban), Clean Code, SOLID
+Wünschenswert: AWS, Terraform, Ansible, Elasticsearch
+
+Das bieten wir
+Vollzeit, Remote möglich, flexible Arbeitszeiten
+
+Ansprechpartner: Herr Dr. Thomas Müller
+Tel.: 0621 123456-0
+""",
+    """{"firma_name": "Datenwerk GmbH", "strasse": "Hauptstraße 5", "plz": 10115, "ort": "Berlin",
+"recruiter_anrede": "Frau", "recruiter_vorname": "Lea", "recruiter_nachname": "Becker",
+"email": "karriere@datenwerk.de", "web": "www.datenwerk.de"}
+
+Junior Python Engineer (m/w/d) - Data Platform
+
+Ihr Profil
+Sie bringen Kenntnisse in Python, SQL und NoSQL (MongoDB, Redis) mit.
+Erfahrung mit FastAPI oder Flask sowie pytest ist erforderlich.
+Linux, Docker und Git setzen wir voraus; C#, C++ oder .NET sind ein Plus.
+Sie arbeiten strukturiert, analytisch und zuverlässig.
+
+Benefits
+Teilzeit möglich, hybrides Arbeiten
+""",
+]
+
+
+def load_ads(count: int) -> list:
+    """Liefert count Anzeigen: echte aus input/ (falls vorhanden), sonst Beispiele"""
+    ads = [
+        p.read_text(encoding="utf-8")
+        for p in sorted(INPUT_DIR.glob("*.txt"))
+        if p.read_text(encoding="utf-8").strip()
+    ] if INPUT_DIR.exists() else []
+    ads = ads or BEISPIEL_ANZEIGEN
+    return [ads[i % len(ads)] for i in range(count)]
+
+
+def measure(func, repeat: int = 5) -> float:
+    """Beste Laufzeit (Sekunden) aus repeat Durchläufen"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_reference_module(rev: str, relpath: str, name: str):
+    """Lädt einen älteren Stand eines Moduls aus Git als eigenständiges Modul
+    
+    Args:
+        rev: Git-Revision (z.B. Commit-Hash oder Tag)
+        relpath: Pfad relativ zum Repository (z.B. "data/bewerbungs_firma.py")
+        name: Modulname, unter dem der alte Stand geladen wird
+    """
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{relpath}"],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    
+    tmp = Path(tempfile.mkdtemp(prefix="bench_ref_")) / f"{name}.py"
+    tmp.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(name, tmp)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
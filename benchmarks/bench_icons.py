@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Icons im Lebenslauf
+==============================
+Rendert denselben Lebenslauf mehrfach und vergleicht die Zeit pro PDF:
+
+- ohne Cache:   jedes Dokument lädt und parst alle SVG-Icons neu
+- mit Cache:    geteilter Bild-Cache, jedes SVG wird einmal pro Prozess geparst
+- PNG-Raster:   Icons vorab als PNG gerastert (nur mit cairosvg)
+
+Benötigt ein funktionierendes WeasyPrint.
+
+Verwendung:
+  python3 benchmarks/bench_icons.py
+  python3 benchmarks/bench_icons.py --renders 20 --dpi 200
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+from _common import measure
+
+import generator
+
+
+def lebenslauf_html() -> str:
+    """HTML des Lebenslaufs ohne LLM (Kurse per Keyword-Fallback)"""
+    context = generator.ApplicationContext()
+    context.bewerbung = generator.get_bewerbung(context)
+    return generator.build_lebenslauf(context).html
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für den Icon-Cache beim Rendern")
+    parser.add_argument("--renders", type=int, default=10, help="Lebensläufe pro Durchlauf")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen (bester Wert zählt)")
+    parser.add_argument("--dpi", type=int, default=300, help="Auflösung der gerasterten Icons")
+    args = parser.parse_args()
+    
+    try:
+        import weasyprint  # noqa: F401
+    except (ImportError, OSError) as e:
+        print(f"❌ WeasyPrint nicht verfügbar: {e}")
+        return 1
+    
+    html = lebenslauf_html()
+    bilder = len(generator._local_assets(html, generator.BASE_DIR))
+    ziel = Path(tempfile.mkdtemp(prefix="bench_icons_")) / "Lebenslauf.pdf"
+    
+    def rendern(mit_cache: bool):
+        def lauf():
+            for _ in range(args.renders):
+                if not mit_cache:
+                    generator._IMAGE_CACHE.clear()
+                    generator._IMAGE_MTIMES.clear()
+                generator.render_pdf(html, ziel)
+        return lauf
+    
+    # Stylesheet und Schriften vorab laden, damit nur die Bilder den Unterschied machen
+    generator.render_pdf(html, ziel)
+    if not generator._IMAGE_MTIMES:
+        print(f"❌ Bilder kamen nicht über den url_fetcher ({generator.get_url_fetcher()!r})")
+        return 1
+    
+    print(f"📊 Lebenslauf rendern - {args.renders} PDFs, {bilder} Bilder, best of {args.repeat}")
+    ergebnisse = {}
+    
+    generator.configure_icons(None)
+    ergebnisse["ohne Cache"] = measure(rendern(False), args.repeat)
+    ergebnisse["mit Cache"] = measure(rendern(True), args.repeat)
+    
+    generator.configure_icons(args.dpi)
+    generator.render_pdf(html, ziel)  # PNGs erzeugen
+    if any(k[0].endswith(f"@{args.dpi}dpi.png") for k in generator._ASSET_CACHE):
+        ergebnisse[f"PNG-Raster ({args.dpi} dpi)"] = measure(rendern(True), args.repeat)
+    generator.configure_icons(None)
+    
+    basis = ergebnisse["ohne Cache"]
+    for name, dauer in ergebnisse.items():
+        pro_pdf = dauer / args.renders * 1000
+        print(f"   {name:<22} {pro_pdf:8.1f} ms/PDF   ×{basis / dauer:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RegexExtractor-Durchsatz
+===================================
+Misst Anzeigen/s für RegexExtractor.extract_all und (mit --ref) den
+Vergleich zu einem älteren Stand inkl. Prüfung auf identische Ergebnisse.
+
+Verwendung:
+  python3 benchmarks/bench_regex_extractor.py
+  python3 benchmarks/bench_regex_extractor.py --ref <commit>   # Vorher/Nachher
+"""
+
+import argparse
+from dataclasses import asdict
+
+from _common import load_ads, measure, load_reference_module
+
+from data.bewerbungs_firma import RegexExtractor
+
+
+def throughput(func, ads: list, repeat: int) -> float:
+    """Anzeigen pro Sekunde (bester Durchlauf)"""
+    zeit = measure(lambda: [func(ad) for ad in ads], repeat)
+    return len(ads) / zeit
+
+
+def report(name: str, neu: float, alt: float = None):
+    """Gibt eine Zeile Vorher/Nachher aus"""
+    if alt is None:
+        print(f"   {name:<22} {neu:10.1f} Anzeigen/s")
+    else:
+        print(f"   {name:<22} vorher {alt:10.1f}  nachher {neu:10.1f} Anzeigen/s  (×{neu / alt:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für RegexExtractor")
+    parser.add_argument("--ads", type=int, default=200, help="Anzahl Anzeigen pro Durchlauf")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen (bester Wert zählt)")
+    parser.add_argument("--ref", type=str, help="Git-Revision für Vorher/Nachher-Vergleich")
+    args = parser.parse_args()
+    
+    ads = load_ads(args.ads)
+    aktuell = RegexExtractor()
+    
+    print(f"📊 RegexExtractor - {len(ads)} Anzeigen, best of {args.repeat}")
+    
+    referenz = None
+    if args.ref:
+        ref_module = load_reference_module(args.ref, "data/bewerbungs_firma.py", "bewerbungs_firma_ref")
+        referenz = ref_module.RegexExtractor()
+        
+        # Ergebnisse müssen identisch sein (Analysezeitpunkt ausgenommen)
+        for ad in set(ads):
+            alt_result = asdict(referenz.extract_all(ad))
+            neu_result = asdict(aktuell.extract_all(ad))
+            alt_result.pop("analysiert_am")
+            neu_result.pop("analysiert_am")
+            assert alt_result == neu_result, "Ergebnisse weichen vom Referenzstand ab!"
+        print(f"   ✅ Ergebnisse identisch mit {args.ref}")
+    
+    # Gesamte Extraktion und nur die Keyword-Stufe
+    for name, methode in (("extract_all", "extract_all"), ("_extract_requirements", "_extract_requirements")):
+        neu = throughput(getattr(aktuell, methode), ads, args.repeat)
+        alt = throughput(getattr(referenz, methode), ads, args.repeat) if referenz else None
+        report(name, neu, alt)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SkillMatcher-Lookup
+==============================
+Vergleicht SkillMatcher._find_match (Synonym-Index, N-Gramm-Index) mit der
+bisherigen linearen Suche über alle Skills sowie match() pro Anzeige mit
+match_many() für alle Anzeigen auf einmal (NumPy):
+
+- Eigenschaftstest: zufällige Anforderungen (eigene Skills, Synonyme,
+  Teilstrings, Kombinationen, Zufallstexte) müssen denselben Skill liefern
+- Zeit pro Anzeige für match() und match_many() mit den Anforderungen der
+  Beispielanzeigen (Ergebnisse müssen identisch sein)
+
+Verwendung:
+  python3 benchmarks/bench_skill_matcher.py
+  python3 benchmarks/bench_skill_matcher.py --cases 50000 --seed 7
+"""
+
+import sys
+import random
+import string
+import argparse
+from dataclasses import asdict
+
+from _common import load_ads, measure
+
+from data.bewerbungs_firma import RegexExtractor, SkillMatcher
+
+
+def find_match_linear(self, anforderung: str):
+    """Bisherige Implementierung von SkillMatcher._find_match (Referenz)"""
+    anforderung_clean = anforderung.strip().lower()
+    
+    if anforderung_clean in self.meine_skills:
+        return self.meine_skills[anforderung_clean]
+    
+    for haupt_skill, synonyme in self.SYNONYME.items():
+        if anforderung_clean in synonyme or anforderung_clean == haupt_skill:
+            if haupt_skill in self.meine_skills:
+                return self.meine_skills[haupt_skill]
+            for syn in synonyme:
+                if syn in self.meine_skills:
+                    return self.meine_skills[syn]
+    
+    for skill_key, skill_data in self.meine_skills.items():
+        if anforderung_clean in skill_key or skill_key in anforderung_clean:
+            return skill_data
+    
+    return None
+
+
+class LinearMatcher(SkillMatcher):
+    """SkillMatcher mit der linearen Suche"""
+    _find_match = find_match_linear
+
+
+def zufalls_anforderungen(matcher: SkillMatcher, anzahl: int, seed: int) -> list:
+    """Erzeugt Anforderungen, die alle Zweige von _find_match treffen"""
+    rnd = random.Random(seed)
+    keys = list(matcher.meine_skills)
+    aliase = [alias for haupt, syns in SkillMatcher.SYNONYME.items() for alias in (haupt, *syns)]
+    woerter = ["erfahrung", "mit", "kenntnisse", "in", "und", "sehr gute", "api", "design", "(m/w/d)"]
+    
+    def teilstring(text: str) -> str:
+        i = rnd.randrange(len(text) + 1)
+        return text[i:rnd.randrange(i, len(text) + 1)]
+    
+    erzeuger = [
+        lambda: rnd.choice(keys),
+        lambda: rnd.choice(aliase),
+        lambda: teilstring(rnd.choice(keys)),
+        lambda: teilstring(rnd.choice(aliase)),
+        lambda: f"{rnd.choice(woerter)} {rnd.choice(keys)} {rnd.choice(woerter)}",
+        lambda: " ".join(rnd.sample(keys, 2)),
+        lambda: "".join(rnd.choices(string.ascii_lowercase + " ./#+", k=rnd.randrange(7))),
+        lambda: f"  {rnd.choice(keys).upper()} ",
+    ]
+    return [rnd.choice(erzeuger)() for _ in range(anzahl)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für den SkillMatcher-Index")
+    parser.add_argument("--ads", type=int, default=200, help="Anzahl Anzeigen pro Durchlauf")
+    parser.add_argument("--cases", type=int, default=20000, help="Zufällige Anforderungen für den Eigenschaftstest")
+    parser.add_argument("--seed", type=int, default=42, help="Startwert für die Zufallsanforderungen")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen (bester Wert zählt)")
+    args = parser.parse_args()
+    
+    aktuell = SkillMatcher()
+    referenz = LinearMatcher()
+    
+    # Eigenschaftstest: gleicher Skill (dasselbe Objekt aus meine_skills) für jede Anforderung
+    faelle = zufalls_anforderungen(aktuell, args.cases, args.seed)
+    for anforderung in faelle:
+        neu = aktuell._find_match(anforderung)
+        alt = find_match_linear(aktuell, anforderung)
+        if neu is not alt:
+            print(f"❌ Abweichung bei {anforderung!r}: {alt} != {neu}")
+            return 1
+    print(f"✅ {len(faelle)} zufällige Anforderungen identisch (seed {args.seed})")
+    
+    extractor = RegexExtractor()
+    anforderungen = [extractor.extract_all(ad).anforderungen for ad in load_ads(args.ads)]
+    for a, stapel in zip(anforderungen, aktuell.match_many(anforderungen)):
+        assert asdict(aktuell.match(a)) == asdict(referenz.match(a)) == asdict(stapel), "Matching weicht ab!"
+    
+    anzahl = sum(len(a.must_have) + len(a.nice_to_have) + len(a.soft_skills) for a in anforderungen)
+    print(f"📊 SkillMatcher.match - {len(anforderungen)} Anzeigen, "
+          f"{anzahl / len(anforderungen):.1f} Anforderungen/Anzeige, {len(aktuell.meine_skills)} Skills, "
+          f"best of {args.repeat}")
+    
+    laeufe = {
+        "linear": lambda: [referenz.match(a) for a in anforderungen],
+        "Index": lambda: [aktuell.match(a) for a in anforderungen],
+        "match_many": lambda: aktuell.match_many(anforderungen),
+    }
+    basis = None
+    for name, lauf in laeufe.items():
+        dauer = measure(lauf, args.repeat)
+        basis = basis or dauer
+        print(f"   {name:<12} {dauer / len(anforderungen) * 1e6:8.1f} µs/Anzeige   ×{basis / dauer:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
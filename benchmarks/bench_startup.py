@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Startzeit von generator.py
+=====================================
+Misst, was schon der Import von generator.py bzw. ein `--help` kostet, und
+listet über `python -X importtime` die teuersten Importe auf. Mit --ref wird
+ein älterer Stand des Repositorys in ein temporäres Verzeichnis exportiert
+und zum Vergleich gemessen.
+
+Verwendung:
+  python3 benchmarks/bench_startup.py
+  python3 benchmarks/bench_startup.py --ref <commit>   # Vorher/Nachher
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+from _common import BASE_DIR, DATA_DIR
+
+
+def export_tree(rev: str) -> Path:
+    """Exportiert einen Git-Stand nach /tmp (inkl. lokaler Daten und Analysen)"""
+    ziel = Path(tempfile.mkdtemp(prefix="bench_startup_"))
+    archiv = subprocess.run(
+        ["git", "archive", rev], cwd=BASE_DIR, capture_output=True, check=True
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", str(ziel)], input=archiv, check=True)
+    
+    # Generierte persönliche Daten liegen nicht in Git
+    daten = DATA_DIR / "persoenliche_daten.py"
+    if daten.exists():
+        shutil.copy2(daten, ziel / "data" / daten.name)
+    # Gleiche Analysen wie der aktuelle Stand (ältere Stände lesen sie beim Import)
+    if (BASE_DIR / "output").exists():
+        (ziel / "output").symlink_to(BASE_DIR / "output")
+    return ziel
+
+
+def run_python(tree: Path, args: list) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=tree, capture_output=True, text=True)
+
+
+def wall_time(tree: Path, args: list, repeat: int) -> float:
+    """Beste Laufzeit (Sekunden) eines Python-Aufrufs; inf bei Fehler"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if run_python(tree, args).returncode != 0:
+            return float("inf")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def import_profile(tree: Path) -> list:
+    """Direkte Importe von generator.py als (Modul, kumulierte µs), teuerste zuerst"""
+    proc = run_python(tree, ["-X", "importtime", "-c", "import generator"])
+    if proc.returncode != 0:
+        fehler = proc.stderr.strip().splitlines()
+        raise RuntimeError(fehler[-1] if fehler else "Import fehlgeschlagen")
+    
+    # Format: "import time: <self> | <kumuliert> | <Einrückung><Modul>"
+    eintraege = []
+    for zeile in proc.stderr.splitlines():
+        if not zeile.startswith("import time:") or "cumulative" in zeile:
+            continue
+        _, kumuliert, modul = zeile[len("import time:"):].split("|")
+        tiefe = len(modul) - len(modul.lstrip())
+        eintraege.append((tiefe, modul.strip(), int(kumuliert)))
+    
+    # Alles, was generator selbst importiert, steht eine Ebene tiefer davor
+    basis = next(t for t, m, _ in eintraege if m == "generator")
+    return sorted(
+        [(m, us) for t, m, us in eintraege if t == basis + 2 or m == "generator"],
+        key=lambda e: -e[1]
+    )
+
+
+def report(name: str, tree: Path, repeat: int, top: int) -> float:
+    print(f"\n📦 {name}")
+    import_zeit = wall_time(tree, ["-c", "import generator"], repeat)
+    help_zeit = wall_time(tree, ["generator.py", "--help"], repeat)
+    interpreter = wall_time(tree, ["-c", "pass"], repeat)
+    
+    if import_zeit == float("inf"):
+        print("   ❌ Import fehlgeschlagen")
+    else:
+        print(f"   import generator     {import_zeit * 1000:8.1f} ms  (Interpreter allein {interpreter * 1000:.1f} ms)")
+    if help_zeit != float("inf"):
+        print(f"   generator.py --help  {help_zeit * 1000:8.1f} ms")
+    
+    try:
+        profil = import_profile(tree)
+    except RuntimeError as e:
+        print(f"   ⚠️  -X importtime nicht möglich: {e}")
+        return import_zeit
+    
+    print(f"   Teuerste Importe (-X importtime, kumuliert):")
+    for modul, us in profil[:top]:
+        print(f"      {modul:<28} {us / 1000:8.1f} ms")
+    return import_zeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für die Startzeit von generator.py")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen (bester Wert zählt)")
+    parser.add_argument("--top", type=int, default=8, help="Anzahl angezeigter Importe")
+    parser.add_argument("--ref", type=str, help="Git-Revision für Vorher/Nachher-Vergleich")
+    args = parser.parse_args()
+    
+    print(f"📊 Startzeit generator.py - best of {args.repeat}")
+    
+    alt = None
+    if args.ref:
+        ref_tree = export_tree(args.ref)
+        try:
+            alt = report(f"Referenz {args.ref}", ref_tree, args.repeat, args.top)
+        finally:
+            shutil.rmtree(ref_tree, ignore_errors=True)
+    
+    neu = report("Aktueller Stand", BASE_DIR, args.repeat, args.top)
+    
+    if alt and neu != float("inf") and alt != float("inf"):
+        print(f"\n   import generator: ×{alt / neu:.2f} schneller")
+
+
+if __name__ == "__main__":
+    main()
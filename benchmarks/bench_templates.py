@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Template-Rendering
+=============================
+Vergleicht die kompilierte Template-Engine (template_engine.py) mit dem
+bisherigen Ansatz - ein str.replace pro Platzhalter - auf den echten
+Templates. Prüft vorher, dass beide bei unkritischen Werten identisches
+HTML liefern.
+
+Verwendung:
+  python3 benchmarks/bench_templates.py
+  python3 benchmarks/bench_templates.py --renders 5000
+"""
+
+import argparse
+
+from _common import BASE_DIR, measure
+
+from template_engine import PLACEHOLDER_RE, RawHTML, load_template
+
+TEMPLATES = ["anschreiben.html", "lebenslauf.html"]
+
+# Platzhalter mit fertig aufgebautem HTML (groß, nicht escaped)
+RAW_SUFFIXES = ("_entries", "_tags", "_skills", "_links", "_text")
+
+
+def beispielwerte(source: str) -> dict:
+    """Realistisch große Werte für alle Platzhalter eines Templates"""
+    werte = {}
+    for name in set(PLACEHOLDER_RE.findall(source)):
+        if name.endswith(RAW_SUFFIXES):
+            werte[name] = RawHTML(f'<div class="cv-entry"><span>{name}</span></div>\n' * 20)
+        else:
+            werte[name] = f"Beispiel {name}"
+    return werte
+
+
+def render_replace(source: str, werte: dict) -> str:
+    """Bisheriger Ansatz: eine Kopie des Templates pro Platzhalter"""
+    html_content = source
+    for placeholder, value in werte.items():
+        html_content = html_content.replace(f"{{{placeholder}}}", value)
+    return html_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark für die Template-Engine")
+    parser.add_argument("--renders", type=int, default=2000, help="Renderings pro Durchlauf")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen (bester Wert zählt)")
+    args = parser.parse_args()
+    
+    print(f"📊 Template-Rendering - {args.renders} Renderings, best of {args.repeat}")
+    
+    for name in TEMPLATES:
+        source = (BASE_DIR / "templates" / name).read_text(encoding="utf-8")
+        template = load_template(name)
+        werte = beispielwerte(source)
+        
+        assert template.render(werte) == render_replace(source, werte), \
+            f"{name}: Ergebnis weicht von str.replace ab!"
+        
+        alt = measure(lambda: [render_replace(source, werte) for _ in range(args.renders)], args.repeat)
+        neu = measure(lambda: [template.render(werte) for _ in range(args.renders)], args.repeat)
+        
+        print(f"\n📄 {name} ({len(source) / 1024:.1f} KB, {len(template.placeholders)} Platzhalter)")
+        print(f"   str.replace-Kette  {alt / args.renders * 1e6:8.1f} µs/Rendering")
+        print(f"   Template.render    {neu / args.renders * 1e6:8.1f} µs/Rendering  (×{alt / neu:.2f})")
+    
+    # Laden: einmal kompiliert, danach nur noch stat() + Cache-Treffer
+    alt = measure(lambda: [(BASE_DIR / "templates" / n).read_text(encoding="utf-8")
+                           for _ in range(args.renders) for n in TEMPLATES], args.repeat)
+    neu = measure(lambda: [load_template(n) for _ in range(args.renders) for n in TEMPLATES], args.repeat)
+    print(f"\n📂 Template laden")
+    print(f"   Datei lesen        {alt / args.renders * 1e6:8.1f} µs/Lauf")
+    print(f"   load_template      {neu / args.renders * 1e6:8.1f} µs/Lauf  (×{alt / neu:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Bewerbungsmappe als eine PDF-Datei
+==================================
+Fügt Anschreiben, Lebenslauf und Zertifikate zu einem PDF zusammen, wie es
+viele Bewerbungsportale verlangen. Die Seiten werden auf Objektebene
+übernommen (nichts wird neu gerendert); identische Schriften und Bilder -
+z.B. das Profilbild in Anschreiben und Lebenslauf - werden nur einmal
+gespeichert. Jedes Dokument bekommt ein eigenes Lesezeichen.
+
+Benötigt PyPDF2 (optional).
+
+Verwendung:
+  python3 bundle_pdf.py Bewerbung.pdf Anschreiben.pdf Lebenslauf.pdf zertifikat1.pdf ...
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Optional
+
+from optimize_pdf import PDF_SUPPORT, dedupe_resources
+
+if PDF_SUPPORT:
+    from PyPDF2 import PdfReader, PdfWriter
+
+
+@dataclass
+class BundleErgebnis:
+    """Ergebnis des Zusammenfügens"""
+    path: Path
+    dokumente: int = 0
+    seiten: int = 0
+    groesse: int = 0                # Bytes der Mappe
+    summe_einzeln: int = 0          # Bytes aller Einzeldateien zusammen
+    geteilt: int = 0                # Zusammengefasste Schriften/Bilder
+    dauer: float = 0.0
+    uebersprungen: list = field(default_factory=list)
+    
+    def __str__(self) -> str:
+        return (f"{self.path.name}: {self.dokumente} Dokumente, {self.seiten} Seiten, "
+                f"{self.groesse / 1024:.1f} KB (einzeln {self.summe_einzeln / 1024:.1f} KB, "
+                f"{self.geteilt} Ressourcen geteilt) in {self.dauer * 1000:.0f} ms")
+
+
+def _open_pdf(path: Path) -> "PdfReader":
+    """Öffnet ein PDF; ohne Passwort verschlüsselte Dateien werden entsperrt"""
+    reader = PdfReader(path)
+    if reader.is_encrypted and not reader.decrypt(""):
+        raise ValueError("passwortgeschützt")
+    return reader
+
+
+def bundle_pdfs(pdfs: list, output_path: Path, titel: Optional[list] = None) -> Optional[BundleErgebnis]:
+    """
+    Fügt PDFs seitenweise zu einer Datei zusammen.
+    
+    Args:
+        pdfs: PDF-Dateien in der gewünschten Reihenfolge
+        output_path: Zieldatei der Mappe
+        titel: Lesezeichen pro Dokument (Standard: Dateiname ohne Endung)
+    
+    Returns:
+        BundleErgebnis, None ohne PyPDF2
+    """
+    if not PDF_SUPPORT:
+        return None
+    
+    start = time.perf_counter()
+    output_path = Path(output_path)
+    ergebnis = BundleErgebnis(output_path)
+    titel = titel or [Path(pdf).stem for pdf in pdfs]
+    
+    # Erst alle lesen und Ressourcen über alle Dateien hinweg zusammenfassen
+    geoeffnet = []
+    erste = {}
+    for pdf, name in zip(pdfs, titel):
+        try:
+            reader = _open_pdf(Path(pdf))
+            ergebnis.geteilt += dedupe_resources(reader, erste)
+        except Exception as e:
+            print(f"⚠️  {Path(pdf).name} übersprungen: {e}")
+            ergebnis.uebersprungen.append(Path(pdf))
+            continue
+        geoeffnet.append((Path(pdf), name, reader))
+    
+    writer = PdfWriter()
+    for pdf, name, reader in geoeffnet:
+        writer.append(reader, outline_item=name)
+        ergebnis.dokumente += 1
+        ergebnis.seiten += len(reader.pages)
+        ergebnis.summe_einzeln += pdf.stat().st_size
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    os.replace(tmp_path, output_path)
+    
+    ergebnis.groesse = output_path.stat().st_size
+    ergebnis.dauer = time.perf_counter() - start
+    return ergebnis
+
+
+def main():
+    if not PDF_SUPPORT:
+        print("❌ PyPDF2 nicht installiert (pip install PyPDF2)")
+        return 1
+    
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        return 1
+    
+    output_path, *pdfs = [Path(arg) for arg in sys.argv[1:]]
+    fehlend = [pdf for pdf in pdfs if not pdf.exists()]
+    for pdf in fehlend:
+        print(f"❌ Datei nicht gefunden: {pdf}")
+    
+    ergebnis = bundle_pdfs([pdf for pdf in pdfs if pdf.exists()], output_path)
+    print(f"📎 {ergebnis}")
+    return 0 if not fehlend and not ergebnis.uebersprungen else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,23 @@ Autor: Marcus Moser
 Datum: 04.02.2026
 """
 
+import os
 import re
+import sys
 import json
+import time
+import queue
+import socket
+import hashlib
+import sqlite3
+import threading
 import subprocess
+import http.client
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
+from urllib.parse import urlsplit
 from dataclasses import dataclass, field, asdict
 
 # Importiere persönliche Skills für Matching
@@ -116,91 +127,693 @@ class BewerbungsFirma:
 # OLLAMA LLM INTEGRATION
 # ============================================================================
 
+# Standard-Adresse des lokalen Ollama-Servers (überschreibbar via OLLAMA_HOST)
+OLLAMA_DEFAULT_HOST = "http://127.0.0.1:11434"
+
+# Fehler, bei denen auf die CLI zurückgefallen wird
+_HTTP_ERRORS = (OSError, http.client.HTTPException, ValueError)
+
+# Server erreichbar, aber zu langsam: die CLI fragt denselben Server und hilft
+# nicht (zweiter Versuch mit dem vollen Timeout) - kein Fallback
+_HTTP_TIMEOUT = socket.timeout
+
+
+class OllamaHTTPBackend:
+    """Keep-Alive-Verbindungspool zur lokalen Ollama REST-API"""
+    
+    def __init__(self, host: str = OLLAMA_DEFAULT_HOST, pool_size: int = 4):
+        if "://" not in host:
+            host = f"http://{host}"
+        url = urlsplit(host)
+        self.host = url.hostname or "127.0.0.1"
+        self.port = url.port or 11434
+        self.base_path = url.path.rstrip("/")
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+    
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+    
+    def _acquire(self, timeout: float) -> http.client.HTTPConnection:
+        """Holt eine offene Verbindung aus dem Pool oder baut eine neue auf"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock:
+            conn.sock.settimeout(timeout)
+        return conn
+    
+    def _release(self, conn: http.client.HTTPConnection):
+        """Gibt eine Verbindung für Keep-Alive an den Pool zurück"""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    def _send(self, method: str, path: str, payload: Optional[dict], timeout: float) -> tuple:
+        """Sendet eine Anfrage und liefert (Verbindung, Antwort) mit ungelesenem Body"""
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body else {}
+        
+        # Zweiter Versuch mit frischer Verbindung, falls der Server eine
+        # Keep-Alive-Verbindung inzwischen geschlossen hat
+        for attempt in range(2):
+            conn = self._acquire(timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except _HTTP_ERRORS:
+                conn.close()
+                raise
+    
+    def _finish(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse):
+        """Gibt eine vollständig gelesene Verbindung zurück oder schließt sie"""
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+    
+    def request(self, method: str, path: str, payload: Optional[dict] = None, timeout: float = 300) -> dict:
+        """Führt eine JSON-Anfrage aus und gibt die dekodierte Antwort zurück"""
+        conn, response = self._send(method, path, payload, timeout)
+        try:
+            data = response.read()
+        except _HTTP_ERRORS:
+            conn.close()
+            raise
+        self._finish(conn, response)
+        
+        if response.status != 200:
+            raise http.client.HTTPException(
+                f"HTTP {response.status} für {path}: {data[:200].decode('utf-8', 'replace')}"
+            )
+        return json.loads(data)
+    
+    def stream(self, path: str, payload: dict, timeout: float = 300) -> Iterator[dict]:
+        """Führt eine Streaming-Anfrage aus und liefert die NDJSON-Objekte einzeln"""
+        conn, response = self._send("POST", path, payload, timeout)
+        complete = False
+        try:
+            if response.status != 200:
+                raise http.client.HTTPException(f"HTTP {response.status} für {path}")
+            for line in response:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            # Ohne Chunked-Encoding schließt erst read() die Antwort ab (sonst nicht wiederverwendbar)
+            response.read()
+            complete = True
+        finally:
+            # Abgebrochene Streams nicht wiederverwenden (ungelesene Daten)
+            if complete:
+                self._finish(conn, response)
+            else:
+                conn.close()
+
+
+# Prozessweit geteilte Verbindungspools: host -> OllamaHTTPBackend
+_HTTP_BACKENDS = {}
+
+# Geforkte Worker (Batch) dürfen die Keep-Alive-Sockets des Elternprozesses nicht mitbenutzen
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_HTTP_BACKENDS.clear)
+
+
+def get_http_backend(host: Optional[str] = None) -> OllamaHTTPBackend:
+    """Liefert den geteilten Verbindungspool für einen Ollama-Host"""
+    host = host or os.environ.get("OLLAMA_HOST") or OLLAMA_DEFAULT_HOST
+    backend = _HTTP_BACKENDS.get(host)
+    if backend is None:
+        backend = _HTTP_BACKENDS.setdefault(host, OllamaHTTPBackend(host))
+    return backend
+
+
+@dataclass
+class LLMMetriken:
+    """Laufzeit-Kennzahlen einer LLM-Abfrage"""
+    modell: str
+    backend: str
+    ttft: Optional[float] = None   # Sekunden bis zum ersten Token
+    dauer: float = 0.0             # Gesamtlatenz in Sekunden
+    tokens: int = 0
+    tokens_pro_s: float = 0.0
+    
+    def __str__(self) -> str:
+        if self.backend == "cache":
+            return f"Cache-Treffer · Gesamt {self.dauer * 1000:.1f}ms ({self.tokens} Tokens)"
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "-"
+        return (f"TTFT {ttft} · {self.tokens_pro_s:.1f} Tokens/s · "
+                f"Gesamt {self.dauer:.2f}s ({self.tokens} Tokens, {self.backend})")
+
+
+def _build_metriken(modell: str, backend: str, start: float, ttft: Optional[float],
+                    tokens: int, final: Optional[dict] = None) -> LLMMetriken:
+    """Berechnet Metriken; nutzt Ollamas eigene Zählung (eval_count) falls vorhanden"""
+    final = final or {}
+    dauer = time.perf_counter() - start
+    tokens = final.get("eval_count") or tokens
+    
+    eval_duration = final.get("eval_duration")
+    if eval_duration:
+        tokens_pro_s = tokens / (eval_duration / 1e9)
+    else:
+        generierung = dauer - (ttft or 0)
+        tokens_pro_s = tokens / generierung if generierung > 0 else 0.0
+    
+    return LLMMetriken(
+        modell=modell, backend=backend, ttft=ttft, dauer=dauer,
+        tokens=tokens, tokens_pro_s=tokens_pro_s
+    )
+
+
+# ============================================================================
+# LLM-ANTWORT-CACHE
+# ============================================================================
+
+LLM_CACHE_PATH = Path(__file__).parent.parent / "output" / "cache" / "llm_cache.sqlite3"
+
+
+class LLMCache:
+    """Persistenter Cache für LLM-Antworten (SQLite)
+    
+    Schlüssel ist ein Hash über (Modell, System-Prompt, Prompt, Temperatur).
+    Einträge verfallen nach TTL Sekunden; überschreitet der Cache MAX_BYTES,
+    werden die am längsten nicht genutzten Einträge entfernt (LRU).
+    """
+    
+    TTL = 30 * 24 * 3600          # 30 Tage
+    MAX_BYTES = 50 * 1024 * 1024  # 50 MB Antworttext
+    
+    def __init__(self, path: Path = LLM_CACHE_PATH, ttl: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.path = Path(path)
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT, response TEXT,"
+            " size INTEGER, created REAL, last_access REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+        self._db.commit()
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: Optional[str], prompt: str, temperature: float) -> str:
+        """Inhaltsbasierter Schlüssel einer Abfrage"""
+        raw = json.dumps([model, system_prompt or "", prompt, round(float(temperature), 4)], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Liefert die gecachte Antwort oder None (abgelaufene Einträge zählen nicht)"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._db.commit()
+        return row[0]
+    
+    def put(self, key: str, model: str, response: str):
+        """Speichert eine Antwort und räumt abgelaufene/überzählige Einträge auf"""
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._evict(now)
+            self._db.commit()
+    
+    def _evict(self, now: float):
+        """Entfernt abgelaufene Einträge und danach LRU bis unter max_bytes"""
+        self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        to_delete = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+    
+    def clear(self):
+        """Leert den Cache vollständig"""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+
+# Prozessweite Cache-Einstellungen (gesetzt über configure_llm_cache)
+_llm_cache_config = {"enabled": True, "refresh": False, "path": LLM_CACHE_PATH}
+_llm_cache_instance = None
+
+
+def configure_llm_cache(enabled: bool = True, refresh: bool = False, path: Optional[Path] = None):
+    """Setzt das Cache-Verhalten für alle OllamaClients (z.B. aus --no-cache/--refresh-cache)
+    
+    Args:
+        enabled: False deaktiviert Lesen und Schreiben komplett
+        refresh: True ignoriert vorhandene Einträge, speichert aber neue Antworten
+        path: Alternativer Speicherort der Cache-Datei
+    """
+    global _llm_cache_instance
+    _llm_cache_config["enabled"] = enabled
+    _llm_cache_config["refresh"] = refresh
+    if path is not None and Path(path) != _llm_cache_config["path"]:
+        _llm_cache_config["path"] = Path(path)
+        _llm_cache_instance = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Liefert den geteilten Cache oder None wenn deaktiviert/nicht nutzbar"""
+    global _llm_cache_instance
+    if not _llm_cache_config["enabled"]:
+        return None
+    if _llm_cache_instance is None:
+        try:
+            _llm_cache_instance = LLMCache(_llm_cache_config["path"])
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  LLM-Cache nicht nutzbar ({e}) - fahre ohne Cache fort")
+            _llm_cache_config["enabled"] = False
+            return None
+    return _llm_cache_instance
+
+
+# ============================================================================
+# OLLAMA CLIENT
+# ============================================================================
+
+# Gecachte Modellliste pro Host: address -> (zeitpunkt, modelle, backend)
+_MODEL_LIST_CACHE = {}
+
+
 class OllamaClient:
-    """Client für lokales Ollama LLM"""
+    """Client für lokales Ollama LLM
+    
+    Nutzt bevorzugt die REST-API (Keep-Alive-Verbindung, Modell bleibt
+    geladen) und fällt auf `ollama run` zurück, wenn der Server nicht
+    per HTTP erreichbar ist.
+    """
     
     DEFAULT_MODEL = "mistral:7b"  # Bessere deutsche Grammatik
     FALLBACK_MODELS = ["llama3.2:3b", "mistral", "llama3.1:8b", "gemma2:9b"]
     
-    def __init__(self, model: Optional[str] = None):
+    KEEP_ALIVE = "30m"      # Modell bleibt zwischen Abfragen im Speicher
+    MODEL_LIST_TTL = 300    # Sekunden, bis die Modellliste neu abgefragt wird
+    TIMEOUT = 300           # 5 Minuten - erhöht von 180s für längere Stellenanzeigen
+    
+    def __init__(self, model: Optional[str] = None, host: Optional[str] = None, use_http: bool = True):
         self.model = model or self.DEFAULT_MODEL
         self._available = None
+        self._resolved_model = None
+        self._http = get_http_backend(host) if use_http else None
+        self.backend = None  # "http" oder "cli", gesetzt nach is_available()
+        self.metriken = []   # LLMMetriken jeder Abfrage (neueste zuletzt)
+    
+    def _installed_models(self) -> Optional[str]:
+        """Liefert die installierten Modelle (kleingeschrieben) oder None wenn Ollama fehlt"""
+        cache_key = self._http.address if self._http else "cli"
+        cached = _MODEL_LIST_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.MODEL_LIST_TTL:
+            self.backend = cached[2]
+            return cached[1]
+        
+        models, backend = None, None
+        
+        if self._http:
+            try:
+                data = self._http.request("GET", "/api/tags", timeout=2)
+                models = " ".join(m.get("name", "") for m in data.get("models", [])).lower()
+                backend = "http"
+            except _HTTP_ERRORS:
+                pass
+        
+        if models is None:
+            try:
+                result = subprocess.run(
+                    ["ollama", "list"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                if result.returncode == 0:
+                    models = result.stdout.lower()
+                    backend = "cli"
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                pass
+        
+        # Nur Erfolge cachen, damit ein später gestarteter Server erkannt wird
+        if models is not None:
+            _MODEL_LIST_CACHE[cache_key] = (time.monotonic(), models, backend)
+        self.backend = backend
+        return models
     
     def is_available(self) -> bool:
         """Prüft ob Ollama verfügbar ist"""
         if self._available is not None:
             return self._available
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            self._available = result.returncode == 0
-            return self._available
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self._available = False
-            return False
+        self._available = self._installed_models() is not None
+        return self._available
     
     def get_available_model(self) -> Optional[str]:
         """Findet ein verfügbares Modell"""
+        if self._resolved_model:
+            return self._resolved_model
         if not self.is_available():
             return None
         
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            installed_models = result.stdout.lower()
-            
-            # Prüfe bevorzugtes Modell
-            if self.model.split(":")[0] in installed_models:
-                return self.model
-            
-            # Prüfe Fallback-Modelle
-            for model in self.FALLBACK_MODELS:
-                if model.split(":")[0] in installed_models:
-                    return model
-            
-            return None
-        except Exception:
+        installed_models = self._installed_models()
+        if installed_models is None:
             return None
+        
+        # Prüfe bevorzugtes Modell
+        if self.model.split(":")[0] in installed_models:
+            self._resolved_model = self.model
+            return self._resolved_model
+        
+        # Prüfe Fallback-Modelle
+        for model in self.FALLBACK_MODELS:
+            if model.split(":")[0] in installed_models:
+                self._resolved_model = model
+                return self._resolved_model
+        
+        return None
+    
+    def _generate_payload(self, model: str, prompt: str, system_prompt: Optional[str], temperature: float) -> dict:
+        """Baut den Request-Body für /api/generate"""
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": self.KEEP_ALIVE,
+            "options": {"temperature": temperature},
+        }
+        if system_prompt:
+            payload["system"] = system_prompt
+        return payload
+    
+    def _cache_lookup(self, model: str, prompt: str, system_prompt: Optional[str], temperature: float) -> tuple:
+        """Liefert (cache, key, treffer); treffer ist None bei Cache-Miss"""
+        cache = get_llm_cache()
+        if cache is None:
+            return None, None, None
+        
+        key = LLMCache.make_key(model, system_prompt, prompt, temperature)
+        if _llm_cache_config["refresh"]:
+            return cache, key, None
+        
+        start = time.perf_counter()
+        try:
+            hit = cache.get(key)
+        except sqlite3.Error as e:
+            print(f"⚠️  LLM-Cache-Fehler: {e}")
+            return None, None, None
+        if hit is not None:
+            # Kein Modell beteiligt: keine TTFT und kein Durchsatz, nur die Dauer des Lookups
+            self.metriken.append(LLMMetriken(
+                modell=model, backend="cache", dauer=time.perf_counter() - start, tokens=len(hit.split())
+            ))
+        return cache, key, hit
+    
+    @staticmethod
+    def _cache_store(cache: Optional[LLMCache], key: Optional[str], model: str, response: Optional[str]):
+        """Speichert eine vollständige Antwort im Cache (Fehler werden nur gemeldet)"""
+        if cache is None or not response:
+            return
+        try:
+            cache.put(key, model, response)
+        except sqlite3.Error as e:
+            print(f"⚠️  LLM-Cache-Fehler: {e}")
     
     def query(self, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.3) -> Optional[str]:
-        """Führt eine LLM-Abfrage aus"""
+        """Führt eine LLM-Abfrage aus (mit persistentem Antwort-Cache)"""
         model = self.get_available_model()
         if not model:
             return None
         
+        cache, key, hit = self._cache_lookup(model, prompt, system_prompt, temperature)
+        if hit is not None:
+            return hit
+        
+        response = self._query_uncached(model, prompt, system_prompt, temperature)
+        self._cache_store(cache, key, model, response)
+        return response
+    
+    def _query_uncached(self, model: str, prompt: str, system_prompt: Optional[str], temperature: float) -> Optional[str]:
+        """LLM-Abfrage ohne Cache (HTTP mit CLI-Fallback)"""
+        if self.backend == "http":
+            start = time.perf_counter()
+            try:
+                data = self._http.request(
+                    "POST", "/api/generate",
+                    self._generate_payload(model, prompt, system_prompt, temperature),
+                    timeout=self.TIMEOUT
+                )
+                # Ohne Streaming: TTFT = Laden des Modells + Prompt-Verarbeitung
+                ttft_ns = (data.get("load_duration") or 0) + (data.get("prompt_eval_duration") or 0)
+                self.metriken.append(_build_metriken(
+                    model, "http", start, ttft_ns / 1e9 if ttft_ns else None, 0, data
+                ))
+                return data.get("response", "").strip()
+            except _HTTP_TIMEOUT:
+                print(f"⚠️  Ollama-Timeout nach {self.TIMEOUT}s")
+                return None
+            except _HTTP_ERRORS as e:
+                print(f"⚠️  Ollama-HTTP-Fehler ({e}) - nutze CLI-Fallback")
+                self.backend = "cli"
+        
+        return self._query_cli(model, prompt, system_prompt)
+    
+    def stream(self, prompt: str, system_prompt: Optional[str] = None, temperature: float = 0.3) -> Iterator[str]:
+        """Liefert die Antwort des LLM stückweise, sobald sie erzeugt wird
+        
+        Die Metriken (TTFT, Tokens/s, Gesamtlatenz) stehen nach dem
+        vollständigen Durchlaufen in self.metriken[-1].
+        """
+        model = self.get_available_model()
+        if not model:
+            return
+        
+        # Cache-Treffer kommen als ein einziger Chunk
+        cache, key, hit = self._cache_lookup(model, prompt, system_prompt, temperature)
+        if hit is not None:
+            yield hit
+            return
+        
+        teile = []
+        complete = yield from self._stream_uncached(model, prompt, system_prompt, temperature, teile)
+        # Nur vollständig durchlaufene Streams landen im Cache
+        if complete:
+            self._cache_store(cache, key, model, "".join(teile).strip())
+    
+    def _stream_uncached(self, model: str, prompt: str, system_prompt: Optional[str],
+                         temperature: float, teile: list):
+        """Streaming ohne Cache (HTTP mit CLI-Fallback)
+        
+        Sammelt die Chunks zusätzlich in teile und gibt zurück, ob die
+        Antwort vollständig empfangen wurde.
+        """
+        if self.backend == "http":
+            payload = self._generate_payload(model, prompt, system_prompt, temperature)
+            payload["stream"] = True
+            start = time.perf_counter()
+            ttft, chunks, final = None, 0, None
+            try:
+                for obj in self._http.stream("/api/generate", payload, timeout=self.TIMEOUT):
+                    chunk = obj.get("response", "")
+                    if chunk:
+                        if ttft is None:
+                            ttft = time.perf_counter() - start
+                        chunks += 1
+                        teile.append(chunk)
+                        yield chunk
+                    if obj.get("done"):
+                        final = obj
+                return final is not None
+            except _HTTP_ERRORS as e:
+                # Nach den ersten Tokens ist kein Fallback mehr möglich
+                if chunks:
+                    print(f"\n⚠️  Stream abgebrochen: {e}")
+                    return False
+                if isinstance(e, _HTTP_TIMEOUT):
+                    print(f"⚠️  Ollama-Timeout nach {self.TIMEOUT}s")
+                    return False
+                print(f"⚠️  Ollama-HTTP-Fehler ({e}) - nutze CLI-Fallback")
+                self.backend = "cli"
+            finally:
+                if chunks or final:
+                    self.metriken.append(_build_metriken(model, "http", start, ttft, chunks, final))
+        
+        return (yield from self._stream_cli(model, prompt, system_prompt, teile))
+    
+    def chat(self, messages: list, temperature: float = 0.3) -> Optional[str]:
+        """Führt eine Chat-Abfrage aus (messages im Ollama-Format: role/content)"""
+        model = self.get_available_model()
+        if not model:
+            return None
+        
+        if self.backend == "http":
+            start = time.perf_counter()
+            try:
+                data = self._http.request(
+                    "POST", "/api/chat",
+                    {
+                        "model": model,
+                        "messages": messages,
+                        "stream": False,
+                        "keep_alive": self.KEEP_ALIVE,
+                        "options": {"temperature": temperature},
+                    },
+                    timeout=self.TIMEOUT
+                )
+                # Wie query(): TTFT = Laden des Modells + Prompt-Verarbeitung
+                ttft_ns = (data.get("load_duration") or 0) + (data.get("prompt_eval_duration") or 0)
+                self.metriken.append(_build_metriken(
+                    model, "http", start, ttft_ns / 1e9 if ttft_ns else None, 0, data
+                ))
+                return data.get("message", {}).get("content", "").strip()
+            except _HTTP_TIMEOUT:
+                print(f"⚠️  Ollama-Timeout nach {self.TIMEOUT}s")
+                return None
+            except _HTTP_ERRORS as e:
+                print(f"⚠️  Ollama-HTTP-Fehler ({e}) - nutze CLI-Fallback")
+                self.backend = "cli"
+        
+        # CLI kennt keine Rollen - Verlauf als einzelnen Prompt übergeben
+        prompt = "\n\n".join(f"{m['role'].capitalize()}: {m['content']}" for m in messages)
+        return self._query_cli(model, prompt, None)
+    
+    def warmup(self) -> bool:
+        """Lädt das Modell vorab in den Speicher (nur HTTP-Backend)"""
+        model = self.get_available_model()
+        if not model or self.backend != "http":
+            return False
+        try:
+            self._http.request(
+                "POST", "/api/generate",
+                {"model": model, "stream": False, "keep_alive": self.KEEP_ALIVE},
+                timeout=self.TIMEOUT
+            )
+            return True
+        except _HTTP_ERRORS:
+            return False
+    
+    @staticmethod
+    def _cli_prompt(prompt: str, system_prompt: Optional[str]) -> str:
+        """Die CLI kennt kein System-Feld - als Präfix voranstellen"""
+        if system_prompt:
+            return f"System: {system_prompt}\n\nUser: {prompt}"
+        return prompt
+    
+    def _query_cli(self, model: str, prompt: str, system_prompt: Optional[str]) -> Optional[str]:
+        """Fallback: Abfrage über `ollama run` (ein Prozess pro Prompt)"""
+        start = time.perf_counter()
         try:
-            # Baue den Befehl
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"System: {system_prompt}\n\nUser: {prompt}"
-            
             result = subprocess.run(
-                ["ollama", "run", model, full_prompt],
+                ["ollama", "run", model, self._cli_prompt(prompt, system_prompt)],
                 capture_output=True,
                 text=True,
-                timeout=300  # 5 Minuten - erhöht von 180s für längere Stellenanzeigen
+                timeout=self.TIMEOUT
             )
             
             if result.returncode == 0:
+                # CLI liefert keine Token-Zählung - Wörter als Näherung
+                self.metriken.append(_build_metriken(
+                    model, "cli", start, None, len(result.stdout.split())
+                ))
                 return result.stdout.strip()
             return None
         except (subprocess.TimeoutExpired, Exception) as e:
             print(f"⚠️  LLM-Fehler: {e}")
             return None
+    
+    def _stream_cli(self, model: str, prompt: str, system_prompt: Optional[str], teile: list):
+        """Fallback: Streaming über die Ausgabe von `ollama run` (zeilenweise)"""
+        start = time.perf_counter()
+        try:
+            proc = subprocess.Popen(
+                ["ollama", "run", model, self._cli_prompt(prompt, system_prompt)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        except Exception as e:
+            print(f"⚠️  LLM-Fehler: {e}")
+            return False
+        
+        ttft, woerter = None, 0
+        try:
+            for line in proc.stdout:
+                if ttft is None and line.strip():
+                    ttft = time.perf_counter() - start
+                woerter += len(line.split())
+                teile.append(line)
+                yield line
+            return proc.wait(timeout=self.TIMEOUT) == 0
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            if woerter:
+                self.metriken.append(_build_metriken(model, "cli", start, ttft, woerter))
 
 
 # ============================================================================
 # REGEX-BASIERTE EXTRAKTION (Fallback & Basisdaten)
 # ============================================================================
 
+def _build_keyword_scanner(keywords: list) -> tuple:
+    """Baut einen kombinierten Regex für alle Skill-Keywords
+    
+    Der Lookahead findet an jeder Position das längste Keyword mit
+    Wortgrenzen; da mehrere Keywords an derselben Position nur Präfixe
+    voneinander sein können ("github" / "github actions"), liefert die
+    Präfix-Tabelle die kürzeren Treffer dazu. So ergibt ein einziger
+    Durchlauf dieselben Treffer wie ein re.search pro Keyword.
+    
+    Returns:
+        (kompilierter Regex, {keyword: [kürzere Keywords an gleicher Position]})
+    """
+    unique = sorted(set(keywords), key=len, reverse=True)
+    scanner = re.compile(
+        r"(?=\b(" + "|".join(re.escape(kw) for kw in unique) + r")\b)"
+    )
+    
+    def is_word(char: str) -> bool:
+        return bool(re.match(r"\w", char))
+    
+    praefixe = {
+        kw: [
+            k for k in unique
+            if k != kw and kw.startswith(k) and is_word(k[-1]) != is_word(kw[len(k)])
+        ]
+        for kw in unique
+    }
+    return scanner, praefixe
+
+
 class RegexExtractor:
     """Extrahiert Basisdaten mit Regex-Patterns"""
     
@@ -349,44 +962,81 @@ class RegexExtractor:
         "hilfreich", "bevorzugt", "schön wäre"
     ]
     
+    SOFT_SKILL_KEYWORDS = [
+        "teamfähig", "kommunikativ", "selbstständig", "eigenverantwortlich",
+        "flexibel", "belastbar", "zuverlässig", "engagiert", "motiviert",
+        "lernbereit", "analytisch", "strukturiert", "kreativ"
+    ]
+    
+    # Profil-/Anforderungs-Überschriften (erste passende gewinnt)
+    PROFIL_PATTERNS = [
+        r'Profil\s*\n\n(.*?)(?=\n\n(?:Wir bieten|Benefits|Kontakt|Bewerbung|$))',
+        r'(?:Ihr Profil|Dein Profil|Ihre Qualifikation|Deine Qualifikation|Anforderungen|Was Sie mitbringen|Was Du mitbringst)\s*[:\n]+(.*?)(?=\n\n(?:Wir bieten|Benefits|Das bieten wir|Unser Angebot|Das klingt gut|$))',
+        r'(?:Das bringen Sie mit|Das bringst Du mit|Ihre Skills|Deine Skills)\s*[:\n]+(.*?)(?=\n\n)',
+    ]
+    
+    # Einmal beim Laden der Klasse kompiliert (unabhängig vom re-internen Cache)
+    _COMPILED_PATTERNS = {
+        name: [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in patterns]
+        for name, patterns in PATTERNS.items()
+    }
+    _COMPILED_PROFIL = [re.compile(p, re.DOTALL | re.IGNORECASE) for p in PROFIL_PATTERNS]
+    _KEYWORD_SCANNER, _KEYWORD_PRAEFIXE = _build_keyword_scanner(
+        [kw for keywords in SKILL_KEYWORDS.values() for kw in keywords]
+    )
+    _NICE_TO_HAVE_RE = re.compile("|".join(NICE_TO_HAVE_MARKERS))
+    
+    _CLEANUP_RE = re.compile(r'\n|Adresse|E-?Mail|Telefon|Website')
+    _CLEANUP_FIRMA_RE = re.compile(r'Adresse|E-?Mail|Telefon|Website')
+    _RECHTSFORM_RE = re.compile(r'(?:GmbH|AG|SE|KG|OHG|UG|e\.V\.)', re.IGNORECASE)
+    _PLZ_ORT_RE = re.compile(r"(\d{5})\s+(.+)")
+    _JSON_PLZ_RE = re.compile(r'"plz":\s*(\d{5})')
+    _JSON_ORT_RE = re.compile(r'"ort":\s*"([^"]+)"')
+    _JSON_ANREDE_RE = re.compile(r'"recruiter_anrede":\s*"([^"]+)"')
+    _JSON_VORNAME_RE = re.compile(r'"recruiter_vorname":\s*"([^"]+)"')
+    _JSON_NACHNAME_RE = re.compile(r'"recruiter_nachname":\s*"([^"]+)"')
+    _CONTEXT_PLZ_RE = re.compile(r'\b\d{5}\b')
+    _CONTEXT_STRASSE_RE = re.compile(r'(?:straße|str\.|weg|allee|platz|gasse)', re.IGNORECASE)
+    _CONTEXT_EMAIL_RE = re.compile(r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}', re.IGNORECASE)
+    
     def extract_all(self, text: str) -> BewerbungsFirma:
         """Extrahiert alle Basisdaten aus dem Text"""
         result = BewerbungsFirma(rohtext=text)
         
         # Firma - mit Context-Scoring für robuste Extraktion
-        result.firma.name = self._find_with_context_score(text, self.PATTERNS["firma_name"])
-        result.firma.email = self._find_first(text, self.PATTERNS["email"])
-        result.firma.telefon = self._find_first(text, self.PATTERNS["telefon"])
-        result.firma.website = self._find_first(text, self.PATTERNS["website"])
+        result.firma.name = self._find_with_context_score(text, self._COMPILED_PATTERNS["firma_name"])
+        result.firma.email = self._find_first(text, self._COMPILED_PATTERNS["email"])
+        result.firma.telefon = self._find_first(text, self._COMPILED_PATTERNS["telefon"])
+        result.firma.website = self._find_first(text, self._COMPILED_PATTERNS["website"])
         
         # Ansprechpartner - mit spezieller JSON-Logik
         result.firma.ansprechpartner = self._extract_ansprechpartner(text)
-        result.firma.strasse = self._find_first(text, self.PATTERNS["strasse"])
+        result.firma.strasse = self._find_first(text, self._COMPILED_PATTERNS["strasse"])
         
         # PLZ/Ort - mit JSON-Support
-        plz_ort = self._find_first(text, self.PATTERNS["plz_ort"], group=0)
+        plz_ort = self._find_first(text, self._COMPILED_PATTERNS["plz_ort"], group=0)
         if plz_ort:
-            match = re.search(r"(\d{5})\s+(.+)", plz_ort)
+            match = self._PLZ_ORT_RE.search(plz_ort)
             if match:
                 result.firma.plz = match.group(1)
                 result.firma.ort = match.group(2)
         
         # Fallback: Separate JSON-Extraktion für PLZ/Ort
         if not result.firma.plz:
-            plz_match = re.search(r'"plz":\s*(\d{5})', text)
+            plz_match = self._JSON_PLZ_RE.search(text)
             if plz_match:
                 result.firma.plz = plz_match.group(1)
         if not result.firma.ort:
-            ort_match = re.search(r'"ort":\s*"([^"]+)"', text)
+            ort_match = self._JSON_ORT_RE.search(text)
             if ort_match:
                 result.firma.ort = ort_match.group(1)
         
         # Stelle
-        result.stelle.titel = self._find_first(text, self.PATTERNS["jobtitel"])
-        result.stelle.referenznummer = self._find_first(text, self.PATTERNS["referenznummer"])
-        result.stelle.arbeitszeit = self._find_first(text, self.PATTERNS["arbeitszeit"]) or "Vollzeit"
-        result.stelle.homeoffice = self._find_first(text, self.PATTERNS["homeoffice"])
-        result.stelle.gehalt = self._find_first(text, self.PATTERNS["gehalt"])
+        result.stelle.titel = self._find_first(text, self._COMPILED_PATTERNS["jobtitel"])
+        result.stelle.referenznummer = self._find_first(text, self._COMPILED_PATTERNS["referenznummer"])
+        result.stelle.arbeitszeit = self._find_first(text, self._COMPILED_PATTERNS["arbeitszeit"]) or "Vollzeit"
+        result.stelle.homeoffice = self._find_first(text, self._COMPILED_PATTERNS["homeoffice"])
+        result.stelle.gehalt = self._find_first(text, self._COMPILED_PATTERNS["gehalt"])
         
         # Anforderungen (Keyword-basiert)
         result.anforderungen = self._extract_requirements(text)
@@ -394,14 +1044,14 @@ class RegexExtractor:
         return result
     
     def _find_first(self, text: str, patterns: list, group: int = 1) -> str:
-        """Findet den ersten Match aus einer Liste von Patterns"""
+        """Findet den ersten Match aus einer Liste kompilierter Patterns"""
         for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = pattern.search(text)
             if match:
                 try:
                     result = match.group(group).strip()
                     # Bereinige ungewollte Zeilenumbrüche und nachfolgende Wörter
-                    result = re.split(r'\n|Adresse|E-?Mail|Telefon|Website', result)[0].strip()
+                    result = self._CLEANUP_RE.split(result, 1)[0].strip()
                     return result
                 except IndexError:
                     return match.group(0).strip()
@@ -422,14 +1072,14 @@ class RegexExtractor:
         
         # Sammle alle Matches aus allen Patterns
         for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE):
+            for match in pattern.finditer(text):
                 try:
                     result = match.group(group).strip()
                     # WICHTIG: Split HIER machen, um Multi-Line-Matches zu bereinigen
-                    lines = re.split(r'\n', result)
+                    lines = result.split('\n')
                     # Finde die Zeile mit GmbH/AG/etc. (die eigentliche Firma)
                     for line in lines:
-                        if re.search(r'(?:GmbH|AG|SE|KG|OHG|UG|e\.V\.)', line, re.IGNORECASE):
+                        if self._RECHTSFORM_RE.search(line):
                             result = line.strip()
                             break
                     else:
@@ -437,7 +1087,7 @@ class RegexExtractor:
                         result = lines[0].strip() if lines else result
                     
                     # Bereinige nachfolgende Wörter (Adresse, Email, etc.)
-                    result = re.split(r'Adresse|E-?Mail|Telefon|Website', result)[0].strip()
+                    result = self._CLEANUP_FIRMA_RE.split(result, 1)[0].strip()
                     
                     if result and len(result) > 3:  # Filter zu kurze Matches
                         position = match.start()
@@ -474,15 +1124,15 @@ class RegexExtractor:
                 context = text[context_start:context_end]
                 
                 # +50 Punkte: PLZ in der Nähe
-                if re.search(r'\b\d{5}\b', context):
+                if self._CONTEXT_PLZ_RE.search(context):
                     score += 50
                 
                 # +30 Punkte: Straße in der Nähe
-                if re.search(r'(?:straße|str\.|weg|allee|platz|gasse)', context, re.IGNORECASE):
+                if self._CONTEXT_STRASSE_RE.search(context):
                     score += 30
                 
                 # +20 Punkte: Email in der Nähe
-                if re.search(r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}', context, re.IGNORECASE):
+                if self._CONTEXT_EMAIL_RE.search(context):
                     score += 20
             
             scored_candidates.append((score, candidate, pos))
@@ -500,9 +1150,23 @@ class RegexExtractor:
         text_lower = text.lower()
         
         # Extrahiere Profil-Sektion (enthält die eigentlichen Anforderungen)
-        profil_section = self._extract_profil_section(text)
-        has_profil = bool(profil_section)
-        profil_lower = profil_section.lower() if profil_section else ""
+        profil_span = self._find_profil_span(text)
+        has_profil = bool(profil_span) and profil_span[0] < profil_span[1]
+        profil_lower = text[profil_span[0]:profil_span[1]].lower() if has_profil else ""
+        
+        # Ein Durchlauf über die Anzeige liefert alle Keywords mit Position
+        treffer = self._scan_keywords(text_lower)
+        if not has_profil:
+            im_profil = set()
+        elif len(text_lower) == len(text):
+            start, end = profil_span
+            im_profil = {
+                kw for kw, positionen in treffer.items()
+                if any(start <= pos and pos + len(kw) <= end for pos in positionen)
+            }
+        else:
+            # lower() hat die Länge verändert → Positionen nicht übertragbar
+            im_profil = set(self._scan_keywords(profil_lower))
         
         # Tracking für Duplikate (case-insensitive)
         seen_skills = {}  # lowercase -> (original, typ)
@@ -513,7 +1177,7 @@ class RegexExtractor:
                 keyword_lower = keyword.lower()
                 
                 # Prüfe zuerst im Profil-Abschnitt
-                if has_profil and re.search(rf"\b{re.escape(keyword)}\b", profil_lower):
+                if keyword in im_profil:
                     # Im Profil gefunden - prüfe ob explizit "nice to have"
                     if self._is_nice_to_have(profil_lower, keyword):
                         typ = "nice_to_have"
@@ -541,7 +1205,7 @@ class RegexExtractor:
                         seen_skills[keyword_lower] = (keyword, typ)
                         
                 # Sonst prüfe im gesamten Text (nur wenn noch nicht als Must-Have erfasst)
-                elif re.search(rf"\b{re.escape(keyword)}\b", text_lower):
+                elif keyword in treffer:
                     if keyword_lower not in seen_skills:
                         # Außerhalb Profil = Nice-to-Have
                         if keyword not in anforderungen.nice_to_have:
@@ -549,23 +1213,33 @@ class RegexExtractor:
                         seen_skills[keyword_lower] = (keyword, "nice_to_have")
         
         # Soft Skills
-        soft_skill_keywords = [
-            "teamfähig", "kommunikativ", "selbstständig", "eigenverantwortlich",
-            "flexibel", "belastbar", "zuverlässig", "engagiert", "motiviert",
-            "lernbereit", "analytisch", "strukturiert", "kreativ"
-        ]
-        for skill in soft_skill_keywords:
+        for skill in self.SOFT_SKILL_KEYWORDS:
             if skill in text_lower:
                 anforderungen.soft_skills.append(skill.capitalize())
         
         return anforderungen
     
+    def _scan_keywords(self, text_lower: str) -> dict:
+        """Findet alle Skill-Keywords in einem Durchlauf
+        
+        Returns:
+            {keyword: [startpositionen]}
+        """
+        treffer = {}
+        for match in self._KEYWORD_SCANNER.finditer(text_lower):
+            keyword = match.group(1)
+            pos = match.start()
+            treffer.setdefault(keyword, []).append(pos)
+            for kuerzer in self._KEYWORD_PRAEFIXE[keyword]:
+                treffer.setdefault(kuerzer, []).append(pos)
+        return treffer
+    
     def _extract_ansprechpartner(self, text: str) -> str:
         """Extrahiert Ansprechpartner mit Unterstützung für JSON-Format"""
         # Prüfe zuerst auf JSON-Format
-        anrede_match = re.search(r'"recruiter_anrede":\s*"([^"]+)"', text)
-        vorname_match = re.search(r'"recruiter_vorname":\s*"([^"]+)"', text)
-        nachname_match = re.search(r'"recruiter_nachname":\s*"([^"]+)"', text)
+        anrede_match = self._JSON_ANREDE_RE.search(text)
+        vorname_match = self._JSON_VORNAME_RE.search(text)
+        nachname_match = self._JSON_NACHNAME_RE.search(text)
         
         if anrede_match and vorname_match and nachname_match:
             anrede = anrede_match.group(1)
@@ -574,23 +1248,20 @@ class RegexExtractor:
             return f"{anrede} {vorname} {nachname}"
         
         # Fallback auf Standard-Patterns
-        return self._find_first(text, self.PATTERNS["ansprechpartner"])
+        return self._find_first(text, self._COMPILED_PATTERNS["ansprechpartner"])
+    
+    def _find_profil_span(self, text: str) -> Optional[tuple]:
+        """Liefert (start, ende) der Profil/Anforderungs-Sektion oder None"""
+        for pattern in self._COMPILED_PROFIL:
+            match = pattern.search(text)
+            if match:
+                return match.span(1)
+        return None
     
     def _extract_profil_section(self, text: str) -> str:
         """Extrahiert die Profil/Anforderungs-Sektion aus der Stellenanzeige"""
-        # Suche nach typischen Profil-Überschriften
-        profil_patterns = [
-            r'Profil\s*\n\n(.*?)(?=\n\n(?:Wir bieten|Benefits|Kontakt|Bewerbung|$))',
-            r'(?:Ihr Profil|Dein Profil|Ihre Qualifikation|Deine Qualifikation|Anforderungen|Was Sie mitbringen|Was Du mitbringst)\s*[:\n]+(.*?)(?=\n\n(?:Wir bieten|Benefits|Das bieten wir|Unser Angebot|Das klingt gut|$))',
-            r'(?:Das bringen Sie mit|Das bringst Du mit|Ihre Skills|Deine Skills)\s*[:\n]+(.*?)(?=\n\n)',
-        ]
-        
-        for pattern in profil_patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return ""
+        span = self._find_profil_span(text)
+        return text[span[0]:span[1]] if span else ""
     
     def _is_nice_to_have(self, text: str, keyword: str) -> bool:
         """Prüft ob ein Skill explizit als 'nice to have' markiert ist"""
@@ -601,14 +1272,9 @@ class RegexExtractor:
         
         window_start = max(0, keyword_pos - 150)
         window_end = min(len(text), keyword_pos + 150)
-        window = text[window_start:window_end]
-        
-        # Prüfe auf Nice-to-Have Marker
-        for marker in self.NICE_TO_HAVE_MARKERS:
-            if re.search(marker, window):
-                return True
         
-        return False
+        # Prüfe auf Nice-to-Have Marker (alle Marker in einem Regex)
+        return self._NICE_TO_HAVE_RE.search(text, window_start, window_end) is not None
 
 
 # ============================================================================
@@ -693,8 +1359,13 @@ Antworte NUR mit diesem JSON-Format (keine Markdown-Blöcke!):
         
         return None
     
-    def generate_skill_paragraphs(self, matches: list, firma_name: str, position: str, ansprechpartner: str = "Damen und Herren") -> Optional[str]:
-        """Generiert vollständiges Anschreiben mit 4 Absätzen"""
+    def generate_skill_paragraphs(self, matches: list, firma_name: str, position: str, ansprechpartner: str = "Damen und Herren",
+                                  on_chunk: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """Generiert vollständiges Anschreiben mit 4 Absätzen
+        
+        Mit on_chunk wird die Antwort gestreamt und jedes Text-Stück sofort
+        an den Callback übergeben (z.B. für Live-Ausgabe im Terminal).
+        """
         if not self.is_available or not matches:
             return None
         
@@ -773,7 +1444,14 @@ WICHTIG:
 Schreibe NUR die 4 Absätze:"""
         
         # Generiere Anschreiben-Text (ohne zweite Korrektur-Stufe)
-        anschreiben_text = self.client.query(prompt, system_prompt, temperature=0.3)
+        if on_chunk:
+            teile = []
+            for chunk in self.client.stream(prompt, system_prompt, temperature=0.3):
+                on_chunk(chunk)
+                teile.append(chunk)
+            anschreiben_text = "".join(teile)
+        else:
+            anschreiben_text = self.client.query(prompt, system_prompt, temperature=0.3)
         
         if not anschreiben_text or len(anschreiben_text) < 100:
             return None
@@ -819,10 +1497,203 @@ Gib das optimierte Anschreiben zurück. Passe die Formulierungen an, um:
         return self.client.query(prompt, system_prompt, temperature=0.5)
 
 
+# ============================================================================
+# EMBEDDING-MATCHING (optional)
+# ============================================================================
+
+EMBEDDING_CACHE_DIR = Path(__file__).parent.parent / "output" / "cache" / "embeddings"
+
+# Prozessweite Einstellungen (gesetzt über configure_embeddings)
+_embedding_config = {"enabled": False, "model": None, "schwelle": None}
+
+
+def configure_embeddings(enabled: bool = True, model: Optional[str] = None, schwelle: Optional[float] = None):
+    """Schaltet das semantische Matching für alle neuen SkillMatcher ein/aus (z.B. aus --embeddings)
+    
+    Args:
+        enabled: True ergänzt die Regeln um eine Embedding-Suche
+        model: Embedding-Modell in Ollama (Standard: EmbeddingMatcher.DEFAULT_MODEL)
+        schwelle: Mindest-Kosinusähnlichkeit für einen Treffer
+    """
+    _embedding_config["enabled"] = enabled
+    _embedding_config["model"] = model
+    _embedding_config["schwelle"] = schwelle
+
+
+def persoenliche_daten_path() -> Optional[Path]:
+    """Pfad der geladenen persoenliche_daten.py"""
+    modul = sys.modules.get("persoenliche_daten") or sys.modules.get("data.persoenliche_daten")
+    datei = getattr(modul, "__file__", None)
+    return Path(datei) if datei else None
+
+
+def persoenliche_daten_hash() -> str:
+    """Inhalts-Hash der persoenliche_daten.py (Schlüssel für daraus abgeleitete Caches)"""
+    path = persoenliche_daten_path()
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except (OSError, AttributeError):
+        # Ohne Datei (z.B. eingebettet): Hash über die verwendeten Daten
+        raw = json.dumps([KENNTNISSE, SOFTSKILLS], ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class EmbeddingMatcher:
+    """Semantisches Matching über lokale Embeddings (Ollama /api/embeddings)
+    
+    Findet auch Anforderungen ohne gemeinsames Wort, z.B. "REST-Schnittstellen"
+    -> "REST API Design". Die Vektoren der eigenen Skills werden einmal
+    berechnet und als NumPy-Datei in output/cache/embeddings abgelegt
+    (per mmap geladen); der Dateiname enthält das Modell und einen Hash über
+    persoenliche_daten.py, Änderungen erzeugen also einen neuen Index. Jede
+    Anforderung ist danach eine Top-k-Kosinussuche über diese Matrix.
+    
+    Ohne NumPy oder ohne erreichbares Modell ist is_available() False und
+    SkillMatcher bleibt bei den Regeln.
+    """
+    
+    DEFAULT_MODEL = "nomic-embed-text"
+    SCHWELLE = 0.75     # Mindest-Kosinusähnlichkeit für einen Treffer
+    TOP_K = 3
+    TIMEOUT = 30
+    ANFRAGEN_CACHE_SIZE = 4096
+    
+    def __init__(self, skills: dict, model: Optional[str] = None, host: Optional[str] = None,
+                 cache_dir: Optional[Path] = None, schwelle: Optional[float] = None):
+        """
+        Args:
+            skills: meine_skills eines SkillMatcher (ein Eintrag pro Skill-Name wird eingebettet)
+            model: Embedding-Modell in Ollama
+            host: Ollama-Host (Standard: OLLAMA_HOST bzw. lokal)
+            cache_dir: Ablage der Vektoren (Standard: output/cache/embeddings)
+            schwelle: Mindest-Kosinusähnlichkeit für einen Treffer
+        """
+        self.model = model or self.DEFAULT_MODEL
+        self.schwelle = schwelle if schwelle is not None else self.SCHWELLE
+        self.cache_dir = Path(cache_dir or EMBEDDING_CACHE_DIR)
+        self._http = get_http_backend(host)
+        
+        # Ein Eintrag pro Skill-Name (Teile wie "git" aus "Git/GitHub" zeigen auf denselben Skill)
+        eindeutig = {}
+        for skill in skills.values():
+            eindeutig.setdefault(skill["name"], skill)
+        self.skills = list(eindeutig.values())
+        
+        self._matrix = None
+        self._available = None
+        self._lock = threading.Lock()  # Batch-Threads: Index nur einmal aufbauen
+        self._anfragen = {}  # (Anforderung, k) -> Top-k-Treffer, höchstens ANFRAGEN_CACHE_SIZE
+    
+    def is_available(self) -> bool:
+        """Lädt bzw. berechnet beim ersten Aufruf die Skill-Vektoren"""
+        if self._available is not None:
+            return self._available
+        
+        with self._lock:
+            if self._available is None:
+                try:
+                    self._matrix = self._load_or_build()
+                    self._available = True
+                except ImportError:
+                    print("⚠️  Embeddings benötigen NumPy - nutze nur regelbasiertes Matching")
+                    self._available = False
+                except (*_HTTP_ERRORS, KeyError) as e:
+                    print(f"⚠️  Embeddings nicht verfügbar ({self.model}: {e}) - nutze nur regelbasiertes Matching")
+                    self._available = False
+        return self._available
+    
+    def _embed(self, text: str):
+        """Normierter Embedding-Vektor eines Textes"""
+        import numpy as np
+        
+        data = self._http.request(
+            "POST", "/api/embeddings",
+            {"model": self.model, "prompt": text, "keep_alive": OllamaClient.KEEP_ALIVE},
+            timeout=self.TIMEOUT
+        )
+        vektor = np.asarray(data["embedding"], dtype=np.float32)
+        norm = np.linalg.norm(vektor)
+        return vektor / norm if norm else vektor
+    
+    def _index_prefix(self) -> str:
+        """Dateinamen-Präfix der Indizes dieses Modells (z.B. skills_nomic-embed-text_)"""
+        modell = re.sub(r"[^\w.-]", "-", self.model)
+        return f"skills_{modell}_"
+    
+    def _index_path(self) -> Path:
+        namen = "\0".join(skill["name"] for skill in self.skills)
+        key = hashlib.sha256(f"{persoenliche_daten_hash()}\0{self.model}\0{namen}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{self._index_prefix()}{key[:16]}.npy"
+    
+    def _load_or_build(self):
+        """Skill-Matrix (Zeilen normiert) aus dem Cache oder neu berechnet"""
+        import numpy as np
+        
+        path = self._index_path()
+        if path.exists():
+            try:
+                matrix = np.load(path, mmap_mode="r")
+                if matrix.ndim == 2 and matrix.shape[0] == len(self.skills):
+                    return matrix
+            except (OSError, ValueError):
+                pass  # Defekte Datei: neu berechnen
+        
+        start = time.perf_counter()
+        vektoren = [self._embed(skill["name"]) for skill in self.skills]
+        matrix = np.stack(vektoren) if vektoren else np.zeros((0, 1), dtype=np.float32)
+        
+        # Veraltete Indizes desselben Modells entfernen (andere Modelle bleiben) und atomar schreiben
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for alt in self.cache_dir.glob(f"{self._index_prefix()}{'?' * 16}.npy"):
+            alt.unlink(missing_ok=True)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp_path, matrix)
+        os.replace(tmp_path, path)
+        print(f"🧭 Skill-Embeddings berechnet: {len(self.skills)} Skills in {time.perf_counter() - start:.1f}s ({self.model})")
+        return np.load(path, mmap_mode="r")
+    
+    def top_k(self, anforderung: str, k: Optional[int] = None) -> list:
+        """Die k ähnlichsten eigenen Skills als Liste (Kosinusähnlichkeit, Skill)"""
+        import numpy as np
+        
+        k = min(k or self.TOP_K, len(self.skills))
+        if k == 0 or not self.is_available():
+            return []
+        
+        cache_key = (anforderung, k)
+        treffer = self._anfragen.get(cache_key)
+        if treffer is None:
+            try:
+                aehnlichkeit = self._matrix @ self._embed(anforderung)
+            except (*_HTTP_ERRORS, KeyError):
+                return []  # Einzelne Anfrage fehlgeschlagen: wie kein Treffer
+            beste = np.argpartition(-aehnlichkeit, k - 1)[:k]
+            beste = beste[np.argsort(-aehnlichkeit[beste], kind="stable")]
+            treffer = [(float(aehnlichkeit[i]), self.skills[i]) for i in beste]
+            if len(self._anfragen) >= self.ANFRAGEN_CACHE_SIZE:
+                self._anfragen.clear()
+            self._anfragen[cache_key] = treffer
+        return treffer
+    
+    def find(self, anforderung: str) -> Optional[dict]:
+        """Ähnlichster eigener Skill, falls er die Schwelle erreicht"""
+        treffer = self.top_k(anforderung)
+        if treffer and treffer[0][0] >= self.schwelle:
+            return treffer[0][1]
+        return None
+
+
 # ============================================================================
 # SKILL MATCHING
 # ============================================================================
 
+SKILL_PROFIL_CACHE_PATH = Path(__file__).parent.parent / "output" / "cache" / "skill_profil.json"
+
+# Prozessweit geteilte Skill-Profile (siehe SkillMatcher._get_profil)
+_SKILL_PROFILE = {}
+_SKILL_PROFILE_LOCK = threading.Lock()
+
+
 class SkillMatcher:
     """Matched Anforderungen mit eigenen Skills"""
     
@@ -841,10 +1712,103 @@ class SkillMatcher:
         "linux": ["unix", "bash", "shell"],
     }
     
-    def __init__(self):
-        self.meine_skills = self._load_my_skills()
+    # Länge der N-Gramme im Index für die Teilübereinstimmung
+    NGRAM = 3
+    # Maximal gemerkte Ergebnisse der Teilübereinstimmung
+    TREFFER_CACHE_SIZE = 10000
+    # Format von SKILL_PROFIL_CACHE_PATH
+    PROFIL_VERSION = 1
+    
+    def __init__(self, embeddings: Optional[bool] = None):
+        """
+        Args:
+            embeddings: Semantische Suche für Anforderungen ohne Regeltreffer
+                (Standard: Einstellung aus configure_embeddings)
+        """
+        # Skills und Index werden von allen Instanzen geteilt (nur lesen!)
+        profil = self._get_profil()
+        self.meine_skills = profil["meine_skills"]
+        self._skill_keys = profil["keys"]
+        self._skill_werte = profil["werte"]
+        self._synonym_index = profil["synonyme"]
+        self._ngram_index = profil["ngram"]
+        self._praefix_index = profil["praefix"]
+        self._kurz_index = profil["kurz"]
+        self._kurze_keys = profil["kurze_keys"]
+        
+        # Ergebnisse pro Anforderung (gleiche Begriffe kommen in fast jeder Anzeige vor);
+        # die LLM-Threads von analyze_batch matchen gleichzeitig über dieselbe Instanz
+        self._treffer = {}
+        self._treffer_lock = threading.Lock()
+        
+        if embeddings is None:
+            embeddings = _embedding_config["enabled"]
+        self.embeddings = EmbeddingMatcher(
+            self.meine_skills,
+            model=_embedding_config["model"],
+            schwelle=_embedding_config["schwelle"]
+        ) if embeddings else None
+    
+    @classmethod
+    def _get_profil(cls) -> dict:
+        """Skills und Lookup-Index, einmal pro Prozess geladen
+        
+        Das abgeleitete Profil liegt zusätzlich in SKILL_PROFIL_CACHE_PATH,
+        gültig solange persoenliche_daten.py, SYNONYME und NGRAM gleich
+        bleiben; neue Prozesse (Batch-Worker, jeder CLI-Aufruf) lesen es
+        von dort, statt es neu abzuleiten.
+        """
+        synonyme = json.dumps(cls.SYNONYME, ensure_ascii=False)  # Reihenfolge zählt
+        prozess_key = (cls.NGRAM, synonyme)
+        profil = _SKILL_PROFILE.get(prozess_key)
+        if profil is not None:
+            return profil
+        
+        with _SKILL_PROFILE_LOCK:
+            if prozess_key not in _SKILL_PROFILE:
+                key = hashlib.sha256(
+                    f"{cls.PROFIL_VERSION}\0{cls.NGRAM}\0{synonyme}\0{persoenliche_daten_hash()}".encode("utf-8")
+                ).hexdigest()
+                daten = cls._load_profil_cache(key)
+                if daten is None:
+                    daten = cls._build_profil(cls._load_my_skills())
+                    cls._save_profil_cache(key, daten)
+                _SKILL_PROFILE[prozess_key] = cls._profil_aus_daten(daten)
+            return _SKILL_PROFILE[prozess_key]
     
-    def _load_my_skills(self) -> dict:
+    @staticmethod
+    def _load_profil_cache(key: str) -> Optional[dict]:
+        try:
+            with open(SKILL_PROFIL_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data.get("profil") if data.get("key") == key else None
+    
+    @staticmethod
+    def _save_profil_cache(key: str, daten: dict):
+        _atomic_write_json(SKILL_PROFIL_CACHE_PATH, {"key": key, "profil": daten}, "Skill-Profil")
+    
+    @staticmethod
+    def _profil_aus_daten(daten: dict) -> dict:
+        """Baut aus dem gespeicherten Profil die Strukturen für _find_match"""
+        meine_skills = {
+            key: {"name": name, "level": level, "kategorie": kategorie}
+            for key, name, level, kategorie in daten["skills"]
+        }
+        return {
+            "meine_skills": meine_skills,
+            "keys": list(meine_skills),
+            "werte": list(meine_skills.values()),
+            "synonyme": daten["synonyme"],
+            "ngram": daten["ngram"],
+            "praefix": daten["praefix"],
+            "kurz": daten["kurz"],
+            "kurze_keys": daten["kurze_keys"],
+        }
+    
+    @staticmethod
+    def _load_my_skills() -> dict:
         """Lädt alle eigenen Skills aus persoenliche_daten.py"""
         skills = {}
         
@@ -951,6 +1915,206 @@ class SkillMatcher:
         
         return ergebnis
     
+    def match_many(self, anforderungen_liste: list) -> list:
+        """Matched viele Anzeigen auf einmal (z.B. das Analyse-Archiv)
+        
+        Liefert pro Anzeige dasselbe MatchingErgebnis wie match(). Jede
+        unterschiedliche Anforderung wird nur einmal aufgelöst; Deckungsgrad,
+        Scores und Top-5 aller Anzeigen berechnet NumPy in einem Durchgang
+        über die dünn besetzte Matrix Anzeigen x Anforderungs-Vokabular.
+        Ohne NumPy wird match() pro Anzeige aufgerufen.
+        
+        Args:
+            anforderungen_liste: Liste von Anforderungen (eine pro Anzeige)
+        
+        Returns:
+            Liste von MatchingErgebnis in derselben Reihenfolge
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.match(a) for a in anforderungen_liste]
+        
+        typen_info = (("must_have", 1.0), ("nice_to_have", 0.7), ("soft_skill", 0.5))
+        anzahl = len(anforderungen_liste)
+        ergebnisse = [MatchingErgebnis() for _ in range(anzahl)]
+        
+        # Vokabular: jede Anforderung (klein geschrieben) einmal, mit ihrem Skill
+        vokabular = {}
+        treffer = []
+        skill_ids = {}
+        vokabel_skill, vokabel_level, vokabel_soft = [], [], []
+        
+        # Matrix als Koordinatenliste: ein Eintrag (Anzeige, Typ, Vokabel) pro Vorkommen;
+        # die Listen matched/fehlend entstehen im selben Durchlauf wie in match()
+        zeilen, typen, spalten, eintraege = [], [], [], []
+        for zeile, anforderungen in enumerate(anforderungen_liste):
+            matched = ergebnisse[zeile].matched_skills
+            missing = ergebnisse[zeile].fehlende_skills
+            for typ, liste in enumerate((anforderungen.must_have, anforderungen.nice_to_have, anforderungen.soft_skills)):
+                typ_name, typ_relevanz = typen_info[typ]
+                for anforderung in liste:
+                    key = anforderung.lower()
+                    spalte = vokabular.get(key)
+                    if spalte is None:
+                        spalte = vokabular[key] = len(treffer)
+                        match_result = self._find_match(key)
+                        treffer.append(match_result)
+                        if match_result:
+                            vokabel_skill.append(skill_ids.setdefault(match_result["name"], len(skill_ids)))
+                            vokabel_level.append(match_result["level"])
+                            vokabel_soft.append(match_result["kategorie"] == "soft_skills")
+                        else:
+                            vokabel_skill.append(-1)
+                            vokabel_level.append(0)
+                            vokabel_soft.append(False)
+                    
+                    match_result = treffer[spalte]
+                    if match_result:
+                        eintrag = {
+                            "skill": match_result["name"],
+                            "relevanz": typ_relevanz,
+                            "mein_level": match_result["level"],
+                            "kategorie": match_result["kategorie"],
+                            "aus_anforderung": anforderung
+                        }
+                        matched.append(eintrag)
+                    else:
+                        eintrag = None
+                        missing.append({"skill": anforderung, "typ": typ_name})
+                    eintraege.append(eintrag)
+                    zeilen.append(zeile)
+                    typen.append(typ)
+                    spalten.append(spalte)
+        
+        zeilen = np.array(zeilen, dtype=np.intp)
+        typen = np.array(typen, dtype=np.intp)
+        spalten = np.array(spalten, dtype=np.intp)
+        skill = np.array(vokabel_skill, dtype=np.intp)[spalten]
+        gefunden = skill >= 0
+        
+        # Deckungsgrad: gewichtete Summen pro Anzeige (Summenreihenfolge wie in match())
+        relevanz = np.array([1.0, 0.7, 0.5])[typen]
+        gewicht = np.array([1.0, 0.5, 0.5])[typen]
+        gesamt = np.bincount(zeilen, weights=gewicht, minlength=anzahl)
+        erreicht = np.bincount(zeilen[gefunden], weights=relevanz[gefunden], minlength=anzahl)
+        deckungsgrad = np.divide(erreicht, gesamt, out=np.zeros(anzahl), where=gesamt > 0) * 100
+        
+        # Scores mit Must-Have-Boost und Soft-Skill-Dämpfung
+        vorkommen = np.flatnonzero(gefunden)
+        basis = relevanz[vorkommen] * np.array(vokabel_level, dtype=float)[spalten[vorkommen]]
+        score = np.where(
+            typen[vorkommen] == 0, basis + 25,
+            np.where(np.array(vokabel_soft, dtype=bool)[spalten[vorkommen]], basis * 0.7, basis)
+        )
+        
+        # Bester Treffer pro (Anzeige, Skill): höchster Score, bei Gleichstand der erste
+        z, sk = zeilen[vorkommen], skill[vorkommen]
+        reihenfolge = np.lexsort((vorkommen, -score, sk, z))
+        paar = (z * max(len(skill_ids), 1) + sk)[reihenfolge]
+        gruppen = np.flatnonzero(np.r_[True, paar[1:] != paar[:-1]]) if len(paar) else paar
+        beste = reihenfolge[gruppen]
+        erstes = np.minimum.reduceat(vorkommen[reihenfolge], gruppen) if len(gruppen) else gruppen
+        
+        # Top 5 pro Anzeige: nach Score absteigend, bei Gleichstand erstes Vorkommen des Skills
+        rangfolge = beste[np.lexsort((erstes, -score[beste], z[beste]))]
+        z_rang = z[rangfolge]
+        rang = np.arange(len(rangfolge)) - np.searchsorted(z_rang, z_rang)
+        top = rangfolge[rang < 5]
+        
+        # Ergebnisobjekte vervollständigen
+        for zeile, wert in enumerate(deckungsgrad.tolist()):
+            ergebnisse[zeile].deckungsgrad = wert
+        top = vorkommen[top]
+        for i, zeile in zip(top.tolist(), zeilen[top].tolist()):
+            ergebnisse[zeile].top_matches.append(dict(eintraege[i]))
+        
+        return ergebnisse
+    
+    @classmethod
+    def _build_profil(cls, meine_skills: dict) -> dict:
+        """Leitet aus den Skills das Profil für _find_match ab (JSON-fähig)
+        
+        - Synonyme: Alias -> eigener Skill, in der Reihenfolge von SYNONYME
+          aufgelöst (der erste Eintrag, zu dem ein eigener Skill passt, gewinnt)
+        - N-Gramm-Index: Keys, in denen die Anforderung steht (alle N-Gramme)
+          bzw. die in der Anforderung stehen (nur das erste N-Gramm des Keys)
+        
+        Bei Teilübereinstimmungen gewinnt wie bisher der erste Key in der
+        Reihenfolge von meine_skills, daher speichern alle Strukturen Positionen.
+        """
+        n = cls.NGRAM
+        keys = list(meine_skills)
+        positionen = {key: pos for pos, key in enumerate(keys)}
+        
+        synonym_index = {}
+        for haupt_skill, synonyme in cls.SYNONYME.items():
+            pos = next((positionen[s] for s in [haupt_skill, *synonyme] if s in positionen), None)
+            if pos is None:
+                continue
+            for alias in (haupt_skill, *synonyme):
+                synonym_index.setdefault(alias, pos)
+        
+        ngram_index = {}    # N-Gramm -> Positionen aller Keys, die es enthalten
+        praefix_index = {}  # Erstes N-Gramm -> Positionen der Keys, die damit beginnen
+        kurz_index = {}     # Teilstrings kürzer als N -> erste Position
+        kurze_keys = []     # Positionen der Keys kürzer als N
+        for pos, key in enumerate(keys):
+            for laenge in range(n):
+                for i in range(len(key) - laenge + 1):
+                    kurz_index.setdefault(key[i:i + laenge], pos)
+            if len(key) < n:
+                kurze_keys.append(pos)
+                continue
+            praefix_index.setdefault(key[:n], []).append(pos)
+            for gramm in {key[i:i + n] for i in range(len(key) - n + 1)}:
+                ngram_index.setdefault(gramm, []).append(pos)
+        
+        return {
+            "skills": [[key, s["name"], s["level"], s["kategorie"]] for key, s in meine_skills.items()],
+            "synonyme": synonym_index,
+            "ngram": ngram_index,
+            "praefix": praefix_index,
+            "kurz": kurz_index,
+            "kurze_keys": kurze_keys,
+        }
+    
+    def _teil_match(self, anforderung: str) -> int:
+        """Position des ersten Keys, der die Anforderung enthält oder in ihr steht"""
+        n = self.NGRAM
+        keys = self._skill_keys
+        beste = len(keys)
+        
+        # Key steckt in der Anforderung: kurze Keys direkt, sonst über ihr erstes N-Gramm
+        for pos in self._kurze_keys:
+            if pos >= beste:
+                break
+            if keys[pos] in anforderung:
+                beste = pos
+        for gramm in {anforderung[i:i + n] for i in range(len(anforderung) - n + 1)}:
+            for pos in self._praefix_index.get(gramm, ()):
+                if pos >= beste:
+                    break
+                if keys[pos] in anforderung:
+                    beste = pos
+        
+        # Anforderung steckt im Key
+        if len(anforderung) < n:
+            return min(beste, self._kurz_index.get(anforderung, beste))
+        kandidaten = None
+        for i in range(len(anforderung) - n + 1):
+            positionen = self._ngram_index.get(anforderung[i:i + n])
+            if positionen is None:
+                return beste
+            if kandidaten is None or len(positionen) < len(kandidaten):
+                kandidaten = positionen
+        for pos in kandidaten:
+            if pos >= beste:
+                break
+            if anforderung in keys[pos]:
+                return pos
+        return beste
+    
     def _find_match(self, anforderung: str) -> Optional[dict]:
         """Findet einen passenden eigenen Skill"""
         anforderung_clean = anforderung.strip().lower()
@@ -960,20 +2124,405 @@ class SkillMatcher:
             return self.meine_skills[anforderung_clean]
         
         # Prüfe Synonyme
-        for haupt_skill, synonyme in self.SYNONYME.items():
-            if anforderung_clean in synonyme or anforderung_clean == haupt_skill:
-                if haupt_skill in self.meine_skills:
-                    return self.meine_skills[haupt_skill]
-                for syn in synonyme:
-                    if syn in self.meine_skills:
-                        return self.meine_skills[syn]
-        
-        # Teilübereinstimmung
-        for skill_key, skill_data in self.meine_skills.items():
-            if anforderung_clean in skill_key or skill_key in anforderung_clean:
-                return skill_data
+        pos = self._synonym_index.get(anforderung_clean)
+        if pos is not None:
+            return self._skill_werte[pos]
         
-        return None
+        # Teilübereinstimmung (erster passender Key in Reihenfolge von meine_skills)
+        try:
+            treffer = self._treffer[anforderung_clean]
+        except KeyError:
+            # Lesen ohne Lock (ein einzelner Zugriff), Leeren und Eintragen nur gemeinsam
+            pos = self._teil_match(anforderung_clean)
+            treffer = self._skill_werte[pos] if pos < len(self._skill_werte) else None
+            with self._treffer_lock:
+                if len(self._treffer) >= self.TREFFER_CACHE_SIZE:
+                    self._treffer.clear()
+                self._treffer[anforderung_clean] = treffer
+        
+        # Semantische Ähnlichkeit nur, wenn keine Regel greift
+        if treffer is None and self.embeddings is not None and self.embeddings.is_available():
+            treffer = self.embeddings.find(anforderung_clean)
+        
+        return treffer
+
+
+# ============================================================================
+# BATCH-ANALYSE
+# ============================================================================
+
+# Dateiendungen, die im Batch-Modus als Stellenanzeige gelesen werden
+BATCH_SUFFIXES = (".txt", ".md", ".json")
+
+
+@dataclass
+class BatchEintrag:
+    """Ergebnis einer einzelnen Stellenanzeige im Batch-Lauf"""
+    quelle: str
+    result: Optional[BewerbungsFirma] = None
+    gespeichert: str = ""
+    fehler: str = ""
+    zeiten: dict = field(default_factory=dict)
+
+
+# Pro Worker-Prozess einmal aufgebaut (siehe _init_batch_worker)
+_batch_worker = None
+
+
+def _init_batch_worker(embedding_config: Optional[dict] = None):
+    """Initialisiert Extractor und Matcher einmal pro Worker-Prozess"""
+    global _batch_worker
+    if embedding_config:
+        configure_embeddings(**embedding_config)
+    _batch_worker = (RegexExtractor(), SkillMatcher())
+
+
+def _batch_regex_stage(quelle: str) -> tuple:
+    """Regex-Extraktion und Skill-Matching einer Datei (läuft im Worker-Prozess)"""
+    extractor, matcher = _batch_worker
+    
+    text = Path(quelle).read_text(encoding='utf-8')
+    if not text.strip():
+        raise ValueError("Leere Stellenanzeige")
+    
+    start = time.perf_counter()
+    result = extractor.extract_all(text)
+    regex_zeit = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    result.matching = matcher.match(result.anforderungen)
+    matching_zeit = time.perf_counter() - start
+    
+    return result, {"regex": regex_zeit, "matching": matching_zeit}
+
+
+def find_batch_files(verzeichnis: Path) -> list:
+    """Listet alle Stellenanzeigen eines Verzeichnisses (sortiert nach Name)"""
+    return sorted(
+        p for p in verzeichnis.iterdir()
+        if p.is_file() and p.suffix.lower() in BATCH_SUFFIXES
+    )
+
+
+# ============================================================================
+# ANALYSE-INDEX
+# ============================================================================
+
+def _atomic_write_json(path: Path, data, label: str):
+    """Schreibt JSON atomar über eine temporäre Datei (Fehler sind unkritisch - nur ein Cache)
+    
+    Args:
+        path: Zieldatei
+        data: JSON-serialisierbare Daten
+        label: Bezeichnung in der Warnung, z.B. "Analyse-Index"
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # json.dumps nutzt den C-Encoder (json.dump schreibt stückweise in Python)
+            f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  {label} konnte nicht gespeichert werden: {e}")
+
+
+class AnalyseIndex:
+    """Index über die gespeicherten Analysen in output/analysen
+    
+    Bildet jedes Dateinamen-Präfix vor einem "_" auf die neueste passende
+    Datei ab - ein Lookup entspricht damit glob("<präfix>_*.json") plus
+    max(st_mtime), ohne das Verzeichnis zu lesen. Gepflegt wird der Index
+    von StellenanzeigenAnalyzer.save_analysis; ändert sich das Verzeichnis
+    auf anderem Weg (mtime des Verzeichnisses), wird er neu aufgebaut.
+    
+    Eine an Ort und Stelle neu geschriebene Datei ändert die mtime des
+    Verzeichnisses nicht. Deshalb prüft jeder Lookup per stat() die mtime
+    der einen Datei, die er liefert, und baut den Index bei einer Abweichung
+    neu auf (save_analysis trägt neu geschriebene Dateien selbst ein).
+    """
+    
+    VERSION = 1
+    
+    # Eine Instanz pro Verzeichnis und Prozess
+    _instances = {}
+    
+    def __init__(self, analysen_dir: Path, index_path: Optional[Path] = None):
+        self.analysen_dir = Path(analysen_dir)
+        self.index_path = Path(index_path) if index_path else (
+            self.analysen_dir.parent / "cache" / f"{self.analysen_dir.name}_index.json"
+        )
+        self._data = None
+    
+    @classmethod
+    def for_dir(cls, analysen_dir: Path) -> 'AnalyseIndex':
+        """Liefert den geteilten Index für ein Analysen-Verzeichnis"""
+        key = Path(analysen_dir).resolve()
+        if key not in cls._instances:
+            cls._instances[key] = cls(key)
+        return cls._instances[key]
+    
+    def dir_state(self) -> Optional[int]:
+        """Änderungszeit des Verzeichnisses (ändert sich bei neuen/gelöschten Dateien)"""
+        try:
+            return self.analysen_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+    
+    # --- Lookups ---------------------------------------------------------
+    
+    def find_prefix(self, prefix: str) -> Optional[Path]:
+        """Neueste Datei, deren Name mit "<prefix>_" beginnt"""
+        return self._lookup(lambda data: data["praefixe"].get(prefix))
+    
+    def find_substring(self, text: str) -> Optional[Path]:
+        """Neueste Datei, deren Name (ohne .json) text enthält (case-insensitive)
+        
+        Kein Index-Lookup: durchsucht linear alle indizierten Dateinamen
+        (ohne das Verzeichnis zu lesen).
+        """
+        text = text.lower()
+        
+        def suche(data: dict) -> Optional[str]:
+            dateien = data["dateien"]
+            treffer = [name for name in dateien if text in name[:-5].lower()]
+            return max(treffer, key=lambda n: (dateien[n], n)) if treffer else None
+        
+        return self._lookup(suche)
+    
+    def neueste(self) -> Optional[Path]:
+        """Neueste Analyse insgesamt"""
+        return self._lookup(lambda data: data["neueste"])
+    
+    def dateien(self, seit: Optional[float] = None) -> list:
+        """Alle indizierten Analysen (neueste zuerst)
+        
+        Args:
+            seit: Nur Analysen mit mtime >= seit (Unix-Zeitstempel)
+        """
+        dateien = self._ensure()["dateien"]
+        return [
+            self.analysen_dir / name
+            for name in sorted(dateien, key=lambda n: (dateien[n], n), reverse=True)
+            if seit is None or dateien[name] >= seit
+        ]
+    
+    # --- Pflege ------------------------------------------------------------
+    
+    def add(self, filepath: Path, dir_state_vorher: Optional[int]):
+        """Trägt eine gerade gespeicherte Analyse ein
+        
+        Args:
+            filepath: Die neue Datei
+            dir_state_vorher: dir_state() unmittelbar vor dem Schreiben; weicht
+                der gespeicherte Stand davon ab, wird der Index neu aufgebaut
+        """
+        data = self._load()
+        if data is None or data.get("dir_mtime_ns") != dir_state_vorher:
+            self._data = self._rebuild(self.dir_state())
+            return
+        
+        self._insert(data, Path(filepath).name, Path(filepath).stat().st_mtime)
+        data["dir_mtime_ns"] = self.dir_state()
+        self._save(data)
+        self._data = data
+    
+    def _lookup(self, suche: Callable[[dict], Optional[str]]) -> Optional[Path]:
+        """Führt einen Lookup aus und prüft die mtime der gelieferten Datei
+        
+        Args:
+            suche: Liefert aus dem Index den Dateinamen (oder None)
+        """
+        data = self._ensure()
+        name = suche(data)
+        if name is None:
+            return None
+        try:
+            aktuell = (self.analysen_dir / name).stat().st_mtime == data["dateien"][name]
+        except OSError:
+            aktuell = False
+        if not aktuell:
+            # An Ort und Stelle neu geschrieben: Reihenfolge stimmt nicht mehr
+            self._data = self._rebuild(self.dir_state())
+            name = suche(self._data)
+        return self.analysen_dir / name if name else None
+    
+    def _ensure(self) -> dict:
+        """Lädt den Index und baut ihn neu auf, falls er veraltet ist"""
+        state = self.dir_state()
+        if self._data is not None and self._data["dir_mtime_ns"] == state:
+            return self._data
+        
+        data = self._load()
+        if data is None or data.get("dir_mtime_ns") != state:
+            data = self._rebuild(state)
+        self._data = data
+        return data
+    
+    def _load(self) -> Optional[dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if data.get("version") == self.VERSION else None
+    
+    def _rebuild(self, state: Optional[int]) -> dict:
+        data = {"version": self.VERSION, "dir_mtime_ns": state, "dateien": {}, "praefixe": {}, "neueste": None}
+        if self.analysen_dir.exists():
+            for entry in os.scandir(self.analysen_dir):
+                # glob("*.json") ignoriert versteckte Dateien
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file():
+                    self._insert(data, entry.name, entry.stat().st_mtime)
+        self._save(data)
+        return data
+    
+    @staticmethod
+    def _insert(data: dict, name: str, mtime: float):
+        dateien = data["dateien"]
+        dateien[name] = mtime
+        
+        def is_newer(current: Optional[str]) -> bool:
+            return current is None or (mtime, name) >= (dateien[current], current)
+        
+        if is_newer(data["neueste"]):
+            data["neueste"] = name
+        
+        stem = name[:-5]
+        for i, char in enumerate(stem):
+            if char == "_" and is_newer(data["praefixe"].get(stem[:i])):
+                data["praefixe"][stem[:i]] = name
+    
+    def _save(self, data: dict):
+        _atomic_write_json(self.index_path, data, "Analyse-Index")
+
+
+# ============================================================================
+# RANGLISTE
+# ============================================================================
+
+@dataclass
+class RanglistenEintrag:
+    """Eine archivierte Analyse in der Rangliste"""
+    datei: str
+    firma: str = ""
+    position: str = ""
+    deckungsgrad: float = 0.0
+    deckungsgrad_gespeichert: float = 0.0   # Stand beim Speichern der Analyse
+    matching: Optional[MatchingErgebnis] = None
+    mtime: float = 0.0
+
+
+class RanglistenCache:
+    """Merkt sich pro Analyse-Datei die für die Rangliste nötigen Felder
+    
+    Schlüssel ist der Dateiname mit mtime und Größe; nur neue oder geänderte
+    Dateien werden gelesen und geparst. Der Deckungsgrad selbst wird nicht
+    gespeichert, sondern immer gegen die aktuellen KENNTNISSE berechnet.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, analysen_dir: Path, cache_path: Optional[Path] = None):
+        self.analysen_dir = Path(analysen_dir)
+        self.cache_path = Path(cache_path) if cache_path else (
+            self.analysen_dir.parent / "cache" / f"{self.analysen_dir.name}_rangliste.json"
+        )
+        self.gelesen = 0
+    
+    def eintraege(self) -> Iterator[tuple]:
+        """Liefert (Dateiname, mtime, Felder) für jede Analyse, Datei für Datei"""
+        alt = self._load()
+        neu = {}
+        if self.analysen_dir.exists():
+            for entry in os.scandir(self.analysen_dir):
+                # Wie AnalyseIndex: versteckte Dateien und Unterordner ignorieren
+                if not entry.name.endswith(".json") or entry.name.startswith(".") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                eintrag = alt.get(entry.name)
+                if not eintrag or eintrag["mtime_ns"] != stat.st_mtime_ns or eintrag["size"] != stat.st_size:
+                    eintrag = self._read(Path(entry.path), stat)
+                    if eintrag is None:
+                        continue
+                neu[entry.name] = eintrag
+                yield entry.name, stat.st_mtime, eintrag["felder"]
+        
+        if neu != alt:
+            self._save(neu)
+    
+    def _read(self, path: Path, stat) -> Optional[dict]:
+        """Liest die benötigten Felder einer Analyse"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            anforderungen = data.get("anforderungen") or {}
+            felder = {
+                "firma": (data.get("firma") or {}).get("name", ""),
+                "position": (data.get("stelle") or {}).get("titel", ""),
+                "deckungsgrad": (data.get("matching") or {}).get("deckungsgrad", 0.0),
+                "must_have": list(anforderungen.get("must_have", [])),
+                "nice_to_have": list(anforderungen.get("nice_to_have", [])),
+                "soft_skills": list(anforderungen.get("soft_skills", [])),
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️  Analyse übersprungen ({path.name}): {e}")
+            return None
+        self.gelesen += 1
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "felder": felder}
+    
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get("dateien", {}) if data.get("version") == self.VERSION else {}
+    
+    def _save(self, dateien: dict):
+        _atomic_write_json(self.cache_path, {"version": self.VERSION, "dateien": dateien}, "Ranglisten-Cache")
+
+
+def rank_analyses(analysen_dir: Path, matcher: Optional[SkillMatcher] = None,
+                  cache: Optional[RanglistenCache] = None) -> list:
+    """Bewertet alle archivierten Analysen neu und sortiert sie nach Deckungsgrad
+    
+    Ohne LLM: die gespeicherten Anforderungen werden mit den aktuellen
+    KENNTNISSE gematcht (SkillMatcher.match_many für alle auf einmal).
+    
+    Args:
+        analysen_dir: Verzeichnis mit den Analyse-JSONs (output/analysen)
+        matcher: Vorhandener SkillMatcher (Standard: neu erstellt)
+        cache: RanglistenCache (Standard: output/cache/<verzeichnis>_rangliste.json)
+    
+    Returns:
+        Liste von RanglistenEintrag, beste Deckung zuerst (bei Gleichstand neueste)
+    """
+    matcher = matcher or SkillMatcher()
+    cache = cache or RanglistenCache(analysen_dir)
+    
+    eintraege = []
+    anforderungen = []
+    for name, mtime, felder in cache.eintraege():
+        eintraege.append(RanglistenEintrag(
+            datei=name,
+            firma=felder["firma"],
+            position=felder["position"],
+            deckungsgrad_gespeichert=felder["deckungsgrad"],
+            mtime=mtime
+        ))
+        anforderungen.append(Anforderungen(
+            must_have=felder["must_have"],
+            nice_to_have=felder["nice_to_have"],
+            soft_skills=felder["soft_skills"]
+        ))
+    
+    for eintrag, matching in zip(eintraege, matcher.match_many(anforderungen)):
+        eintrag.matching = matching
+        eintrag.deckungsgrad = matching.deckungsgrad
+    
+    eintraege.sort(key=lambda e: (e.deckungsgrad, e.mtime, e.datei), reverse=True)
+    return eintraege
 
 
 # ============================================================================
@@ -992,6 +2541,7 @@ class StellenanzeigenAnalyzer:
         # Cache für analysierte Stellen
         self.cache_dir = Path(__file__).parent.parent / "output" / "analysen"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.analyse_index = AnalyseIndex.for_dir(self.cache_dir)
     
     def analyze(self, stellenanzeige_text: str) -> BewerbungsFirma:
         """Analysiert eine Stellenanzeige vollständig"""
@@ -1004,7 +2554,11 @@ class StellenanzeigenAnalyzer:
         # 2. LLM-Analyse (wenn verfügbar)
         if self.use_llm and self.llm_analyzer and self.llm_analyzer.is_available:
             print("  🤖 Analysiere mit LLM (Ollama)...")
+            metriken = self.llm_analyzer.client.metriken
+            vorher = len(metriken)
             llm_result = self.llm_analyzer.analyze_stellenanzeige(stellenanzeige_text)
+            if len(metriken) > vorher:
+                print(f"     ⏱️  {metriken[-1]}")
             
             if llm_result:
                 # Merge LLM-Ergebnisse (überschreiben leere Felder)
@@ -1014,7 +2568,9 @@ class StellenanzeigenAnalyzer:
         
         # 3. Skill-Matching
         print("  🎯 Führe Skill-Matching durch...")
+        start = time.perf_counter()
         result.matching = self.skill_matcher.match(result.anforderungen)
+        print(f"     ⏱️  Skill-Matching: {(time.perf_counter() - start) * 1000:.2f} ms")
         
         # 4. Prüfe auf fehlende wichtige Daten
         self._check_missing_data(result)
@@ -1106,21 +2662,110 @@ class StellenanzeigenAnalyzer:
             filename = f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
         filepath = self.cache_dir / filename
+        dir_state_vorher = self.analyse_index.dir_state()
+        # Kollisionen vermeiden (Batch-Läufe speichern mehrere Analysen pro Sekunde)
+        counter = 2
+        while filepath.exists():
+            filepath = self.cache_dir / f"{Path(filename).stem}_{counter}.json"
+            counter += 1
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        self.analyse_index.add(filepath, dir_state_vorher)
         
         print(f"💾 Analyse gespeichert: {filepath}")
         return filepath
     
-    def generate_anschreiben_text(self, result: BewerbungsFirma) -> Optional[str]:
-        """Generiert optimierten Anschreiben-Text"""
+    def analyze_batch(self, dateien: list, jobs: Optional[int] = None, llm_jobs: int = 2) -> list:
+        """Analysiert viele Stellenanzeigen parallel und speichert jede als JSON
+        
+        Regex-Extraktion und Skill-Matching laufen in einem Prozess-Pool,
+        LLM-Abfragen über eine begrenzte Anzahl paralleler Threads (Ollama
+        verarbeitet nur wenige Anfragen gleichzeitig sinnvoll).
+        
+        Args:
+            dateien: Pfade zu den Stellenanzeigen
+            jobs: Anzahl Worker-Prozesse (Standard: CPU-Kerne)
+            llm_jobs: Maximal gleichzeitige LLM-Abfragen
+            
+        Returns:
+            Liste von BatchEintrag in der Reihenfolge der Eingabedateien
+        """
+        eintraege = [BatchEintrag(quelle=str(d)) for d in dateien]
+        use_llm = self.use_llm and self.llm_analyzer and self.llm_analyzer.is_available
+        
+        llm_pool = ThreadPoolExecutor(max_workers=max(1, llm_jobs)) if use_llm else None
+        llm_futures = {}
+        
+        try:
+            # 1. Regex + Matching im Prozess-Pool
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                     initargs=(dict(_embedding_config),)) as pool:
+                futures = {
+                    pool.submit(_batch_regex_stage, e.quelle): e
+                    for e in eintraege
+                }
+                for future in as_completed(futures):
+                    eintrag = futures[future]
+                    try:
+                        eintrag.result, zeiten = future.result()
+                        eintrag.zeiten.update(zeiten)
+                    except Exception as e:
+                        eintrag.fehler = str(e)
+                        continue
+                    
+                    # 2. LLM-Abfrage sofort einreihen (überlappt mit Regex-Stufe)
+                    if llm_pool:
+                        llm_futures[llm_pool.submit(self._batch_llm_stage, eintrag)] = eintrag
+            
+            for future in as_completed(llm_futures):
+                eintrag = llm_futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"⚠️  LLM-Fehler bei {Path(eintrag.quelle).name}: {e}")
+        finally:
+            if llm_pool:
+                llm_pool.shutdown(wait=True)
+        
+        # 3. Speichern (sequentiell, damit Dateinamen eindeutig bleiben)
+        for eintrag in eintraege:
+            if eintrag.result is None:
+                continue
+            start = time.perf_counter()
+            eintrag.gespeichert = str(self.save_analysis(eintrag.result))
+            eintrag.zeiten["speichern"] = time.perf_counter() - start
+        
+        return eintraege
+    
+    def _batch_llm_stage(self, eintrag: BatchEintrag):
+        """LLM-Analyse eines Batch-Eintrags inkl. erneutem Matching
+        
+        Läuft in den LLM-Threads des Hauptprozesses; alle Threads nutzen
+        self.skill_matcher (dessen Treffer-Cache ist dafür abgesichert).
+        """
+        start = time.perf_counter()
+        llm_result = self.llm_analyzer.analyze_stellenanzeige(eintrag.result.rohtext)
+        eintrag.zeiten["llm"] = time.perf_counter() - start
+        
+        if llm_result:
+            self._merge_llm_results(eintrag.result, llm_result)
+            # Anforderungen haben sich geändert → Matching neu berechnen
+            start = time.perf_counter()
+            eintrag.result.matching = self.skill_matcher.match(eintrag.result.anforderungen)
+            eintrag.zeiten["matching"] += time.perf_counter() - start
+    
+    def generate_anschreiben_text(self, result: BewerbungsFirma,
+                                  on_chunk: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """Generiert optimierten Anschreiben-Text (optional gestreamt über on_chunk)"""
         if not self.llm_analyzer or not self.llm_analyzer.is_available:
             return None
         
         return self.llm_analyzer.generate_skill_paragraphs(
             result.matching.top_matches,
             result.firma.name,
-            result.stelle.titel
+            result.stelle.titel,
+            on_chunk=on_chunk
         )
 
 
@@ -1225,6 +2870,65 @@ def print_analysis_report(result: BewerbungsFirma):
     print("\n" + "="*60)
 
 
+def print_batch_report(eintraege: list, gesamtzeit: float):
+    """Gibt Übersichtstabelle und Stufen-Zeiten eines Batch-Laufs aus"""
+    print("\n" + "="*78)
+    print("📊 BATCH-ÜBERSICHT")
+    print("="*78)
+    print(f"{'Datei':<24} {'Firma':<24} {'Deckung':>8} {'Must':>5} {'Nice':>5}  Status")
+    print("-"*78)
+    
+    for e in sorted(eintraege, key=lambda x: -(x.result.matching.deckungsgrad if x.result else -1)):
+        datei = Path(e.quelle).name[:24]
+        if e.result is None:
+            print(f"{datei:<24} {'-':<24} {'-':>8} {'-':>5} {'-':>5}  ❌ {e.fehler}")
+            continue
+        firma = (e.result.firma.name or "❌ FEHLT")[:24]
+        anf = e.result.anforderungen
+        print(
+            f"{datei:<24} {firma:<24} {e.result.matching.deckungsgrad:>7.1f}% "
+            f"{len(anf.must_have):>5} {len(anf.nice_to_have):>5}  ✅"
+        )
+    
+    # Zeiten pro Stufe (Summe über alle Anzeigen und Durchschnitt)
+    erfolgreich = [e for e in eintraege if e.result is not None]
+    print("\n⏱️  Zeiten pro Stufe:")
+    for stufe in ("regex", "matching", "llm", "speichern"):
+        werte = [e.zeiten[stufe] for e in erfolgreich if stufe in e.zeiten]
+        if werte:
+            summe = sum(werte)
+            print(f"   {stufe:<10} Σ {summe:8.3f}s   Ø {summe / len(werte) * 1000:8.1f}ms   ({len(werte)}x)")
+    
+    print(f"\n   Gesamt: {gesamtzeit:.2f}s für {len(eintraege)} Anzeigen "
+          f"({len(erfolgreich)} erfolgreich, {len(eintraege) - len(erfolgreich)} fehlgeschlagen)")
+    print("="*78)
+
+
+def print_ranking(eintraege: list, gesamtzeit: float, limit: Optional[int] = 20, gelesen: int = 0):
+    """Gibt die Rangliste der archivierten Analysen aus"""
+    print("\n" + "="*78)
+    print("🏆 RANGLISTE DER STELLENANZEIGEN")
+    print("="*78)
+    print(f"{'#':>4} {'Deckung':>8} {'Δ':>6}  {'Firma':<24} {'Position':<30}")
+    print("-"*78)
+    
+    for rang, e in enumerate(eintraege[:limit] if limit else eintraege, 1):
+        delta = e.deckungsgrad - e.deckungsgrad_gespeichert
+        delta_text = f"{delta:+5.1f}" if abs(delta) >= 0.05 else ""
+        print(
+            f"{rang:>4} {e.deckungsgrad:>7.1f}% {delta_text:>6}  "
+            f"{(e.firma or '❌ FEHLT')[:24]:<24} {e.position[:30]:<30}"
+        )
+    
+    if limit and len(eintraege) > limit:
+        print(f"   ... {len(eintraege) - limit} weitere")
+    
+    print(f"\n   {len(eintraege)} Analysen in {gesamtzeit * 1000:.0f} ms "
+          f"({gelesen} neu gelesen, {len(eintraege) - gelesen} aus dem Cache)")
+    print("   Δ = Änderung gegenüber dem gespeicherten Deckungsgrad (aktuelle KENNTNISSE)")
+    print("="*78)
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
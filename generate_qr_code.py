@@ -7,24 +7,34 @@ Autor: Marcus Moser
 Datum: 05.02.2026
 """
 
-import qrcode
+import io
+import os
+import base64
+import hashlib
 from pathlib import Path
-from PIL import Image
+from typing import Optional
 
+# Cache der fertigen PNGs: output/cache/qr/<hash>.png
+QR_CACHE_DIR = Path(__file__).parent / 'output' / 'cache' / 'qr'
 
-def generate_qr_code(url: str, output_path: Path, size_cm: float = 2.5, dpi: int = 300) -> Path:
-    """
-    Generiert einen QR-Code aus einer URL mit exakter Größe.
-    
-    Args:
-        url: Die URL, die im QR-Code kodiert werden soll
-        output_path: Pfad für die Ausgabedatei
-        size_cm: Gewünschte Größe in Zentimetern (Standard: 2.5cm)
-        dpi: Auflösung in DPI (Standard: 300 für Druckqualität)
+# Fehlerkorrektur-Stufen (L 7%, M 15%, Q 25%, H 30%)
+ERROR_CORRECTION_LEVELS = ('L', 'M', 'Q', 'H')
+
+# PNG-Bytes pro Cache-Schlüssel (pro Prozess)
+_QR_PNG_CACHE = {}
+
+
+def qr_cache_key(url: str, size_cm: float, dpi: int, error_correction: str) -> str:
+    """Inhalts-Schlüssel eines QR-Codes: gleiche Eingaben ergeben dasselbe Bild"""
+    daten = f"{url}\0{float(size_cm)}\0{int(dpi)}\0{error_correction}"
+    return hashlib.sha256(daten.encode('utf-8')).hexdigest()[:32]
+
+
+def _encode_qr_png(url: str, size_cm: float, dpi: int, error_correction: str) -> bytes:
+    """Kodiert die URL, skaliert auf die exakte Größe und liefert das PNG"""
+    import qrcode
+    from PIL import Image
     
-    Returns:
-        Path: Pfad zur erstellten QR-Code-Datei
-    """
     # Berechne Pixel-Größe: 1 inch = 2.54 cm
     # size_px = (size_cm / 2.54) * dpi
     size_px = int((size_cm / 2.54) * dpi)
@@ -32,7 +42,7 @@ def generate_qr_code(url: str, output_path: Path, size_cm: float = 2.5, dpi: int
     # QR-Code erstellen
     qr = qrcode.QRCode(
         version=1,  # Automatische Größenanpassung
-        error_correction=qrcode.constants.ERROR_CORRECT_M,  # 15% Fehlerkorrektur
+        error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{error_correction}"),
         box_size=10,  # Größe jedes "Boxes" im QR-Code
         border=2,  # Rand um den QR-Code (mindestens 4 für Standards)
     )
@@ -46,10 +56,89 @@ def generate_qr_code(url: str, output_path: Path, size_cm: float = 2.5, dpi: int
     # Auf exakte Größe skalieren
     img = img.resize((size_px, size_px), Image.Resampling.LANCZOS)
     
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', dpi=(dpi, dpi))
+    return buffer.getvalue()
+
+
+def qr_code_png(url: str, size_cm: float = 2.5, dpi: int = 300, error_correction: str = 'M',
+                cache_dir: Optional[Path] = None) -> bytes:
+    """
+    Liefert den QR-Code als PNG-Bytes aus dem Cache.
+    
+    Erst Speicher, dann output/cache/qr/; nur bei einem Fehltreffer wird
+    kodiert und skaliert.
+    
+    Args:
+        url: Die URL, die im QR-Code kodiert werden soll
+        size_cm: Gewünschte Größe in Zentimetern
+        dpi: Auflösung in DPI
+        error_correction: Fehlerkorrektur-Stufe L, M, Q oder H
+        cache_dir: Alternatives Cache-Verzeichnis (Standard: output/cache/qr)
+    """
+    if error_correction not in ERROR_CORRECTION_LEVELS:
+        raise ValueError(f"Unbekannte Fehlerkorrektur: {error_correction} (erlaubt: L, M, Q, H)")
+    
+    key = qr_cache_key(url, size_cm, dpi, error_correction)
+    png = _QR_PNG_CACHE.get(key)
+    if png is not None:
+        return png
+    
+    cache_path = Path(cache_dir or QR_CACHE_DIR) / f"{key}.png"
+    try:
+        png = cache_path.read_bytes()
+    except OSError:
+        png = _encode_qr_png(url, size_cm, dpi, error_correction)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(png)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠️  QR-Cache nicht beschreibbar: {e}")
+    
+    _QR_PNG_CACHE[key] = png
+    return png
+
+
+def qr_code_data_uri(url: str, size_cm: float = 2.5, dpi: int = 300, error_correction: str = 'M') -> str:
+    """QR-Code als data:-URI zum direkten Einbetten ins HTML (es wird keine Datei geschrieben)"""
+    png = qr_code_png(url, size_cm, dpi, error_correction)
+    return "data:image/png;base64," + base64.b64encode(png).decode('ascii')
+
+
+def generate_qr_code(url: str, output_path: Path, size_cm: float = 2.5, dpi: int = 300,
+                     error_correction: str = 'M') -> Path:
+    """
+    Generiert einen QR-Code aus einer URL mit exakter Größe.
+    
+    Das Bild kommt aus dem QR-Cache; die Ausgabedatei wird nur geschrieben,
+    wenn sie fehlt oder einen anderen QR-Code enthält.
+    
+    Args:
+        url: Die URL, die im QR-Code kodiert werden soll
+        output_path: Pfad für die Ausgabedatei
+        size_cm: Gewünschte Größe in Zentimetern (Standard: 2.5cm)
+        dpi: Auflösung in DPI (Standard: 300 für Druckqualität)
+        error_correction: Fehlerkorrektur-Stufe L, M, Q oder H (Standard: M, 15%)
+    
+    Returns:
+        Path: Pfad zur erstellten QR-Code-Datei
+    """
+    png = qr_code_png(url, size_cm, dpi, error_correction)
+    
+    try:
+        if output_path.stat().st_size == len(png) and output_path.read_bytes() == png:
+            print(f"♻️  QR-Code unverändert: {output_path}")
+            return output_path
+    except OSError:
+        pass
+    
     # Speichern
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output_path, dpi=(dpi, dpi))
+    output_path.write_bytes(png)
     
+    size_px = int((size_cm / 2.54) * dpi)
     print(f"✅ QR-Code erstellt: {output_path}")
     print(f"   URL: {url}")
     print(f"   Größe: {size_cm}cm x {size_cm}cm ({size_px}px x {size_px}px @ {dpi}dpi)")
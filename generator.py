@@ -6,10 +6,20 @@ Datum: 04.02.2026
 """
 
 import os
+import re
 import sys
+import time
+import hashlib
+import argparse
+import functools
 from pathlib import Path
-from weasyprint import HTML, CSS
+from collections import OrderedDict
+from urllib.parse import urlsplit
 from datetime import datetime
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 import json
 
 # Projekt-Pfade
@@ -25,6 +35,55 @@ from persoenliche_daten import (  # type: ignore
     PERSOENLICHE_DATEN, BERUFSERFAHRUNG, 
     AUSBILDUNG, KENNTNISSE, SPRACHEN, ZERTIFIKATE
 )
+from template_engine import RawHTML, render_template
+
+
+@dataclass
+class ApplicationContext:
+    """Daten eines Generator-Laufs
+    
+    Lädt die Analyse-JSON genau einmal und wird an generate_anschreiben und
+    generate_lebenslauf übergeben, statt dass jede Stufe die Analyse erneut
+    sucht und parst. Sammelt nebenbei die Laufzeit pro Stufe.
+    """
+    bewerbung: dict = field(default_factory=dict)
+    analyse: Optional[dict] = None          # Zur Firma passende Analyse
+    analyse_path: Optional[Path] = None
+    analysen_dir: Path = OUTPUT_DIR / 'analysen'
+    output_dir: Path = OUTPUT_DIR
+    zeiten: dict = field(default_factory=dict)
+    json_geladen: int = 0                   # Anzahl gelesener Analyse-Dateien
+    _analysen: dict = field(default_factory=dict, repr=False)
+    
+    def load_analysis(self, path: Path) -> Optional[dict]:
+        """Liest eine Analyse-Datei (pro Pfad nur einmal)"""
+        if path not in self._analysen:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._analysen[path] = json.load(f)
+                self.json_geladen += 1
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Fehler beim Laden der Analyse {path.name}: {e}")
+                self._analysen[path] = None
+        return self._analysen[path]
+    
+    @contextmanager
+    def messen(self, stufe: str):
+        """Misst die Laufzeit einer Stufe (mehrfache Aufrufe werden summiert)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.zeiten[stufe] = self.zeiten.get(stufe, 0.0) + time.perf_counter() - start
+
+
+@dataclass
+class RenderAuftrag:
+    """Fertiges HTML eines Dokuments, bereit zum Rendern (auch in einem Worker-Prozess)"""
+    dokument: str               # "Anschreiben" oder "Lebenslauf"
+    html: str
+    output_path: Path
+    build_hash: Optional[str] = None
 
 
 def find_matching_analysis(firma_name: str, analysen_dir: Path):
@@ -40,56 +99,57 @@ def find_matching_analysis(firma_name: str, analysen_dir: Path):
     if not analysen_dir.exists():
         return None
     
+    from data.bewerbungs_firma import AnalyseIndex
+    
+    # Alle Lookups über den Index (kein glob/stat des Verzeichnisses)
+    index = AnalyseIndex.for_dir(analysen_dir)
+    
     # 1. Versuch: Exakter Match mit vollem Namen
     firma_normalized = firma_name.replace(' ', '_')
-    matches = list(analysen_dir.glob(f"{firma_normalized}_*.json"))
-    if matches:
-        return max(matches, key=lambda p: p.stat().st_mtime)
+    match = index.find_prefix(firma_normalized)
+    if match:
+        return match
     
     # 2. Versuch: Nur erstes Wort (z.B. "Prominent Group" → "Prominent")
-    first_word = firma_name.split()[0] if firma_name else ""
+    first_word = firma_name.split()[0] if firma_name.strip() else ""
     if first_word:
-        matches = list(analysen_dir.glob(f"{first_word}_*.json"))
-        if matches:
-            return max(matches, key=lambda p: p.stat().st_mtime)
+        match = index.find_prefix(first_word)
+        if match:
+            return match
     
     # 3. Versuch: Teilstring-Matching in Dateinamen
-    matches = []
     if first_word:
-        for file in analysen_dir.glob("*.json"):
-            if first_word.lower() in file.stem.lower():
-                matches.append(file)
-        if matches:
-            return max(matches, key=lambda p: p.stat().st_mtime)
+        match = index.find_substring(first_word)
+        if match:
+            return match
     
     # 4. Fallback: Neueste Datei generell
-    all_files = list(analysen_dir.glob("*.json"))
-    if all_files:
-        return max(all_files, key=lambda p: p.stat().st_mtime)
-    
-    return None
+    return index.neueste()
 
 
-def load_latest_bewerbung():
-    """Lädt die neueste Stellenanzeigen-Analyse und konvertiert zu BEWERBUNG"""
-    analysen_dir = OUTPUT_DIR / 'analysen'
+def load_latest_bewerbung(context: ApplicationContext, analyse_path: Optional[Path] = None):
+    """Lädt die neueste (oder eine bestimmte) Stellenanzeigen-Analyse und konvertiert zu BEWERBUNG"""
+    if analyse_path:
+        latest_file = analyse_path
+    else:
+        analysen_dir = context.analysen_dir
+        
+        if not analysen_dir.exists():
+            return None
+        
+        from data.bewerbungs_firma import AnalyseIndex
+        
+        # Neueste Datei nach Änderungsdatum (aus dem Analyse-Index)
+        latest_file = AnalyseIndex.for_dir(analysen_dir).neueste()
     
-    if not analysen_dir.exists():
+    if not latest_file:
         return None
     
-    # Finde alle JSON-Dateien
-    json_files = list(analysen_dir.glob("*.json"))
-    
-    if not json_files:
+    data = context.load_analysis(latest_file)
+    if data is None:
         return None
     
-    # Neueste Datei nach Änderungsdatum
-    latest_file = max(json_files, key=lambda p: p.stat().st_mtime)
-    
     try:
-        with open(latest_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
         # Konvertiere zu BEWERBUNG-Format
         bewerbung = {
             "firma": data.get('firma', {}).get('name', ''),
@@ -113,9 +173,9 @@ def load_latest_bewerbung():
         return None
 
 
-def get_bewerbung():
-    """Lädt BEWERBUNG aus neuester Analyse oder verwendet Fallback"""
-    bewerbung = load_latest_bewerbung()
+def get_bewerbung(context: ApplicationContext, analyse_path: Optional[Path] = None):
+    """Lädt BEWERBUNG aus neuester (oder angegebener) Analyse oder verwendet Fallback"""
+    bewerbung = load_latest_bewerbung(context, analyse_path)
     
     if bewerbung:
         return bewerbung
@@ -136,84 +196,111 @@ def get_bewerbung():
     }
 
 
-# Lade Bewerbungsdaten
-BEWERBUNG = get_bewerbung()
+def load_application_context(analysen_dir: Optional[Path] = None,
+                             output_dir: Optional[Path] = None,
+                             analyse_path: Optional[Path] = None) -> ApplicationContext:
+    """Lädt Bewerbungsdaten und die passende Analyse für einen Generator-Lauf
+    
+    Args:
+        analysen_dir: Analysen-Verzeichnis (Standard: output/analysen)
+        output_dir: Zielverzeichnis der PDFs (Standard: output)
+        analyse_path: Bestimmte Analyse statt der neuesten verwenden
+    """
+    context = ApplicationContext(
+        analysen_dir=analysen_dir or OUTPUT_DIR / 'analysen',
+        output_dir=output_dir or OUTPUT_DIR
+    )
+    
+    with context.messen("Analyse laden"):
+        context.bewerbung = get_bewerbung(context, analyse_path)
+        
+        if analyse_path:
+            context.analyse_path = analyse_path
+        else:
+            # Neueste Analyse für diese Firma mit Fuzzy-Matching - meist dieselbe
+            # Datei wie oben und damit bereits geladen
+            firma_name = context.bewerbung.get('firma', '')
+            context.analyse_path = find_matching_analysis(firma_name, context.analysen_dir)
+        if context.analyse_path:
+            context.analyse = context.load_analysis(context.analyse_path)
+    
+    return context
 
 
-def load_custom_anschreiben_text():
+def load_custom_anschreiben_text(context: ApplicationContext):
     """Generiert personalisierten Anschreiben-Text mit LLM basierend auf Analyse"""
     from data.bewerbungs_firma import OllamaClient, LLMAnalyzer
     
-    firma_name = BEWERBUNG.get('firma', '')
+    bewerbung = context.bewerbung
+    data = context.analyse
     
-    # Suche neueste Analyse für diese Firma mit Fuzzy-Matching
-    analysen_dir = OUTPUT_DIR / 'analysen'
-    latest_file = find_matching_analysis(firma_name, analysen_dir)
-    
-    if latest_file:
-            
-            try:
-                with open(latest_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+    if data is not None:
+        try:
+            # Prüfe ob Ollama verfügbar ist
+            analyzer = LLMAnalyzer()
+            if analyzer.is_available:
+                print("🤖 Generiere personalisierten Anschreiben-Text mit LLM...")
                 
-                # Prüfe ob Ollama verfügbar ist
-                analyzer = LLMAnalyzer()
-                if analyzer.is_available:
-                    print("🤖 Generiere personalisierten Anschreiben-Text mit LLM...")
-                    
-                    # Hole Top-Matches aus Analyse
-                    top_matches = data.get('matching', {}).get('top_matches', [])
-                    firma_name = BEWERBUNG['firma']
-                    position = BEWERBUNG['position']
+                # Hole Top-Matches aus Analyse
+                top_matches = data.get('matching', {}).get('top_matches', [])
+                firma_name = bewerbung['firma']
+                position = bewerbung['position']
+                
+                # Text live ausgeben, während das LLM ihn erzeugt
+                print("-" * 60)
+                metriken_vorher = len(analyzer.client.metriken)
+                llm_text = analyzer.generate_skill_paragraphs(
+                    matches=top_matches,
+                    firma_name=firma_name,
+                    position=position,
+                    on_chunk=lambda chunk: print(chunk, end="", flush=True)
+                )
+                print("\n" + "-" * 60)
+                if len(analyzer.client.metriken) > metriken_vorher:
+                    print(f"⏱️  {analyzer.client.metriken[-1]}")
+                
+                if llm_text and len(llm_text.strip()) > 50:
+                    # Bereinige potenzielle Formatierungs-Artefakte
+                    cleanup_patterns = [
+                        "```html", "```", "<html>", "</html>",
+                        "<body>", "</body>", "<div>", "</div>",
+                        "[Ihr Name]", "[Your Name]", "[NAME]"
+                    ]
+                    for pattern in cleanup_patterns:
+                        llm_text = llm_text.replace(pattern, "")
+                    llm_text = llm_text.strip()
                     
-                    llm_text = analyzer.generate_skill_paragraphs(
-                        matches=top_matches,
-                        firma_name=firma_name,
-                        position=position
-                    )
+                    # Entferne Anrede-Zeilen und Grußformeln (falls LLM sie trotzdem generiert hat)
+                    lines = llm_text.split('\n')
+                    filtered_lines = []
+                    for line in lines:
+                        line_lower = line.strip().lower()
+                        # Filtere Zeilen mit Anreden und Grußformeln heraus
+                        if not any(phrase in line_lower for phrase in [
+                            'sehr geehrte', 'sehr geehrter', 'liebe', 'lieber',
+                            'hallo', 'guten tag', 'mit freundlichen grüßen',
+                            'mit freundlichem gruß', 'hochachtungsvoll'
+                        ]):
+                            filtered_lines.append(line)
+                    llm_text = '\n'.join(filtered_lines)
                     
-                    if llm_text and len(llm_text.strip()) > 50:
-                        # Bereinige potenzielle Formatierungs-Artefakte
-                        cleanup_patterns = [
-                            "```html", "```", "<html>", "</html>",
-                            "<body>", "</body>", "<div>", "</div>",
-                            "[Ihr Name]", "[Your Name]", "[NAME]"
-                        ]
-                        for pattern in cleanup_patterns:
-                            llm_text = llm_text.replace(pattern, "")
-                        llm_text = llm_text.strip()
-                        
-                        # Entferne Anrede-Zeilen und Grußformeln (falls LLM sie trotzdem generiert hat)
-                        lines = llm_text.split('\n')
-                        filtered_lines = []
-                        for line in lines:
-                            line_lower = line.strip().lower()
-                            # Filtere Zeilen mit Anreden und Grußformeln heraus
-                            if not any(phrase in line_lower for phrase in [
-                                'sehr geehrte', 'sehr geehrter', 'liebe', 'lieber',
-                                'hallo', 'guten tag', 'mit freundlichen grüßen',
-                                'mit freundlichem gruß', 'hochachtungsvoll'
-                            ]):
-                                filtered_lines.append(line)
-                        llm_text = '\n'.join(filtered_lines)
-                        
-                        # Formatiere als HTML-Absätze
-                        # Zuerst versuche mit doppelten Zeilenumbrüchen, dann mit einfachen
-                        if '\n\n' in llm_text:
-                            paragraphs = [p.strip() for p in llm_text.strip().split('\n\n') if p.strip()]
-                        else:
-                            # Bei einfachen Zeilenumbrüchen: Jede nicht-leere Zeile wird ein Absatz
-                            paragraphs = [line.strip() for line in llm_text.strip().split('\n') if line.strip()]
-                        
-                        html_text = '\n\n'.join([f"            <p>\n                {p}\n            </p>" for p in paragraphs])
-                        return html_text
+                    # Formatiere als HTML-Absätze
+                    # Zuerst versuche mit doppelten Zeilenumbrüchen, dann mit einfachen
+                    if '\n\n' in llm_text:
+                        paragraphs = [p.strip() for p in llm_text.strip().split('\n\n') if p.strip()]
                     else:
-                        print("⚠️  LLM konnte keinen Text generieren, verwende Fallback")
+                        # Bei einfachen Zeilenumbrüchen: Jede nicht-leere Zeile wird ein Absatz
+                        paragraphs = [line.strip() for line in llm_text.strip().split('\n') if line.strip()]
+                    
+                    html_text = '\n\n'.join([f"            <p>\n                {p}\n            </p>" for p in paragraphs])
+                    return html_text
                 else:
-                    print("⚠️  Ollama nicht verfügbar, verwende Fallback-Text")
-                
-            except Exception as e:
-                print(f"⚠️  Fehler bei LLM-Generierung: {e}")
+                    print("⚠️  LLM konnte keinen Text generieren, verwende Fallback")
+            else:
+                print("⚠️  Ollama nicht verfügbar, verwende Fallback-Text")
+            
+        except Exception as e:
+            print(f"⚠️  Fehler bei LLM-Generierung: {e}")
     
     # Fallback: Minimaler Standard-Text wenn kein LLM verfügbar
     return """<p>
@@ -234,7 +321,16 @@ def load_custom_anschreiben_text():
             </p>"""
 
 
-def select_relevant_kurse(kurse_liste, max_count=8):
+_kurse_config = {"debug": False}
+
+
+def configure_kurse(debug: bool = False):
+    """debug=True zeigt die Scores der Kursauswahl (z.B. aus --debug-kurse)"""
+    _kurse_config["debug"] = debug
+
+
+def select_relevant_kurse(kurse_liste, max_count=8, context: Optional[ApplicationContext] = None,
+                          nur_treffer: bool = False):
     """
     Wählt die relevantesten Kurse basierend auf der aktuellen Stellenanalyse aus.
     Nutzt Keyword-Scoring für zuverlässige und schnelle Auswahl.
@@ -242,26 +338,19 @@ def select_relevant_kurse(kurse_liste, max_count=8):
     Args:
         kurse_liste: Liste aller verfügbaren Kursnamen
         max_count: Maximale Anzahl der zurückgegebenen Kurse (Standard: 8)
+        context: Kontext des Generator-Laufs mit der bereits geladenen Analyse
+        nur_treffer: Kurse mit Score 0 weglassen (auch wenn max_count nicht erreicht ist);
+            ohne Stellenanalyse wird dann kein Kurs ausgewählt
     
     Returns:
         Liste der ausgewählten Kurse (max. max_count Elemente)
     """
     # Falls weniger als max_count Kurse vorhanden, gib alle zurück
-    if len(kurse_liste) <= max_count:
+    if len(kurse_liste) <= max_count and not nur_treffer:
         return kurse_liste
     
-    # Versuche Stellenanalyse zu laden mit Fuzzy-Matching
-    firma_name = BEWERBUNG.get('firma', '')
-    analysen_dir = OUTPUT_DIR / 'analysen'
-    stellenanalyse = None
-    
-    latest_file = find_matching_analysis(firma_name, analysen_dir)
-    if latest_file:
-        try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                stellenanalyse = json.load(f)
-        except Exception as e:
-            print(f"⚠️  Fehler beim Laden der Stellenanalyse für Kurse: {e}")
+    # Stellenanalyse wurde bereits beim Start geladen
+    stellenanalyse = context.analyse if context else None
     
     # Keyword-Scoring basierend auf Stellenanalyse
     if stellenanalyse:
@@ -375,9 +464,11 @@ def select_relevant_kurse(kurse_liste, max_count=8):
             
             # Sortiere nach Score (absteigend)
             kurse_mit_scores.sort(key=lambda x: -x[1])
+            if nur_treffer:
+                kurse_mit_scores = [(kurs, score) for kurs, score in kurse_mit_scores if score > 0]
             
             # Debug-Output für --debug-kurse Flag
-            if '--debug-kurse' in sys.argv:
+            if _kurse_config["debug"]:
                 print("\n🎯 Kurs-Scoring Details:")
                 for kurs, score in kurse_mit_scores[:max_count]:
                     print(f"   {kurs}: {score:.1f} Punkte")
@@ -400,6 +491,11 @@ def select_relevant_kurse(kurse_liste, max_count=8):
         except Exception as e:
             print(f"⚠️  Fehler beim Keyword-Scoring: {e}")
     
+    # Ohne Stellenanalyse gibt es keine Treffer
+    if nur_treffer:
+        print(f"ℹ️  Keine Stellenanalyse gefunden - keine Kurse mit Bezug zur Stelle")
+        return []
+    
     # Fallback: Statische Priorisierung (wenn keine Stellenanalyse vorhanden)
     print(f"ℹ️  Keine Stellenanalyse gefunden - nutze statische Priorisierung")
     
@@ -434,39 +530,492 @@ def select_relevant_kurse(kurse_liste, max_count=8):
     return sorted_kurse[:max_count]
 
 
-def generate_anschreiben():
-    """Generiert das Bewerbungsanschreiben als PDF"""
-    print("📄 Generiere Anschreiben...")
+# Geparste Stylesheets pro Prozess: (Pfad, mtime) -> CSS
+_STYLESHEET_CACHE = {}
+
+# Eine FontConfiguration für alle Dokumente eines Prozesses
+_font_config = None
+
+
+def get_font_config():
+    """Geteilte FontConfiguration (Schriften werden einmal pro Prozess geladen)"""
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def get_stylesheet(css_path: Optional[Path] = None):
+    """Geparstes Stylesheet aus dem Cache; wird neu geparst, sobald sich die Datei ändert
     
-    # QR-Code für Website generieren
-    from generate_qr_code import generate_qr_code
-    website_url = PERSOENLICHE_DATEN.get('website', '')
-    if website_url:
-        qr_output_path = BASE_DIR / 'images' / 'qr_code.png'
-        generate_qr_code(website_url, qr_output_path, size_cm=2.5)
+    Args:
+        css_path: Pfad zur CSS-Datei (Standard: templates/styles.css)
+    """
+    css_path = Path(css_path or TEMPLATES_DIR / 'styles.css')
+    key = (str(css_path), css_path.stat().st_mtime_ns)
+    
+    stylesheet = _STYLESHEET_CACHE.get(key)
+    if stylesheet is None:
+        from weasyprint import CSS
         
-        # QR-Code ins Template-Verzeichnis kopieren
-        qr_template_path = TEMPLATES_DIR / 'qr_code.png'
-        import shutil
-        shutil.copy2(qr_output_path, qr_template_path)
+        # Veraltete Stände derselben Datei verwerfen
+        for alt in [k for k in _STYLESHEET_CACHE if k[0] == key[0]]:
+            del _STYLESHEET_CACHE[alt]
+        stylesheet = CSS(filename=key[0], font_config=get_font_config(), url_fetcher=get_url_fetcher())
+        _STYLESHEET_CACHE[key] = stylesheet
+    return stylesheet
+
+
+# Lokale Assets (Profilbild, Icons, QR-Code) pro Prozess: (Pfad, mtime) -> (Bytes, MIME-Typ)
+ASSET_CACHE_SIZE = 64
+_ASSET_CACHE = OrderedDict()
+
+
+def load_asset(path: Path) -> tuple:
+    """Liest eine lokale Datei über den LRU-Cache
+    
+    Schlüssel sind Pfad und Änderungszeit: eine geänderte Datei wird neu
+    gelesen, unveränderte kommen aus dem Speicher.
+    
+    Returns:
+        (Inhalt als Bytes, MIME-Typ oder None)
+    
+    Raises:
+        OSError: Wenn die Datei nicht lesbar ist
+    """
+    path = Path(path)
+    key = (str(path), path.stat().st_mtime_ns)
+    
+    eintrag = _ASSET_CACHE.get(key)
+    if eintrag is not None:
+        _ASSET_CACHE.move_to_end(key)
+        return eintrag
+    
+    # Veraltete Stände derselben Datei verwerfen
+    for alt in [k for k in _ASSET_CACHE if k[0] == key[0]]:
+        del _ASSET_CACHE[alt]
+    import mimetypes
+    eintrag = (path.read_bytes(), mimetypes.guess_type(path.name)[0])
+    _ASSET_CACHE[key] = eintrag
+    while len(_ASSET_CACHE) > ASSET_CACHE_SIZE:
+        _ASSET_CACHE.popitem(last=False)
+    return eintrag
+
+
+# SVG-Icons im Lebenslauf (Programmiersprachen, Flaggen, Zertifikate, Links)
+ICONS_DIR = BASE_DIR / 'images' / 'icons'
+
+_icon_config = {"raster_dpi": None, "gewarnt": False}
+
+# Von WeasyPrint geladene Bilder pro Prozess: URL -> Bild (jedes SVG wird einmal geparst)
+_IMAGE_CACHE = {}
+# Änderungszeit der Datei hinter jeder geladenen URL
+_IMAGE_MTIMES = {}
+
+
+def configure_icons(raster_dpi: Optional[int] = None):
+    """raster_dpi setzt die SVG-Icons vorab als PNG in dieser Auflösung um (z.B. aus --raster-icons)"""
+    if raster_dpi != _icon_config["raster_dpi"]:
+        _IMAGE_CACHE.clear()
+        _IMAGE_MTIMES.clear()
+    _icon_config["raster_dpi"] = raster_dpi
+
+
+def rasterize_icon(svg_path: Path, dpi: int) -> Optional[Path]:
+    """PNG eines SVG-Icons in der Ziel-Auflösung (liegt neben dem SVG als <name>@<dpi>dpi.png)
+    
+    Wird nur erzeugt, wenn es fehlt oder älter als das SVG ist. Ohne cairosvg
+    (optional) bleibt es beim SVG.
+    
+    Returns:
+        Pfad zum PNG oder None, wenn nicht gerastert werden kann
+    """
+    png_path = svg_path.with_name(f"{svg_path.stem}@{dpi}dpi.png")
+    try:
+        if png_path.stat().st_mtime_ns >= svg_path.stat().st_mtime_ns:
+            return png_path
+    except OSError:
+        pass
+    
+    try:
+        import cairosvg
+    except ImportError:
+        if not _icon_config["gewarnt"]:
+            print("⚠️  cairosvg nicht installiert - Icons bleiben SVG (pip install cairosvg)")
+            _icon_config["gewarnt"] = True
+        return None
+    
+    # SVG-Einheiten sind CSS-Pixel (96 dpi)
+    tmp_path = png_path.with_name(f"{png_path.name}.{os.getpid()}.tmp")
+    cairosvg.svg2png(url=str(svg_path), write_to=str(tmp_path), scale=dpi / 96)
+    os.replace(tmp_path, png_path)
+    return png_path
+
+
+def _load_local_asset(url: str) -> Optional[tuple]:
+    """Lokale Datei hinter einer file:-URL aus dem Asset-Cache
+    
+    SVG-Icons werden auf Wunsch durch das vorgerasterte PNG ersetzt; die
+    Änderungszeit der Quelle landet in _IMAGE_MTIMES (für get_image_cache).
+    
+    Returns:
+        (Inhalt als Bytes, MIME-Typ oder None, Pfad) oder None, wenn die URL
+        nicht lokal oder die Datei nicht lesbar ist
+    """
+    if not url.startswith('file:'):
+        return None
+    
+    from urllib.request import url2pathname
+    path = Path(url2pathname(urlsplit(url).path))
+    quelle = path
+    
+    dpi = _icon_config["raster_dpi"]
+    if dpi and path.suffix == '.svg' and path.parent == ICONS_DIR:
+        path = rasterize_icon(path, dpi) or path
+    
+    try:
+        data, mime_type = load_asset(path)
+        _IMAGE_MTIMES[url] = quelle.stat().st_mtime_ns
+    except OSError:
+        return None  # Fehlermeldung wie gewohnt vom Standard-Fetcher
+    return data, mime_type, path
+
+
+def asset_url_fetcher(url: str, *args, **kwargs) -> dict:
+    """url_fetcher als Funktion für WeasyPrint vor der URLFetcher-Klasse
+    
+    Neuere Versionen bekommen AssetURLFetcher (siehe get_url_fetcher).
+    """
+    asset = _load_local_asset(url)
+    if asset is not None:
+        data, mime_type, path = asset
+        return {'string': data, 'mime_type': mime_type, 'redirected_url': url, 'filename': path.name}
+    
+    from weasyprint import default_url_fetcher
+    return default_url_fetcher(url, *args, **kwargs)
+
+
+_url_fetcher = None
+
+
+def get_url_fetcher():
+    """url_fetcher für WeasyPrint: lokale Dateien kommen aus dem Asset-Cache
+    
+    Bilder werden direkt aus images/ gelesen statt vorher nach templates/
+    kopiert; SVG-Icons auf Wunsch als vorgerastertes PNG. Alles andere
+    (data:, http:) übernimmt WeasyPrints Standard-Fetcher.
+    
+    Ab WeasyPrint 70 ist das eine Unterklasse von weasyprint.urls.URLFetcher
+    (eine Instanz pro Prozess), ältere Versionen bekommen asset_url_fetcher.
+    """
+    global _url_fetcher
+    if _url_fetcher is None:
+        try:
+            from weasyprint.urls import URLFetcher, URLFetcherResponse
+        except ImportError:
+            _url_fetcher = asset_url_fetcher
+        else:
+            class AssetURLFetcher(URLFetcher):
+                def fetch(self, url, headers=None):
+                    asset = _load_local_asset(url)
+                    if asset is None:
+                        return super().fetch(url, headers)
+                    data, mime_type, _ = asset
+                    return URLFetcherResponse(
+                        url, body=data,
+                        headers={'Content-Type': mime_type or 'application/octet-stream'}
+                    )
+            
+            _url_fetcher = AssetURLFetcher()
+    return _url_fetcher
+
+
+def get_image_cache() -> dict:
+    """Bild-Cache für write_pdf, geteilt von allen Dokumenten eines Prozesses
+    
+    WeasyPrint lädt und parst jedes Bild nur beim ersten Dokument; Einträge,
+    deren Datei sich seitdem geändert hat, werden vorher verworfen.
+    """
+    from urllib.request import url2pathname
+    
+    for url, mtime in list(_IMAGE_MTIMES.items()):
+        try:
+            aktuell = Path(url2pathname(urlsplit(url).path)).stat().st_mtime_ns
+        except OSError:
+            aktuell = None
+        if aktuell != mtime:
+            _IMAGE_CACHE.pop(url, None)
+            del _IMAGE_MTIMES[url]
+    return _IMAGE_CACHE
+
+
+# Kleinere PDFs (z.B. für Upload-Limits der Portale): Ziel-DPI der Bilder oder None
+PDF_JPEG_QUALITY = 85
+
+_pdf_config = {"dpi": None}
+
+
+def configure_pdf_optimization(dpi: Optional[int] = None):
+    """dpi aktiviert die PDF-Optimierung mit dieser Bildauflösung (z.B. aus --optimize-pdf)"""
+    _pdf_config["dpi"] = dpi
+
+
+def render_pdf(html_content: str, output_path: Path):
+    """Rendert HTML mit styles.css als PDF (WeasyPrint wird erst hier importiert)
+    
+    Mit aktivierter PDF-Optimierung rechnet WeasyPrint Bilder auf die Ziel-DPI
+    herunter (Schriften werden ohnehin als Subset eingebettet); danach fasst
+    optimize_pdf identische Bilder zusammen und komprimiert die Streams.
+    
+    Returns:
+        PdfGroessen (vorher/nachher) bei aktivierter Optimierung, sonst None
+    """
+    from weasyprint import HTML
+    
+    optionen = {}
+    dpi = _pdf_config["dpi"]
+    if dpi:
+        optionen = {'optimize_images': True, 'dpi': dpi, 'jpeg_quality': PDF_JPEG_QUALITY}
+    
+    HTML(string=html_content, base_url=str(BASE_DIR), url_fetcher=get_url_fetcher()).write_pdf(
+        output_path,
+        stylesheets=[get_stylesheet()],
+        font_config=get_font_config(),
+        cache=get_image_cache(),
+        **optionen
+    )
+    
+    if dpi:
+        from optimize_pdf import optimize_pdf
+        try:
+            return optimize_pdf(output_path)
+        except Exception as e:
+            # Das gerenderte PDF bleibt gültig, nur eben unoptimiert
+            print(f"⚠️  PDF-Optimierung übersprungen ({output_path.name}): {e}")
+    return None
+
+
+def _init_render_worker(icon_raster_dpi: Optional[int] = None, pdf_dpi: Optional[int] = None):
+    """Lädt WeasyPrint, Schriften und styles.css einmal pro Worker-Prozess"""
+    configure_icons(icon_raster_dpi)
+    configure_pdf_optimization(pdf_dpi)
+    get_stylesheet()
+
+
+def _render_job(auftrag: RenderAuftrag):
+    """Rendert einen Auftrag im Worker-Prozess"""
+    return render_pdf(auftrag.html, auftrag.output_path)
+
+
+# Referenzen auf lokale Dateien in HTML (src/href) und CSS (url(...))
+ASSET_RE = re.compile(r'''(?:src|href)="([^"]+)"|url\(\s*['"]?([^'")]+?)['"]?\s*\)''')
+
+# Datei-Hashes pro Prozess: (Pfad, Größe, mtime) -> sha256
+_ASSET_HASHES = {}
+
+
+def _asset_hash(path: Path) -> str:
+    """Inhalts-Hash einer Datei ("-" wenn sie fehlt)
+    
+    Liest über den Asset-Cache, damit gehashte Bilder beim Rendern im selben
+    Prozess nicht erneut von der Platte kommen.
+    """
+    try:
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if key not in _ASSET_HASHES:
+            _ASSET_HASHES[key] = hashlib.sha256(load_asset(path)[0]).hexdigest()
+    except OSError:
+        return "-"
+    return _ASSET_HASHES[key]
+
+
+def _local_assets(text: str, base_dir: Path) -> set:
+    """Lokale Dateien, auf die HTML oder CSS verweist"""
+    assets = set()
+    for match in ASSET_RE.finditer(text):
+        ref = (match.group(1) or match.group(2)).split('#')[0].split('?')[0]
+        # http:, mailto:, data: usw. sind keine lokalen Dateien
+        if ref and ':' not in ref and not ref.startswith('//'):
+            assets.add(base_dir / ref)
+    return assets
+
+
+def compute_build_hash(html_content: str) -> str:
+    """Hash über das fertige HTML, styles.css und alle referenzierten Dateien"""
+    css_path = TEMPLATES_DIR / 'styles.css'
+    assets = _local_assets(html_content, BASE_DIR) | {css_path}
+    assets |= _local_assets(css_path.read_text(encoding='utf-8'), css_path.parent)
+    
+    digest = hashlib.sha256(html_content.encode('utf-8'))
+    if _icon_config["raster_dpi"]:
+        digest.update(f"\0icons@{_icon_config['raster_dpi']}dpi".encode('utf-8'))
+    if _pdf_config["dpi"]:
+        digest.update(f"\0pdf@{_pdf_config['dpi']}dpi".encode('utf-8'))
+    for asset in sorted(assets):
+        digest.update(f"\0{asset}\0{_asset_hash(asset)}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Build-Hash pro PDF eines Ausgabeverzeichnisses (<output>/build_manifest.json)
+    
+    Stimmt der Hash der Eingaben mit dem gespeicherten überein und existiert
+    das PDF noch, muss es nicht neu gerendert werden.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, output_dir: Path):
+        self.path = Path(output_dir) / 'build_manifest.json'
+        self.dokumente = {}
+        self._geaendert = False
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get('version') == self.VERSION:
+                self.dokumente = data.get('dokumente', {})
+        except (OSError, ValueError):
+            pass
+    
+    def is_current(self, output_path: Path, build_hash: str) -> bool:
+        eintrag = self.dokumente.get(output_path.name)
+        return bool(eintrag) and eintrag.get('hash') == build_hash and output_path.exists()
+    
+    def record(self, output_path: Path, build_hash: str):
+        self.dokumente[output_path.name] = {
+            'hash': build_hash,
+            'erstellt': datetime.now().isoformat(timespec='seconds'),
+        }
+        self._geaendert = True
+    
+    def save(self):
+        if not self._geaendert:
+            return
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'dokumente': self.dokumente}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._geaendert = False
+
+
+def render_documents(context: ApplicationContext, auftraege: list, jobs: int = 1,
+                     force: bool = False, fehler: Optional[dict] = None) -> list:
+    """Rendert fertige Dokumente als PDF
+    
+    WeasyPrint-Layout ist CPU-gebunden und single-threaded; mit jobs > 1
+    rendern mehrere Worker-Prozesse gleichzeitig. PDFs, deren Eingaben sich
+    laut Build-Manifest nicht geändert haben, werden übersprungen.
+    
+    Args:
+        context: Kontext des Generator-Laufs (für die Zeitmessung)
+        auftraege: Liste von RenderAuftrag
+        jobs: Anzahl Render-Prozesse
+        force: Auch unveränderte PDFs neu rendern
+        fehler: Falls angegeben, werden fehlgeschlagene PDFs hier eingetragen
+            (output_path -> Meldung) statt den ganzen Lauf abzubrechen
+        
+    Returns:
+        Pfade der PDFs in der Reihenfolge der Aufträge
+    """
+    manifeste = {}
+    offen = []
+    with context.messen("Build-Hash"):
+        for auftrag in auftraege:
+            verzeichnis = auftrag.output_path.parent
+            if verzeichnis not in manifeste:
+                manifeste[verzeichnis] = BuildManifest(verzeichnis)
+            
+            auftrag.build_hash = compute_build_hash(auftrag.html)
+            if not force and manifeste[verzeichnis].is_current(auftrag.output_path, auftrag.build_hash):
+                print(f"⏭️  {auftrag.dokument} unverändert: {auftrag.output_path}")
+            else:
+                offen.append(auftrag)
+    
+    gerendert = _render_auftraege(context, offen, jobs, fehler)
+    
+    for auftrag in gerendert:
+        manifeste[auftrag.output_path.parent].record(auftrag.output_path, auftrag.build_hash)
+    for manifest in manifeste.values():
+        manifest.save()
+    
+    return [auftrag.output_path for auftrag in auftraege]
+
+
+def _render_auftraege(context: ApplicationContext, auftraege: list, jobs: int,
+                      fehler: Optional[dict] = None) -> list:
+    """Rendert Aufträge sequentiell oder im Prozess-Pool, liefert die erfolgreichen"""
+    gerendert = []
+    
+    def abschliessen(auftrag: RenderAuftrag, ergebnis: Callable):
+        try:
+            groessen = ergebnis()
+        except Exception as e:
+            if fehler is None:
+                raise
+            fehler[auftrag.output_path] = str(e)
+            print(f"❌ {auftrag.dokument} fehlgeschlagen: {auftrag.output_path} ({e})")
+            return
+        gerendert.append(auftrag)
+        print(f"✅ {auftrag.dokument} erstellt: {auftrag.output_path}")
+        if groessen:
+            print(f"   📉 {groessen}")
+    
+    if jobs <= 1 or len(auftraege) <= 1:
+        for auftrag in auftraege:
+            with context.messen(f"{auftrag.dokument} rendern"):
+                abschliessen(auftrag, lambda: render_pdf(auftrag.html, auftrag.output_path))
     else:
-        print("⚠️  Keine Website-URL gefunden, QR-Code wird übersprungen")
+        workers = min(jobs, len(auftraege))
+        with context.messen(f"PDFs rendern ({workers} Prozesse)"):
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                     initargs=(_icon_config["raster_dpi"], _pdf_config["dpi"])) as pool:
+                futures = [(auftrag, pool.submit(_render_job, auftrag)) for auftrag in auftraege]
+                for auftrag, future in futures:
+                    abschliessen(auftrag, future.result)
     
-    # Template laden
-    template_path = TEMPLATES_DIR / 'anschreiben.html'
-    with open(template_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    return gerendert
+
+
+# QR-Code zur Website im Lebenslauf
+QR_CODE_PATH = BASE_DIR / 'images' / 'qr_code.png'
+QR_CODE_SIZE_CM = 2.5
+
+_qr_config = {"inline": False}
+
+
+def configure_qr_code(inline: bool = False):
+    """inline=True bettet den QR-Code als data:-URI ins HTML ein (z.B. aus --qr-inline)"""
+    _qr_config["inline"] = inline
+
+
+def qr_code_src() -> str:
+    """src des QR-Codes für das Template
     
-    # Profilbild kopieren
-    source_img = BASE_DIR / 'images' / 'profilbild.jpg'
-    target_img = TEMPLATES_DIR / 'profilbild.jpg'
-    if source_img.exists():
-        import shutil
-        shutil.copy2(source_img, target_img)
+    Das PNG kommt aus dem QR-Cache (Schlüssel: URL, Größe, DPI, Fehlerkorrektur)
+    und wird nur bei geänderter URL neu kodiert. Eingebettet als data:-URI wird
+    keine Datei geschrieben, sonst images/qr_code.png nur bei Änderung.
+    """
+    website_url = PERSOENLICHE_DATEN.get('website', '')
+    if not website_url:
+        print("⚠️  Keine Website-URL gefunden, QR-Code wird übersprungen")
+        return QR_CODE_PATH.relative_to(BASE_DIR).as_posix()
+    
+    from generate_qr_code import generate_qr_code, qr_code_data_uri
+    if _qr_config["inline"]:
+        return qr_code_data_uri(website_url, size_cm=QR_CODE_SIZE_CM)
+    generate_qr_code(website_url, QR_CODE_PATH, size_cm=QR_CODE_SIZE_CM)
+    return QR_CODE_PATH.relative_to(BASE_DIR).as_posix()
+
+
+def build_anschreiben(context: ApplicationContext) -> RenderAuftrag:
+    """Baut das HTML des Bewerbungsanschreibens"""
+    print("📄 Generiere Anschreiben...")
     
     # Anschrift und Anrede bestimmen
-    ansprechpartner_raw = BEWERBUNG['ansprechpartner']
-    firma_name = BEWERBUNG['firma']
+    bewerbung = context.bewerbung
+    ansprechpartner_raw = bewerbung['ansprechpartner']
+    firma_name = bewerbung['firma']
     
     # Für Anschriftsfeld: Nur konkreten Namen, sonst leer
     # Filtere aus: "Damen und Herren", leere Strings, "Nicht erkannt", oder wenn = Firmenname
@@ -486,78 +1035,87 @@ def generate_anschreiben():
         anrede = 'Damen und Herren'
     
     # Lade ggf. personalisierten Anschreiben-Text
-    custom_text = load_custom_anschreiben_text()
+    with context.messen("Anschreiben-Text"):
+        custom_text = load_custom_anschreiben_text(context)
     
     # Platzhalter ersetzen
     replacements = {
-        '{vorname}': PERSOENLICHE_DATEN['vorname'],
-        '{nachname}': PERSOENLICHE_DATEN['nachname'],
-        '{email}': PERSOENLICHE_DATEN['email'],
-        '{telefon}': PERSOENLICHE_DATEN['telefon'],
-        '{strasse}': PERSOENLICHE_DATEN['strasse'],
-        '{plz}': PERSOENLICHE_DATEN['plz'],
-        '{ort}': PERSOENLICHE_DATEN['ort'],
-        '{linkedin}': PERSOENLICHE_DATEN.get('linkedin', ''),
-        '{website}': PERSOENLICHE_DATEN.get('website', ''),
-        '{firma}': BEWERBUNG['firma'],
-        '{ansprechpartner}': anschriftsfeld,  # NUR konkreter Name oder leer
-        '{position}': BEWERBUNG['position'],
-        '{firma_strasse}': BEWERBUNG['strasse'],
-        '{firma_plz}': BEWERBUNG['plz'],
-        '{firma_ort}': BEWERBUNG['ort'],
-        '{firma_email}': BEWERBUNG.get('email', ''),
-        '{datum}': BEWERBUNG['datum'],
-        '{anrede}': anrede,
-        '{anschreiben_text}': custom_text,  # Personalisierter Text
+        'vorname': PERSOENLICHE_DATEN['vorname'],
+        'nachname': PERSOENLICHE_DATEN['nachname'],
+        'email': PERSOENLICHE_DATEN['email'],
+        'telefon': PERSOENLICHE_DATEN['telefon'],
+        'strasse': PERSOENLICHE_DATEN['strasse'],
+        'plz': PERSOENLICHE_DATEN['plz'],
+        'ort': PERSOENLICHE_DATEN['ort'],
+        'linkedin': PERSOENLICHE_DATEN.get('linkedin', ''),
+        'website': PERSOENLICHE_DATEN.get('website', ''),
+        'firma': bewerbung['firma'],
+        'ansprechpartner': anschriftsfeld,  # NUR konkreter Name oder leer
+        'position': bewerbung['position'],
+        'firma_strasse': bewerbung['strasse'],
+        'firma_plz': bewerbung['plz'],
+        'firma_ort': bewerbung['ort'],
+        'firma_email': bewerbung.get('email', ''),
+        'datum': bewerbung['datum'],
+        'anrede': anrede,
+        'anschreiben_text': RawHTML(custom_text),  # Personalisierter Text
     }
     
-    for placeholder, value in replacements.items():
-        html_content = html_content.replace(placeholder, value)
-    
-    # CSS laden
-    css_path = TEMPLATES_DIR / 'styles.css'
+    html_content = render_template('anschreiben.html', replacements)
     
     # PDF generieren mit dynamischem Dateinamen (Name + Datum)
     vorname = PERSOENLICHE_DATEN['vorname']
     nachname = PERSOENLICHE_DATEN['nachname']
     datum_heute = datetime.now().strftime("%Y%m%d")
-    output_path = OUTPUT_DIR / f'Anschreiben_{vorname}_{nachname}_{datum_heute}.pdf'
-    HTML(string=html_content, base_url=str(BASE_DIR)).write_pdf(
-        output_path,
-        stylesheets=[CSS(filename=str(css_path))]
-    )
-    
-    print(f"✅ Anschreiben erstellt: {output_path}")
-    return output_path
+    output_path = context.output_dir / f'Anschreiben_{vorname}_{nachname}_{datum_heute}.pdf'
+    return RenderAuftrag("Anschreiben", html_content, output_path)
 
 
-def generate_lebenslauf():
-    """Generiert den Lebenslauf als PDF"""
-    print("📄 Generiere Lebenslauf...")
+def generate_anschreiben(context: ApplicationContext, force: bool = False):
+    """Generiert das Bewerbungsanschreiben als PDF"""
+    return render_documents(context, [build_anschreiben(context)], force=force)[0]
+
+
+# Fertige HTML-Fragmente des Lebenslaufs: (Builder, Eingabedaten) -> HTML
+_FRAGMENT_CACHE = {}
+FRAGMENT_CACHE_SIZE = 256
+
+
+def memoized_fragment(builder):
+    """Merkt sich das HTML eines reinen Section-Builders pro Eingabedaten
     
-    # Template laden
-    template_path = TEMPLATES_DIR / 'lebenslauf.html'
-    with open(template_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    
-    # Profilbild kopieren
-    source_img = BASE_DIR / 'images' / 'profilbild.jpg'
-    target_img = TEMPLATES_DIR / 'profilbild.jpg'
-    if source_img.exists():
-        import shutil
-        shutil.copy2(source_img, target_img)
-    
-    # Berufserfahrung formatieren
-    berufserfahrung_html = ""
-    for job in BERUFSERFAHRUNG:
+    Jobunabhängige Abschnitte (Berufserfahrung, Ausbildung, ...) werden so nur
+    einmal pro Prozess gebaut, egal für wie viele Stellen generiert wird.
+    Schlüssel ist repr() der Argumente - für die verschachtelten Listen/Dicts
+    aus persoenliche_daten eindeutig und deutlich billiger als das Bauen selbst.
+    """
+    @functools.wraps(builder)
+    def wrapper(*args):
+        key = (builder.__name__, repr(args))
+        html = _FRAGMENT_CACHE.get(key)
+        if html is None:
+            if len(_FRAGMENT_CACHE) >= FRAGMENT_CACHE_SIZE:
+                _FRAGMENT_CACHE.clear()
+            html = _FRAGMENT_CACHE[key] = builder(*args)
+        return html
+    return wrapper
+
+
+@memoized_fragment
+def build_berufserfahrung_html(berufserfahrung: list) -> str:
+    """Berufserfahrung als CV-Einträge"""
+    teile = []
+    for job in berufserfahrung:
         tatigkeiten_html = ""
         if job['tatigkeiten']:
-            tatigkeiten_html = '<div style="margin-top: 8px; margin-left: 0;">\n'
-            for task in job['tatigkeiten']:
-                tatigkeiten_html += f'                <div style="margin-bottom: 4px; padding-left: 0;"><span style="color: #2c3e50; font-weight: bold; margin-right: 8px;">•</span>{task}</div>\n'
-            tatigkeiten_html += "            </div>"
+            tatigkeiten_html = ''.join([
+                '<div style="margin-top: 8px; margin-left: 0;">\n',
+                *(f'                <div style="margin-bottom: 4px; padding-left: 0;"><span style="color: #2c3e50; font-weight: bold; margin-right: 8px;">•</span>{task}</div>\n'
+                  for task in job['tatigkeiten']),
+                "            </div>",
+            ])
         
-        berufserfahrung_html += f"""
+        teile.append(f"""
         <div class="cv-entry" style="font-size: 9pt;">
             <div class="timeframe" style="font-size: 9pt;">{job['zeitraum']}</div>
             <div class="details">
@@ -567,17 +1125,22 @@ def generate_lebenslauf():
                 {tatigkeiten_html}
             </div>
         </div>
-        """
-    
-    # Ausbildung formatieren
-    ausbildung_html = ""
-    for edu in AUSBILDUNG:
+        """)
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_ausbildung_html(ausbildung: list) -> str:
+    """Ausbildung als CV-Einträge (IHK-Abschlüsse mit Badge)"""
+    teile = []
+    for edu in ausbildung:
         details_html = ""
         if edu['details']:
-            details_html = "<ul>\n"
-            for detail in edu['details']:
-                details_html += f"                <li>{detail}</li>\n"
-            details_html += "            </ul>"
+            details_html = ''.join([
+                "<ul>\n",
+                *(f"                <li>{detail}</li>\n" for detail in edu['details']),
+                "            </ul>",
+            ])
         
         # Extrahiere IHK aus dem Abschluss (falls vorhanden)
         abschluss = edu['abschluss']
@@ -586,7 +1149,7 @@ def generate_lebenslauf():
             abschluss = abschluss.replace(" (IHK)", "").replace("(IHK)", "")
             ihk_tag = '<span style="display: inline-block; padding: 2px 8px; background: #3498db; color: white; border-radius: 3px; font-size: 7.5pt; font-weight: 500; margin-left: 8px;">IHK</span>'
         
-        ausbildung_html += f"""
+        teile.append(f"""
         <div class="cv-entry">
             <div class="timeframe">{edu['zeitraum']}</div>
             <div class="details">
@@ -596,25 +1159,31 @@ def generate_lebenslauf():
                 {details_html}
             </div>
         </div>
-        """
-    
-    # Programmiersprachen mit Skill-Balken (Top 5)
-    programmiersprachen_html = ""
-    # Icon-Mapping für Programmiersprachen
-    icon_map = {
-        "Python": "python.svg",
-        "TypeScript": "typescript.svg",
-        "JavaScript": "javascript.svg",
-        "Java": "java.svg",
-        "SQL": "sql.svg",
-        "HTML/CSS": "html.svg",
-    }
+        """)
+    return "".join(teile)
+
+
+# Icon-Mapping für Programmiersprachen
+PROGRAMMIERSPRACHEN_ICONS = {
+    "Python": "python.svg",
+    "TypeScript": "typescript.svg",
+    "JavaScript": "javascript.svg",
+    "Java": "java.svg",
+    "SQL": "sql.svg",
+    "HTML/CSS": "html.svg",
+}
+
+
+@memoized_fragment
+def build_programmiersprachen_html(programmiersprachen: list) -> str:
+    """Programmiersprachen mit Skill-Balken (Top 5)"""
+    teile = []
     # Sortiere nach Level absteigend und nimm Top 5
-    top_programmiersprachen = sorted(KENNTNISSE['programmiersprachen'], key=lambda x: x['level'], reverse=True)[:5]
+    top_programmiersprachen = sorted(programmiersprachen, key=lambda x: x['level'], reverse=True)[:5]
     
     for skill in top_programmiersprachen:
-        icon_file = icon_map.get(skill['name'], "code.svg")  # Fallback zu generischem Icon
-        programmiersprachen_html += f"""
+        icon_file = PROGRAMMIERSPRACHEN_ICONS.get(skill['name'], "code.svg")  # Fallback zu generischem Icon
+        teile.append(f"""
         <div class="skill-bar">
             <img src="images/icons/{icon_file}" class="skill-icon" alt="{skill['name']}">
             <div class="skill-name">{skill['name']}</div>
@@ -622,61 +1191,46 @@ def generate_lebenslauf():
                 <div class="bar-fill" style="width: {skill['level']}%;"></div>
             </div>
         </div>
-        """
+        """)
     # Zeige "..." Tag wenn es mehr als 5 gibt
-    if len(KENNTNISSE['programmiersprachen']) > 5:
-        programmiersprachen_html += """
+    if len(programmiersprachen) > 5:
+        teile.append("""
         <div class="skill-bar">
             <div class="skill-name" style="margin-left: 30px;"><span class="tag more">...</span></div>
         </div>
-        """
-    
-    # AI/ML als Tags (Top 5)
-    ai_ml_html = ""
-    # Sortiere nach Level absteigend und nimm Top 5
-    top_ai_ml = sorted(KENNTNISSE['ai_ml'], key=lambda x: -x['level'])[:5]
-    for item in top_ai_ml:
+        """)
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_skill_tags_html(items: list) -> str:
+    """Skills als Tags (Top 5 nach Level, "..." wenn es mehr gibt)"""
+    teile = []
+    for item in sorted(items, key=lambda x: -x['level'])[:5]:
         name = item['name'] if isinstance(item, dict) else item
-        ai_ml_html += f'<span class="tag">{name}</span>\n                        '
-    # Zeige "..." wenn es mehr als 5 gibt
-    if len(KENNTNISSE['ai_ml']) > 5:
-        ai_ml_html += '<span class="tag more">...</span>\n                        '
-    
-    # Frameworks als Tags (Top 5)
-    frameworks_html = ""
-    # Sortiere nach Level absteigend und nimm Top 5
-    top_frameworks = sorted(KENNTNISSE['frameworks'], key=lambda x: -x['level'])[:5]
-    for framework in top_frameworks:
-        name = framework['name'] if isinstance(framework, dict) else framework
-        frameworks_html += f'<span class="tag">{name}</span>\n                        '
-    # Zeige "..." wenn es mehr als 5 gibt
-    if len(KENNTNISSE['frameworks']) > 5:
-        frameworks_html += '<span class="tag more">...</span>\n                        '
-    
-    # Tools als Tags (Top 5 - inkl. Methoden)
-    tools_html = ""
-    # Sortiere nach Level absteigend und nimm Top 5
-    top_tools = sorted(KENNTNISSE['tools'], key=lambda x: -x['level'])[:5]
-    for tool in top_tools:
-        name = tool['name'] if isinstance(tool, dict) else tool
-        tools_html += f'<span class="tag">{name}</span>\n                        '
-    # Zeige "..." wenn es mehr als 5 gibt
-    if len(KENNTNISSE['tools']) > 5:
-        tools_html += '<span class="tag more">...</span>\n                        '
-    
-    # Sprachkenntnisse
-    sprachen_html = ""
-    # Icon-Mapping für Sprachen (Flaggen)
-    sprachen_icon_map = {
-        "Deutsch": "flag-de.svg",
-        "Englisch": "flag-gb.svg",
-        "Französisch": "flag-fr.svg",
-        "Spanisch": "flag-es.svg",
-        "Italienisch": "flag-it.svg",
-    }
-    for sprache in SPRACHEN:
-        icon_file = sprachen_icon_map.get(sprache['sprache'], "globe.svg")  # Fallback zu Globe
-        sprachen_html += f"""
+        teile.append(f'<span class="tag">{name}</span>\n                        ')
+    if len(items) > 5:
+        teile.append('<span class="tag more">...</span>\n                        ')
+    return "".join(teile)
+
+
+# Icon-Mapping für Sprachen (Flaggen)
+SPRACHEN_ICONS = {
+    "Deutsch": "flag-de.svg",
+    "Englisch": "flag-gb.svg",
+    "Französisch": "flag-fr.svg",
+    "Spanisch": "flag-es.svg",
+    "Italienisch": "flag-it.svg",
+}
+
+
+@memoized_fragment
+def build_sprachen_html(sprachen: list) -> str:
+    """Sprachkenntnisse mit Flaggen-Icon"""
+    teile = []
+    for sprache in sprachen:
+        icon_file = SPRACHEN_ICONS.get(sprache['sprache'], "globe.svg")  # Fallback zu Globe
+        teile.append(f"""
         <div class="language-entry">
             <img src="images/icons/{icon_file}" class="language-icon" alt="{sprache['sprache']}">
             <div class="language-info">
@@ -684,50 +1238,50 @@ def generate_lebenslauf():
                 <div class="details">{sprache['niveau']}</div>
             </div>
         </div>
-        """
-    
-    # Zertifikate
-    zertifikate_html = ""
-    for cert in ZERTIFIKATE:
+        """)
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_zertifikate_html(zertifikate: list) -> str:
+    """Zertifikate (Dict mit Name/Datum oder reiner Text)"""
+    teile = []
+    for cert in zertifikate:
         if isinstance(cert, dict):
-            zertifikate_html += f"""
+            teile.append(f"""
                 <div class="certificate-entry">
                     <img src="images/icons/certificate.svg" class="certificate-icon" alt="Zertifikat">
                     <span>{cert['name']} ({cert['datum']})</span>
                 </div>
-                """
+                """)
         else:
-            zertifikate_html += f"""
+            teile.append(f"""
                 <div class="certificate-entry">
                     <img src="images/icons/certificate.svg" class="certificate-icon" alt="Zertifikat">
                     <span>{cert}</span>
                 </div>
-                """
-    
-    # Projekte laden
-    projekte_html = ""
-    projekte_path = PERSONAL_DOCS_DIR / 'projekte' / 'projekte.json'
-    try:
-        if projekte_path.exists():
-            with open(projekte_path, 'r', encoding='utf-8') as f:
-                projekte = json.load(f)
-            
-            # Zeige nur die ersten 5 Projekte
-            for projekt in projekte[:5]:
-                name = projekt.get('name', '')
-                bezug = projekt.get('bezug', '')
-                beschreibung = projekt.get('beschreibung', '')
-                buzzwords = projekt.get('buzzwords', [])
-                
-                # Buzzwords als Tags
-                tags_html = ""
-                for buzzword in buzzwords:
-                    tags_html += f'<span class="project-tag">{buzzword}</span>\n                        '
-                
-                # Füge "..." Tag hinzu
-                tags_html += '<span class="project-tag more">...</span>\n                        '
-                
-                projekte_html += f"""
+                """)
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_projekte_html(projekte: list) -> str:
+    """Die ersten 5 Projekte mit Buzzword-Tags und GitHub-Hinweis"""
+    teile = []
+    for projekt in projekte[:5]:
+        name = projekt.get('name', '')
+        bezug = projekt.get('bezug', '')
+        beschreibung = projekt.get('beschreibung', '')
+        buzzwords = projekt.get('buzzwords', [])
+        
+        # Buzzwords als Tags, danach "..." Tag
+        tags_html = ''.join(
+            f'<span class="project-tag">{buzzword}</span>\n                        '
+            for buzzword in buzzwords
+        )
+        tags_html += '<span class="project-tag more">...</span>\n                        '
+        
+        teile.append(f"""
             <div class="project-entry">
                 <div class="project-header">
                     <span class="project-title" style="font-size: 10pt;">{name}</span>
@@ -738,17 +1292,88 @@ def generate_lebenslauf():
                     {tags_html}
                 </div>
             </div>
-            """
-            
-            # Füge "..." Tag mit Disclaimer hinzu
-            projekte_html += """
+            """)
+    
+    # Füge "..." Tag mit Disclaimer hinzu
+    teile.append("""
             <div class="project-entry">
                 <div class="project-tags">
                     <span class="project-tag more">...</span>
                 </div>
                 <div class="project-description" style="font-style: italic; color: #95a5a6; font-size: 7pt; margin-top: 6px;">Weitere private Projekte: <a href="https://github.com/Mac80Mo" style="color: #95a5a6; text-decoration: underline;">https://github.com/Mac80Mo</a></div>
             </div>
-            """
+            """)
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_kurse_html(kurse: list) -> str:
+    """Ausgewählte Kurse als Tags (einziger jobabhängiger Abschnitt)"""
+    teile = [f'<span class="tag">{kurs}</span>\n                        ' for kurs in kurse]
+    
+    # Füge "..." Tag immer hinzu um zu signalisieren dass mehr Kurse vorhanden sind
+    teile.append('<span class="tag more">...</span>\n                        ')
+    teile.append('<p style="font-style: italic; color: #95a5a6; font-size: 7pt; margin-top: 8px;">Weitere Kurse - Teilnahmescheinigungen: <a href="https://mac80mo.github.io/PortfolioV2/" style="color: #95a5a6; text-decoration: underline;">https://mac80mo.github.io/PortfolioV2/</a></p>')
+    return "".join(teile)
+
+
+@memoized_fragment
+def build_optional_links_html(github: str, linkedin: str, website: str) -> str:
+    """GitHub/LinkedIn/Website-Zeilen (nur vorhandene)"""
+    teile = []
+    for url, icon, alt in [(github, "github.svg", "GitHub"),
+                           (linkedin, "linkedin.svg", "LinkedIn"),
+                           (website, "globe.svg", "Website")]:
+        if url:
+            teile.append(f"""
+                <div class="data-row">
+                    <img src="images/icons/{icon}" class="data-icon" alt="{alt}">
+                    <div class="data-value"><a href="{url}" style="color: #2c3e50; text-decoration: none;">{url}</a></div>
+                </div>""")
+    return "".join(teile)
+
+
+def kurs_name_aus_pdf(pdf_file: Path) -> str:
+    """Lesbarer Name eines Teilnahme-/Zertifikats-PDFs (bereinigter Dateiname)"""
+    # Dateiname ohne Extension
+    kurs_name = pdf_file.stem
+    
+    # Bereinige Dateinamen
+    kurs_name = kurs_name.replace('Udemy', '')
+    kurs_name = kurs_name.replace('-zertifikat - programmieren-starten', '')
+    kurs_name = kurs_name.replace('CK', '')
+    
+    # CamelCase in lesbare Form umwandeln
+    kurs_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', kurs_name)
+    kurs_name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', kurs_name)
+    
+    # Mehrfache Leerzeichen entfernen
+    kurs_name = ' '.join(kurs_name.split())
+    
+    return kurs_name.strip()
+
+
+def load_kurse_liste(weiterbildungen_dir: Path) -> list:
+    """Kursnamen aus den Teilnahme-PDFs (bereinigte Dateinamen)"""
+    return [kurs_name_aus_pdf(pdf_file) for pdf_file in weiterbildungen_dir.glob("*.pdf")]
+
+
+def build_lebenslauf(context: ApplicationContext) -> RenderAuftrag:
+    """Baut das HTML des Lebenslaufs
+    
+    Alle Abschnitte außer den Kursen hängen nur von persoenliche_daten ab und
+    kommen nach dem ersten Aufruf aus dem Fragment-Cache.
+    """
+    print("📄 Generiere Lebenslauf...")
+    
+    # Projekte laden
+    projekte_html = ""
+    projekte_path = PERSONAL_DOCS_DIR / 'projekte' / 'projekte.json'
+    try:
+        if projekte_path.exists():
+            with open(projekte_path, 'r', encoding='utf-8') as f:
+                projekte = json.load(f)
+            projekte_html = build_projekte_html(projekte)
         else:
             print(f"⚠️  Projekte-Datei nicht gefunden: {projekte_path}")
     except Exception as e:
@@ -759,134 +1384,475 @@ def generate_lebenslauf():
     weiterbildungen_dir = PERSONAL_DOCS_DIR / 'weiterbildungen'
     try:
         if weiterbildungen_dir.exists():
-            # Alle PDF-Dateien auflisten
-            pdf_files = list(weiterbildungen_dir.glob("*.pdf"))
-            
-            # Kursnamen extrahieren und bereinigen
-            kurse_liste = []
-            for pdf_file in pdf_files:
-                # Dateiname ohne Extension
-                kurs_name = pdf_file.stem
-                
-                # Bereinige Dateinamen
-                kurs_name = kurs_name.replace('Udemy', '')
-                kurs_name = kurs_name.replace('-zertifikat - programmieren-starten', '')
-                kurs_name = kurs_name.replace('CK', '')
-                
-                # CamelCase in lesbare Form umwandeln
-                import re
-                kurs_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', kurs_name)
-                kurs_name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', kurs_name)
-                
-                # Mehrfache Leerzeichen entfernen
-                kurs_name = ' '.join(kurs_name.split())
-                
-                kurse_liste.append(kurs_name.strip())
+            kurse_liste = load_kurse_liste(weiterbildungen_dir)
             
             # Wähle die 8 relevantesten Kurse (LLM-basiert oder Fallback)
-            selected_kurse = select_relevant_kurse(kurse_liste, max_count=8)
-            
-            # Zeige ausgewählte Kurse als Tags
-            for kurs in selected_kurse:
-                kurse_html += f'<span class="tag">{kurs}</span>\n                        '
+            with context.messen("Kurs-Auswahl"):
+                selected_kurse = select_relevant_kurse(kurse_liste, max_count=8, context=context)
             
-            # Füge "..." Tag immer hinzu um zu signalisieren dass mehr Kurse vorhanden sind
-            kurse_html += '<span class="tag more">...</span>\n                        '
-            kurse_html += '<p style="font-style: italic; color: #95a5a6; font-size: 7pt; margin-top: 8px;">Weitere Kurse - Teilnahmescheinigungen: <a href="https://mac80mo.github.io/PortfolioV2/" style="color: #95a5a6; text-decoration: underline;">https://mac80mo.github.io/PortfolioV2/</a></p>'
+            kurse_html = build_kurse_html(selected_kurse)
         else:
             print(f"⚠️  Weiterbildungen-Verzeichnis nicht gefunden: {weiterbildungen_dir}")
     except Exception as e:
         print(f"⚠️  Fehler beim Laden der Kurse: {e}")
     
-    # Optionale Links
-    optional_links_html = ""
-    if PERSOENLICHE_DATEN.get('github'):
-        optional_links_html += f"""
-                <div class="data-row">
-                    <img src="images/icons/github.svg" class="data-icon" alt="GitHub">
-                    <div class="data-value"><a href="{PERSOENLICHE_DATEN['github']}" style="color: #2c3e50; text-decoration: none;">{PERSOENLICHE_DATEN['github']}</a></div>
-                </div>"""
-    if PERSOENLICHE_DATEN.get('linkedin'):
-        optional_links_html += f"""
-                <div class="data-row">
-                    <img src="images/icons/linkedin.svg" class="data-icon" alt="LinkedIn">
-                    <div class="data-value"><a href="{PERSOENLICHE_DATEN['linkedin']}" style="color: #2c3e50; text-decoration: none;">{PERSOENLICHE_DATEN['linkedin']}</a></div>
-                </div>"""
-    if PERSOENLICHE_DATEN.get('website'):
-        optional_links_html += f"""
-                <div class="data-row">
-                    <img src="images/icons/globe.svg" class="data-icon" alt="Website">
-                    <div class="data-value"><a href="{PERSOENLICHE_DATEN['website']}" style="color: #2c3e50; text-decoration: none;">{PERSOENLICHE_DATEN['website']}</a></div>
-                </div>"""
+    # QR-Code zur Website (aus dem Cache)
+    with context.messen("QR-Code"):
+        qr_src = qr_code_src()
     
     # Platzhalter ersetzen
     replacements = {
-        '{vorname}': PERSOENLICHE_DATEN['vorname'],
-        '{nachname}': PERSOENLICHE_DATEN['nachname'],
-        '{email}': PERSOENLICHE_DATEN['email'],
-        '{telefon}': PERSOENLICHE_DATEN['telefon'],
-        '{strasse}': PERSOENLICHE_DATEN['strasse'],
-        '{plz}': PERSOENLICHE_DATEN['plz'],
-        '{ort}': PERSOENLICHE_DATEN['ort'],
-        '{linkedin}': PERSOENLICHE_DATEN.get('linkedin', ''),
-        '{website}': PERSOENLICHE_DATEN.get('website', ''),
-        '{geburtsdatum}': PERSOENLICHE_DATEN['geburtsdatum'],
-        '{geburtsort}': PERSOENLICHE_DATEN['geburtsort'],
-        '{nationalitaet}': PERSOENLICHE_DATEN['nationalitaet'],
-        '{datum}': datetime.now().strftime("%d.%m.%Y"),
-        '{optional_links}': optional_links_html,
-        '{berufserfahrung_entries}': berufserfahrung_html,
-        '{ausbildung_entries}': ausbildung_html,
-        '{programmiersprachen_skills}': programmiersprachen_html,
-        '{ai_ml_tags}': ai_ml_html,
-        '{frameworks_tags}': frameworks_html,
-        '{tools_tags}': tools_html,
-        '{sprachen_entries}': sprachen_html,
-        '{zertifikate_entries}': zertifikate_html,
-        '{projekte_entries}': projekte_html,
-        '{kurse_tags}': kurse_html,
+        'vorname': PERSOENLICHE_DATEN['vorname'],
+        'nachname': PERSOENLICHE_DATEN['nachname'],
+        'email': PERSOENLICHE_DATEN['email'],
+        'telefon': PERSOENLICHE_DATEN['telefon'],
+        'strasse': PERSOENLICHE_DATEN['strasse'],
+        'plz': PERSOENLICHE_DATEN['plz'],
+        'ort': PERSOENLICHE_DATEN['ort'],
+        'linkedin': PERSOENLICHE_DATEN.get('linkedin', ''),
+        'website': PERSOENLICHE_DATEN.get('website', ''),
+        'geburtsdatum': PERSOENLICHE_DATEN['geburtsdatum'],
+        'geburtsort': PERSOENLICHE_DATEN['geburtsort'],
+        'nationalitaet': PERSOENLICHE_DATEN['nationalitaet'],
+        'datum': datetime.now().strftime("%d.%m.%Y"),
+        'qr_code_src': qr_src,
+        'optional_links': RawHTML(build_optional_links_html(
+            PERSOENLICHE_DATEN.get('github'),
+            PERSOENLICHE_DATEN.get('linkedin'),
+            PERSOENLICHE_DATEN.get('website')
+        )),
+        'berufserfahrung_entries': RawHTML(build_berufserfahrung_html(BERUFSERFAHRUNG)),
+        'ausbildung_entries': RawHTML(build_ausbildung_html(AUSBILDUNG)),
+        'programmiersprachen_skills': RawHTML(build_programmiersprachen_html(KENNTNISSE['programmiersprachen'])),
+        'ai_ml_tags': RawHTML(build_skill_tags_html(KENNTNISSE['ai_ml'])),
+        'frameworks_tags': RawHTML(build_skill_tags_html(KENNTNISSE['frameworks'])),
+        'tools_tags': RawHTML(build_skill_tags_html(KENNTNISSE['tools'])),
+        'sprachen_entries': RawHTML(build_sprachen_html(SPRACHEN)),
+        'zertifikate_entries': RawHTML(build_zertifikate_html(ZERTIFIKATE)),
+        'projekte_entries': RawHTML(projekte_html),
+        'kurse_tags': RawHTML(kurse_html),
     }
     
-    for placeholder, value in replacements.items():
-        html_content = html_content.replace(placeholder, value)
-    
-    # CSS laden
-    css_path = TEMPLATES_DIR / 'styles.css'
+    html_content = render_template('lebenslauf.html', replacements)
     
     # PDF generieren mit dynamischem Dateinamen (Name + Datum)
     vorname = PERSOENLICHE_DATEN['vorname']
     nachname = PERSOENLICHE_DATEN['nachname']
     datum_heute = datetime.now().strftime("%Y%m%d")
-    output_path = OUTPUT_DIR / f'Lebenslauf_{vorname}_{nachname}_{datum_heute}.pdf'
-    HTML(string=html_content, base_url=str(BASE_DIR)).write_pdf(
-        output_path,
-        stylesheets=[CSS(filename=str(css_path))]
-    )
+    output_path = context.output_dir / f'Lebenslauf_{vorname}_{nachname}_{datum_heute}.pdf'
+    return RenderAuftrag("Lebenslauf", html_content, output_path)
+
+
+def generate_lebenslauf(context: ApplicationContext, force: bool = False):
+    """Generiert den Lebenslauf als PDF"""
+    return render_documents(context, [build_lebenslauf(context)], force=force)[0]
+
+
+# Bewerbungsmappe: Anschreiben + Lebenslauf + passende Zertifikate in einem PDF
+ZERTIFIKATE_DIR = PERSONAL_DOCS_DIR / 'zertifikate'
+BUNDLE_MAX_ANHAENGE = 10
+
+
+def select_bundle_attachments(context: ApplicationContext, max_count: int = BUNDLE_MAX_ANHAENGE) -> list:
+    """Zertifikats-PDFs für die Bewerbungsmappe, die zur Stelle passendsten zuerst
+    
+    Bewertet die Dateinamen wie die Kurse im Lebenslauf (Keyword-Scoring gegen
+    die Anforderungen der Analyse); Zertifikate ohne Bezug zur Stelle (Score 0)
+    kommen nicht in die Mappe, ohne Analyse also keine.
+    """
+    if not ZERTIFIKATE_DIR.exists():
+        print(f"⚠️  Zertifikate-Verzeichnis nicht gefunden: {ZERTIFIKATE_DIR}")
+        return []
+    
+    nach_name = {}
+    for pdf_file in sorted(ZERTIFIKATE_DIR.glob("*.pdf")):
+        nach_name.setdefault(kurs_name_aus_pdf(pdf_file), []).append(pdf_file)
+    
+    ausgewaehlt = select_relevant_kurse(list(nach_name), max_count=max_count, context=context, nur_treffer=True)
+    return [pdf_file for name in ausgewaehlt for pdf_file in nach_name[name]][:max_count]
+
+
+def compute_bundle_hash(teile: list) -> str:
+    """Hash über die Teile der Mappe in ihrer Reihenfolge (Pfad, Größe, Änderungszeit)
+    
+    Eine andere Auswahl an Zertifikaten ergibt so eine neue Mappe, auch wenn
+    keine der Dateien neuer ist als die vorhandene Mappe.
+    """
+    digest = hashlib.sha256()
+    for teil in teile:
+        try:
+            stat = teil.stat()
+            stand = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            stand = "-"
+        digest.update(f"\0{teil}\0{stand}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def generate_bundle(context: ApplicationContext, pdfs: list, anhaenge: Optional[list] = None,
+                    force: bool = False) -> Optional[Path]:
+    """Fügt die gerenderten PDFs und Zertifikate zu einer Bewerbungsmappe zusammen
     
-    print(f"✅ Lebenslauf erstellt: {output_path}")
+    Die Seiten werden ohne erneutes Rendern übernommen; Schriften und Bilder,
+    die in mehreren Dokumenten vorkommen, stehen nur einmal in der Mappe.
+    
+    Args:
+        context: Kontext des Generator-Laufs (Analyse für die Zertifikat-Auswahl)
+        pdfs: Anschreiben und Lebenslauf
+        anhaenge: Zertifikats-PDFs (Standard: select_bundle_attachments)
+        force: Auch neu erstellen, wenn sich die Teile nicht geändert haben
+    
+    Returns:
+        Pfad der Mappe (Bewerbung_<Name>_<Datum>.pdf) oder None ohne PyPDF2
+    """
+    from bundle_pdf import bundle_pdfs
+    
+    if anhaenge is None:
+        anhaenge = select_bundle_attachments(context)
+    teile = [Path(pdf) for pdf in pdfs] + list(anhaenge)
+    erstes = teile[0]
+    output_path = erstes.with_name(erstes.name.replace('Anschreiben_', 'Bewerbung_', 1))
+    
+    # Teile samt Auswahl der Zertifikate stehen im Build-Manifest neben der Mappe
+    manifest = BuildManifest(output_path.parent)
+    bundle_hash = compute_bundle_hash(teile)
+    if not force and manifest.is_current(output_path, bundle_hash):
+        print(f"⏭️  Bewerbungsmappe unverändert: {output_path}")
+        return output_path
+    
+    titel = [pdf.stem.split('_')[0] for pdf in teile[:len(pdfs)]]
+    titel += [kurs_name_aus_pdf(pdf) for pdf in anhaenge]
+    with context.messen("Mappe zusammenfügen"):
+        ergebnis = bundle_pdfs(teile, output_path, titel)
+    
+    if ergebnis is None:
+        print("⚠️  PyPDF2 nicht installiert - keine Bewerbungsmappe erstellt")
+        return None
+    manifest.record(output_path, bundle_hash)
+    manifest.save()
+    print(f"📎 Bewerbungsmappe erstellt: {ergebnis}")
     return output_path
 
 
+class Generator:
+    """Bewerbungsgenerator als wiederverwendbare Einheit
+    
+    Der Import von generator.py hat keine Seiteneffekte: Bewerbungsdaten und
+    Analyse werden erst beim ersten Zugriff auf context geladen, WeasyPrint
+    erst beim ersten Rendern importiert.
+    """
+    
+    def __init__(self, analysen_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                 force: bool = False):
+        self.analysen_dir = analysen_dir or OUTPUT_DIR / 'analysen'
+        self.output_dir = output_dir or OUTPUT_DIR
+        self.force = force  # Unveränderte PDFs trotzdem neu rendern
+        self._context = None
+    
+    @property
+    def context(self) -> ApplicationContext:
+        """Daten des Laufs (werden beim ersten Zugriff geladen)"""
+        if self._context is None:
+            self._context = load_application_context(self.analysen_dir, self.output_dir)
+        return self._context
+    
+    @property
+    def bewerbung(self) -> dict:
+        return self.context.bewerbung
+    
+    def generate_anschreiben(self) -> Path:
+        return generate_anschreiben(self.context, self.force)
+    
+    def generate_lebenslauf(self) -> Path:
+        return generate_lebenslauf(self.context, self.force)
+    
+    def generate_bundle(self, pdfs: list) -> Optional[Path]:
+        return generate_bundle(self.context, pdfs, force=self.force)
+    
+    def generate_all(self, jobs: int = 1) -> tuple:
+        """Erstellt Anschreiben und Lebenslauf
+        
+        Args:
+            jobs: Anzahl Render-Prozesse (> 1: beide PDFs parallel rendern)
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if jobs <= 1:
+            return self.generate_anschreiben(), self.generate_lebenslauf()
+        
+        # HTML (inkl. LLM-Text) im Hauptprozess, Layout parallel
+        auftraege = [build_anschreiben(self.context), build_lebenslauf(self.context)]
+        anschreiben_path, lebenslauf_path = render_documents(self.context, auftraege, jobs, self.force)
+        return anschreiben_path, lebenslauf_path
+
+
+# ============================================================================
+# MEHRERE BEWERBUNGEN IN EINEM LAUF
+# ============================================================================
+
+@dataclass
+class BewerbungsErgebnis:
+    """Ergebnis einer Bewerbung im Mehrfach-Modus"""
+    analyse: Path
+    firma: str = ""
+    output_dir: Optional[Path] = None
+    pdfs: list = field(default_factory=list)
+    anhaenge: list = field(default_factory=list)   # Zertifikate für die Bewerbungsmappe
+    mappe: Optional[Path] = None
+    fehler: Optional[str] = None
+
+
+def parse_datum(text: str) -> datetime:
+    """Datum für --all-since: YYYY-MM-DD oder TT.MM.JJJJ"""
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"Ungültiges Datum: {text} (erwartet YYYY-MM-DD oder TT.MM.JJJJ)")
+
+
+def find_analyses_since(seit: datetime, analysen_dir: Optional[Path] = None) -> list:
+    """Alle Analysen, die seit dem Zeitpunkt gespeichert wurden (älteste zuerst)"""
+    from data.bewerbungs_firma import AnalyseIndex
+    
+    analysen_dir = analysen_dir or OUTPUT_DIR / 'analysen'
+    if not analysen_dir.exists():
+        return []
+    return list(reversed(AnalyseIndex.for_dir(analysen_dir).dateien(seit=seit.timestamp())))
+
+
+def generate_applications(analyse_paths: list, jobs: int = 1, force: bool = False,
+                          output_root: Optional[Path] = None, bundle: bool = False) -> tuple:
+    """Erstellt Anschreiben und Lebenslauf für viele Analysen in einem Lauf
+    
+    Jede Bewerbung landet in einem eigenen Ordner output/bewerbungen/<Analyse>/.
+    Das HTML (inkl. LLM-Text) entsteht nacheinander im Hauptprozess, wobei das
+    Modell einmal vorgeladen wird und per keep_alive geladen bleibt. Gerendert
+    wird danach in einem gemeinsamen Prozess-Pool; mit bundle=True entsteht
+    pro Bewerbung zusätzlich eine Bewerbungsmappe mit den passenden Zertifikaten.
+    
+    Returns:
+        (Liste von BewerbungsErgebnis, Kontext mit den summierten Stufen-Zeiten)
+    """
+    output_root = output_root or OUTPUT_DIR / 'bewerbungen'
+    gesamt = ApplicationContext(output_dir=output_root)
+    ergebnisse = []
+    auftraege = []
+    
+    from data.bewerbungs_firma import OllamaClient
+    client = OllamaClient()
+    with gesamt.messen("Modell vorladen"):
+        if client.is_available() and client.warmup():
+            print(f"🔥 Modell vorgeladen: {client.get_available_model()}")
+    
+    for analyse_path in analyse_paths:
+        ergebnis = BewerbungsErgebnis(analyse=Path(analyse_path))
+        ergebnisse.append(ergebnis)
+        print(f"\n{'-' * 60}\n📂 {ergebnis.analyse.name}")
+        
+        context = load_application_context(
+            output_dir=output_root / ergebnis.analyse.stem,
+            analyse_path=ergebnis.analyse
+        )
+        try:
+            if context.analyse is None:
+                raise ValueError("Analyse konnte nicht geladen werden")
+            ergebnis.firma = context.bewerbung.get('firma', '')
+            ergebnis.output_dir = context.output_dir
+            context.output_dir.mkdir(parents=True, exist_ok=True)
+            paar = [build_anschreiben(context), build_lebenslauf(context)]
+            if bundle:
+                ergebnis.anhaenge = select_bundle_attachments(context)
+        except Exception as e:
+            ergebnis.fehler = str(e)
+            print(f"❌ {ergebnis.analyse.name}: {e}")
+            continue
+        finally:
+            for stufe, dauer in context.zeiten.items():
+                gesamt.zeiten[stufe] = gesamt.zeiten.get(stufe, 0.0) + dauer
+            gesamt.json_geladen += context.json_geladen
+        
+        ergebnis.pdfs = [auftrag.output_path for auftrag in paar]
+        auftraege.extend(paar)
+    
+    if auftraege:
+        print(f"\n{'-' * 60}\n🖨️  Rendere {len(auftraege)} PDFs mit {max(1, jobs)} Prozess(en)...")
+        fehler = {}
+        render_documents(gesamt, auftraege, jobs, force, fehler)
+        for ergebnis in ergebnisse:
+            fehlgeschlagen = [fehler[pdf] for pdf in ergebnis.pdfs if pdf in fehler]
+            if fehlgeschlagen:
+                ergebnis.fehler = fehlgeschlagen[0]
+            elif bundle and ergebnis.pdfs:
+                ergebnis.mappe = generate_bundle(gesamt, ergebnis.pdfs, ergebnis.anhaenge, force)
+    
+    return ergebnisse, gesamt
+
+
+def print_applications_report(ergebnisse: list, gesamtzeit: float):
+    """Gibt Übersicht und Durchsatz eines Mehrfach-Laufs aus"""
+    print("\n" + "=" * 78)
+    print("📊 BEWERBUNGEN")
+    print("=" * 78)
+    print(f"{'Firma':<30} {'Ordner':<40} Status")
+    print("-" * 78)
+    for e in ergebnisse:
+        firma = (e.firma or e.analyse.stem)[:30]
+        if e.fehler:
+            print(f"{firma:<30} {'-':<40} ❌ {e.fehler}")
+        else:
+            ordner = e.output_dir.name if e.output_dir else '-'
+            print(f"{firma:<30} {ordner[:40]:<40} ✅{' 📎' if e.mappe else ''}")
+    
+    fertig = sum(1 for e in ergebnisse if not e.fehler)
+    pro_minute = fertig / gesamtzeit * 60 if gesamtzeit > 0 else 0.0
+    print(f"\n   Gesamt: {fertig}/{len(ergebnisse)} Bewerbungen in {gesamtzeit:.1f}s "
+          f"→ {pro_minute:.1f} Bewerbungen/min")
+    print("=" * 78)
+
+
+def print_stage_times(context: ApplicationContext):
+    """Gibt die Laufzeit pro Stufe aus"""
+    print("\n⏱️  Laufzeit pro Stufe:")
+    for stufe, dauer in context.zeiten.items():
+        print(f"   {stufe:<28} {dauer * 1000:9.1f} ms")
+    print(f"   {'Gesamt':<28} {sum(context.zeiten.values()) * 1000:9.1f} ms")
+    print(f"   📄 Analyse-Dateien gelesen: {context.json_geladen}")
+
+
+def run_applications(analyse_paths: list, jobs: int, force: bool, bundle: bool = False) -> int:
+    """Erstellt Bewerbungen für mehrere Analysen und gibt den Durchsatz aus"""
+    fehlend = [p for p in analyse_paths if not Path(p).exists()]
+    for p in fehlend:
+        print(f"❌ Analyse nicht gefunden: {p}")
+    analyse_paths = [p for p in analyse_paths if Path(p).exists()]
+    
+    if not analyse_paths:
+        print("❌ Keine Analysen ausgewählt")
+        return 1
+    print(f"📂 {len(analyse_paths)} Analysen ausgewählt")
+    
+    start = time.perf_counter()
+    ergebnisse, gesamt = generate_applications(analyse_paths, jobs, force, bundle=bundle)
+    print_applications_report(ergebnisse, time.perf_counter() - start)
+    print_stage_times(gesamt)
+    
+    return 0 if not fehlend and all(not e.fehler for e in ergebnisse) else 1
+
+
 def main():
     """Hauptfunktion - Erstellt alle Bewerbungsunterlagen"""
+    parser = argparse.ArgumentParser(
+        description="Erstellt Anschreiben und Lebenslauf als PDF."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="LLM-Antwort-Cache weder lesen noch schreiben"
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="LLM neu abfragen und Cache-Einträge überschreiben"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Anzahl paralleler Render-Prozesse (Standard: 1, mit --analyses/--all-since: CPU-Kerne)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="PDFs neu rendern, auch wenn sich keine Eingabe geändert hat"
+    )
+    auswahl = parser.add_mutually_exclusive_group()
+    auswahl.add_argument(
+        "--analyses",
+        nargs="+",
+        type=Path,
+        metavar="ANALYSE",
+        help="Bewerbungen für diese Analyse-Dateien erstellen (je ein Ordner unter output/bewerbungen/)"
+    )
+    auswahl.add_argument(
+        "--all-since",
+        type=parse_datum,
+        metavar="DATUM",
+        help="Bewerbungen für alle Analysen seit DATUM erstellen (YYYY-MM-DD oder TT.MM.JJJJ)"
+    )
+    parser.add_argument(
+        "--qr-inline",
+        action="store_true",
+        help="QR-Code als data:-URI ins HTML einbetten (schreibt keine Bilddatei)"
+    )
+    parser.add_argument(
+        "--raster-icons",
+        type=int,
+        nargs="?",
+        const=300,
+        metavar="DPI",
+        help="SVG-Icons vorab als PNG rendern (Standard: 300 dpi, benötigt cairosvg)"
+    )
+    parser.add_argument(
+        "--optimize-pdf",
+        type=int,
+        nargs="?",
+        const=150,
+        metavar="DPI",
+        help="PDFs verkleinern: Bilder auf DPI herunterrechnen (Standard: 150), doppelte Bilder zusammenfassen"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Zusätzlich eine Bewerbungsmappe: Anschreiben, Lebenslauf und passende Zertifikate in einem PDF"
+    )
+    parser.add_argument(
+        "--debug-kurse",
+        action="store_true",
+        help="Zeigt Details zum Kurs-Scoring"
+    )
+    args = parser.parse_args()
+    
+    from data.bewerbungs_firma import configure_llm_cache
+    configure_llm_cache(enabled=not args.no_cache, refresh=args.refresh_cache)
+    configure_qr_code(inline=args.qr_inline)
+    configure_icons(raster_dpi=args.raster_icons)
+    configure_pdf_optimization(dpi=args.optimize_pdf)
+    configure_kurse(debug=args.debug_kurse)
+    if args.optimize_pdf:
+        from optimize_pdf import PDF_SUPPORT
+        if not PDF_SUPPORT:
+            print("⚠️  PyPDF2 nicht installiert - PDFs werden nur beim Rendern verkleinert")
+    
     print("=" * 60)
     print("🚀 Bewerbungsgenerator")
     print("=" * 60)
     
-    # Output-Verzeichnis sicherstellen
-    OUTPUT_DIR.mkdir(exist_ok=True)
+    # Mehrfach-Modus: je Analyse ein eigener Ordner
+    if args.analyses or args.all_since:
+        if args.all_since:
+            analyse_paths = find_analyses_since(args.all_since)
+        else:
+            analyse_paths = args.analyses
+        jobs = args.jobs or os.cpu_count() or 1
+        sys.exit(run_applications(analyse_paths, jobs, args.force, args.bundle))
+    
+    generator = Generator(force=args.force)
     
     try:
         # PDFs generieren
-        anschreiben_path = generate_anschreiben()
-        lebenslauf_path = generate_lebenslauf()
+        anschreiben_path, lebenslauf_path = generator.generate_all(jobs=args.jobs or 1)
+        mappe_path = generator.generate_bundle([anschreiben_path, lebenslauf_path]) if args.bundle else None
         
         print("\n" + "=" * 60)
         print("✨ Alle Dokumente erfolgreich erstellt!")
         print("=" * 60)
-        print(f"\n📂 Ausgabeverzeichnis: {OUTPUT_DIR}")
+        print(f"\n📂 Ausgabeverzeichnis: {generator.output_dir}")
         print(f"\n   • Anschreiben: {anschreiben_path.name}")
         print(f"   • Lebenslauf:  {lebenslauf_path.name}")
+        if mappe_path:
+            print(f"   • Mappe:       {mappe_path.name}")
+        print_stage_times(generator.context)
         print("\n💡 Tipp: Passe die Daten in 'data/persoenliche_daten.py' an!")
         
     except Exception as e:
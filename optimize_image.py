@@ -1,40 +1,145 @@
 #!/usr/bin/env python3
 """
 Optimiert das Profilbild für die Bewerbungsunterlagen
+=====================================================
+Dekodiert das Original genau einmal - JPEGs dank Image.draft direkt in
+reduzierter Auflösung -, schneidet es quadratisch zu und erzeugt daraus alle
+Zielgrößen als progressive JPEGs und optional als WebP.
+
+Ausgaben, die neuer als das Original sind, werden übersprungen; sind alle
+aktuell, wird das Original gar nicht erst geöffnet.
+
+Verwendung:
+  python3 optimize_image.py                                # Standard: 400px -> images/profilbild.jpg
+  python3 optimize_image.py foto.jpeg --sizes 400 800      # Zusätzlich profilbild_800.jpg
+  python3 optimize_image.py foto.jpeg --no-webp --force
 """
-from PIL import Image
-import os
+
+import sys
+import argparse
+from pathlib import Path
+from typing import Optional
+
+BASE_DIR = Path(__file__).resolve().parent
+IMAGES_DIR = BASE_DIR / "images"
 
 # Pfade
-input_image = "images/_S3A4489_3.jpeg"
-output_image = "images/profilbild.jpg"
-
-# Bild laden
-img = Image.open(input_image)
-print(f"Original: {img.size} - {img.format}")
-
-# Auf quadratisches Format zuschneiden (Gesicht zentriert)
-width, height = img.size
-# Nimm den kürzeren Wert als Basis für den Zuschnitt
-size = min(width, height)
-
-# Zentrierter Zuschnitt
-left = (width - size) // 2
-top = (height - size) // 2
-right = left + size
-bottom = top + size
-
-img_cropped = img.crop((left, top, right, bottom))
-print(f"Zugeschnitten: {img_cropped.size}")
-
-# Auf optimale Größe skalieren (400x400 für gute Qualität)
-img_resized = img_cropped.resize((400, 400), Image.Resampling.LANCZOS)
-print(f"Skaliert: {img_resized.size}")
-
-# Speichern mit guter Qualität
-img_resized.save(output_image, "JPEG", quality=95, optimize=True)
-print(f"✅ Optimiertes Bild gespeichert: {output_image}")
-
-# Dateigröße ausgeben
-size_kb = os.path.getsize(output_image) / 1024
-print(f"Dateigröße: {size_kb:.1f} KB")
+DEFAULT_SOURCE = IMAGES_DIR / "_S3A4489_3.jpeg"
+DEFAULT_NAME = "profilbild"
+
+# 400x400 für gute Qualität im PDF
+DEFAULT_SIZES = (400,)
+
+
+def output_paths(output_dir: Path, name: str, sizes: tuple, webp: bool = True) -> dict:
+    """Zieldateien pro Größe: die erste Größe heißt <name>.jpg, weitere <name>_<größe>.jpg
+    
+    Returns:
+        Dict Größe -> Liste der Ausgabepfade (JPEG, ggf. WebP)
+    """
+    pfade = {}
+    for i, size in enumerate(sizes):
+        stem = name if i == 0 else f"{name}_{size}"
+        pfade[size] = [output_dir / f"{stem}.jpg"]
+        if webp:
+            pfade[size].append(output_dir / f"{stem}.webp")
+    return pfade
+
+
+def _is_current(path: Path, source_mtime: float) -> bool:
+    try:
+        return path.stat().st_mtime >= source_mtime
+    except OSError:
+        return False
+
+
+def optimize_profile_image(source: Path, output_dir: Optional[Path] = None, name: str = DEFAULT_NAME,
+                           sizes: tuple = DEFAULT_SIZES, quality: int = 95, webp: bool = True,
+                           force: bool = False) -> list:
+    """
+    Erzeugt quadratische, zentriert zugeschnittene Profilbilder in mehreren Größen.
+    
+    Args:
+        source: Originalbild (JPEG, PNG, ...)
+        output_dir: Zielverzeichnis (Standard: images/)
+        name: Dateiname ohne Endung für die erste Größe
+        sizes: Kantenlängen in Pixeln
+        quality: JPEG/WebP-Qualität (1-95)
+        webp: Zusätzlich WebP-Varianten erzeugen
+        force: Auch aktuelle Ausgaben neu schreiben
+    
+    Returns:
+        Liste der geschriebenen Dateien (leer, wenn alles aktuell war)
+    """
+    from PIL import Image
+    
+    source = Path(source)
+    output_dir = Path(output_dir or IMAGES_DIR)
+    source_mtime = source.stat().st_mtime
+    
+    # Nur Größen bearbeiten, deren Ausgaben fehlen oder älter als das Original sind
+    offen = {
+        size: pfade
+        for size, pfade in output_paths(output_dir, name, tuple(sizes), webp).items()
+        if force or not all(_is_current(p, source_mtime) for p in pfade)
+    }
+    if not offen:
+        print(f"♻️  Profilbilder aktuell: {output_dir}")
+        return []
+    
+    # Bild laden - bei JPEGs gleich passend verkleinert dekodieren (DCT-Skalierung)
+    img = Image.open(source)
+    original_size = img.size
+    groesste = max(offen)
+    img.draft("RGB", (groesste, groesste))
+    img = img.convert("RGB")
+    print(f"Original: {original_size} - dekodiert als {img.size}")
+    
+    # Auf quadratisches Format zuschneiden (Gesicht zentriert)
+    width, height = img.size
+    # Nimm den kürzeren Wert als Basis für den Zuschnitt
+    size = min(width, height)
+    left = (width - size) // 2
+    top = (height - size) // 2
+    quadrat = img.crop((left, top, left + size, top + size))
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    geschrieben = []
+    for size, pfade in sorted(offen.items(), reverse=True):
+        skaliert = quadrat.resize((size, size), Image.Resampling.LANCZOS)
+        for path in pfade:
+            if path.suffix == ".webp":
+                skaliert.save(path, "WEBP", quality=quality, method=6)
+            else:
+                skaliert.save(path, "JPEG", quality=quality, optimize=True, progressive=True)
+            print(f"✅ {path.name}: {size}x{size}, {path.stat().st_size / 1024:.1f} KB")
+            geschrieben.append(path)
+    
+    return geschrieben
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optimiert das Profilbild für die Bewerbungsunterlagen.")
+    parser.add_argument("source", nargs="?", type=Path, default=DEFAULT_SOURCE, help="Originalbild")
+    parser.add_argument("--output-dir", "-o", type=Path, default=IMAGES_DIR, help="Zielverzeichnis (Standard: images/)")
+    parser.add_argument("--name", default=DEFAULT_NAME, help="Dateiname ohne Endung (Standard: profilbild)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), metavar="PX",
+                        help="Kantenlängen in Pixeln (Standard: 400)")
+    parser.add_argument("--quality", type=int, default=95, help="JPEG/WebP-Qualität (Standard: 95)")
+    parser.add_argument("--no-webp", action="store_true", help="Keine WebP-Varianten erzeugen")
+    parser.add_argument("--force", action="store_true", help="Auch aktuelle Ausgaben neu schreiben")
+    args = parser.parse_args()
+    
+    if not args.source.exists():
+        print(f"❌ Originalbild nicht gefunden: {args.source}")
+        return 1
+    
+    optimize_profile_image(
+        args.source, args.output_dir, args.name, tuple(args.sizes),
+        quality=args.quality, webp=not args.no_webp, force=args.force
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Verkleinert fertige PDFs ohne neu zu rendern
+============================================
+Nachbearbeitung der von WeasyPrint erzeugten Bewerbungs-PDFs:
+
+- Identische Bilder und Schriften (gleiche Daten und Parameter) werden nur
+  einmal gespeichert, auch wenn Seiten sie unter verschiedenen Namen einbinden
+- Unkomprimierte Content-Streams werden Flate-komprimiert
+- Es werden nur erreichbare Objekte übernommen (Seiten, Lesezeichen, Links)
+
+Schrift-Subsetting und das Herunterrechnen der Bilder auf eine Ziel-DPI
+übernimmt WeasyPrint bereits beim Rendern (generator.py --optimize-pdf).
+Ist das Ergebnis nicht kleiner, bleibt die Originaldatei unverändert.
+
+Benötigt PyPDF2 (optional).
+
+Verwendung:
+  python3 optimize_pdf.py output/*.pdf
+"""
+
+import os
+import sys
+import hashlib
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+
+# PDF Support
+try:
+    from PyPDF2 import PdfReader, PdfWriter
+    from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, StreamObject
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+
+
+@dataclass
+class PdfGroessen:
+    """Dateigröße eines PDFs vor und nach der Optimierung"""
+    path: Path
+    vorher: int
+    nachher: int
+    zusammengefasst: int = 0
+    
+    @property
+    def ersparnis(self) -> float:
+        """Eingesparter Anteil in Prozent"""
+        return (1 - self.nachher / self.vorher) * 100 if self.vorher else 0.0
+    
+    def __str__(self) -> str:
+        text = f"{self.path.name}: {self.vorher / 1024:.1f} KB → {self.nachher / 1024:.1f} KB (-{self.ersparnis:.1f}%)"
+        if self.zusammengefasst:
+            text += f", {self.zusammengefasst} doppelte Bilder/Schriften entfernt"
+        return text
+
+
+def _inhalts_key(obj, cache: dict) -> str:
+    """Inhalts-Schlüssel eines PDF-Objekts: Daten plus Parameter (ohne /Length)
+    
+    Verweise auf weitere Objekte (z.B. /SMask eines Bildes oder FontFile und
+    ToUnicode einer Schrift) gehen mit ihrem eigenen Schlüssel ein, damit
+    gleiche Ressourcen auch aus verschiedenen Dateien zusammengefasst werden.
+    """
+    if isinstance(obj, IndirectObject):
+        obj = obj.get_object()
+    if not isinstance(obj, (DictionaryObject, ArrayObject)):
+        return repr(obj)
+    if id(obj) in cache:
+        return cache[id(obj)]
+    cache[id(obj)] = f"zyklus-{id(obj)}"  # Schutz vor Rückverweisen
+    
+    if isinstance(obj, ArrayObject):
+        teile = [_inhalts_key(value, cache) for value in obj]
+        digest = hashlib.sha256("\0".join(teile).encode("utf-8", "replace"))
+    else:
+        digest = hashlib.sha256(obj.get_data() if isinstance(obj, StreamObject) else b"")
+        for key in sorted(k for k in obj.keys() if k != "/Length"):
+            digest.update(f"\0{key}\0{_inhalts_key(obj.raw_get(key), cache)}".encode("utf-8", "replace"))
+    
+    cache[id(obj)] = digest.hexdigest()
+    return cache[id(obj)]
+
+
+def dedupe_resources(reader: "PdfReader", erste: Optional[dict] = None) -> int:
+    """Lässt identische Bilder und Schriften auf ein gemeinsames Objekt zeigen
+    
+    Arbeitet auf dem Reader, bevor kopiert wird: überzählige Objekte sind
+    danach nicht mehr erreichbar und landen nicht in der neuen Datei. Folgt
+    auch den Ressourcen von Form-XObjects (z.B. Gruppen mit Transparenz).
+    
+    Args:
+        reader: Geöffnetes PDF
+        erste: Gemeinsamer Index über mehrere Reader (Schlüssel -> erster
+            Verweis); so teilen sich zusammengefügte PDFs ihre Ressourcen
+    
+    Returns:
+        Anzahl umgelenkter Verweise
+    """
+    erste = {} if erste is None else erste
+    schluessel = {}  # id(Objekt) -> Schlüssel
+    besucht = set()
+    umgelenkt = 0
+    
+    offen = [page.get("/Resources") for page in reader.pages]
+    while offen:
+        resources = offen.pop()
+        resources = resources.get_object() if resources is not None else None
+        if resources is None or id(resources) in besucht:
+            continue
+        besucht.add(id(resources))
+        
+        for art in ("/XObject", "/Font"):
+            eintraege = resources.get(art)
+            eintraege = eintraege.get_object() if eintraege is not None else None
+            if not eintraege:
+                continue
+            
+            for name in list(eintraege.keys()):
+                ref = eintraege.raw_get(name)  # Verweis, nicht das aufgelöste Objekt
+                obj = ref.get_object()
+                if obj.get("/Subtype") == "/Form":
+                    offen.append(obj.get("/Resources"))
+                    continue
+                if art == "/XObject" and obj.get("/Subtype") != "/Image":
+                    continue
+                if not isinstance(ref, IndirectObject):
+                    continue
+                
+                try:
+                    key = art + _inhalts_key(obj, schluessel)
+                except Exception:
+                    continue  # Nicht dekodierbarer Filter - Objekt bleibt wie es ist
+                vorhanden = erste.setdefault(key, ref)
+                if (vorhanden.pdf, vorhanden.idnum) != (ref.pdf, ref.idnum):
+                    eintraege[NameObject(name)] = vorhanden
+                    umgelenkt += 1
+    
+    return umgelenkt
+
+
+def _compress_page(page):
+    """Komprimiert die Content-Streams einer Seite, falls sie es noch nicht sind"""
+    contents = page.get("/Contents")
+    if contents is None:
+        return
+    contents = contents.get_object()
+    if isinstance(contents, StreamObject) and "/Filter" in contents:
+        return  # WeasyPrint komprimiert bereits selbst
+    page.compress_content_streams()
+
+
+def optimize_pdf(path: Path, output_path: Optional[Path] = None) -> Optional[PdfGroessen]:
+    """
+    Verkleinert ein PDF (Bilder zusammenfassen, Streams komprimieren).
+    
+    Args:
+        path: Zu optimierendes PDF
+        output_path: Zieldatei (Standard: path wird ersetzt)
+    
+    Returns:
+        PdfGroessen mit den Größen vorher/nachher, None ohne PyPDF2
+    """
+    if not PDF_SUPPORT:
+        return None
+    
+    path = Path(path)
+    output_path = Path(output_path or path)
+    vorher = path.stat().st_size
+    
+    reader = PdfReader(path)
+    zusammengefasst = dedupe_resources(reader)
+    
+    # append übernimmt Seiten samt Lesezeichen und Links, aber nur erreichbare Objekte
+    writer = PdfWriter()
+    writer.append(reader)
+    for page in writer.pages:
+        _compress_page(page)
+    if reader.metadata:
+        writer.add_metadata(dict(reader.metadata))
+    
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        writer.write(f)
+    nachher = tmp_path.stat().st_size
+    
+    # Nur übernehmen, wenn es tatsächlich kleiner wird
+    if nachher < vorher:
+        os.replace(tmp_path, output_path)
+    else:
+        tmp_path.unlink()
+        nachher = vorher
+        if output_path != path:
+            output_path.write_bytes(path.read_bytes())
+    
+    return PdfGroessen(output_path, vorher, nachher, zusammengefasst)
+
+
+def main():
+    if not PDF_SUPPORT:
+        print("❌ PyPDF2 nicht installiert (pip install PyPDF2)")
+        return 1
+    
+    pdfs = [Path(arg) for arg in sys.argv[1:]]
+    if not pdfs:
+        print(__doc__.strip().splitlines()[-1])
+        return 1
+    
+    gesamt_vorher = gesamt_nachher = 0
+    for pdf in pdfs:
+        if not pdf.exists():
+            print(f"❌ Datei nicht gefunden: {pdf}")
+            continue
+        groessen = optimize_pdf(pdf)
+        print(f"📉 {groessen}")
+        gesamt_vorher += groessen.vorher
+        gesamt_nachher += groessen.nachher
+    
+    if gesamt_vorher:
+        print(f"\n   Gesamt: {gesamt_vorher / 1024:.1f} KB → {gesamt_nachher / 1024:.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Template-Engine für die HTML-Vorlagen
+=====================================
+Zerlegt templates/*.html einmal in Literal- und Platzhalter-Segmente
+(gecacht nach Änderungszeit) und rendert mit einem einzigen join.
+
+- Werte werden HTML-escaped, außer sie sind als RawHTML markiert
+  (fertig aufgebaute Blöcke wie Lebenslauf-Einträge oder der Anschreiben-Text)
+- Ein Platzhalter ohne Wert ist ein harter Fehler (TemplateError)
+- Werte werden nicht erneut ersetzt: ein Wert, der "{firma}" enthält,
+  bleibt unverändert
+
+Autor: Marcus Moser
+Datum: 17.10.2026
+"""
+
+import re
+from html import escape
+from pathlib import Path
+from typing import Optional
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / 'templates'
+
+# Platzhalter wie {vorname} oder {berufserfahrung_entries}
+PLACEHOLDER_RE = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+
+class TemplateError(ValueError):
+    """Template kann nicht gerendert werden (z.B. Platzhalter ohne Wert)"""
+
+
+class RawHTML(str):
+    """Bereits fertiges HTML - wird beim Rendern nicht escaped"""
+    __slots__ = ()
+
+
+class Template:
+    """Vorkompiliertes Template aus Literal- und Platzhalter-Segmenten"""
+    
+    def __init__(self, source: str, name: str = "<string>"):
+        self.name = name
+        
+        # split() mit Gruppe liefert abwechselnd Literal, Platzhalter, Literal, ...
+        self._segments = PLACEHOLDER_RE.split(source)
+        self._slots = [(i, self._segments[i]) for i in range(1, len(self._segments), 2)]
+        self.placeholders = frozenset(name for _, name in self._slots)
+    
+    def render(self, values: dict) -> str:
+        """Setzt alle Platzhalter in einem Durchgang ein
+        
+        Args:
+            values: Platzhalter-Name (ohne Klammern) -> Wert; RawHTML-Werte
+                werden unverändert übernommen, alle anderen escaped
+        
+        Raises:
+            TemplateError: Wenn ein Platzhalter im Template keinen Wert hat
+        """
+        fehlend = self.placeholders.difference(values)
+        if fehlend:
+            namen = ", ".join(f"{{{name}}}" for name in sorted(fehlend))
+            raise TemplateError(f"{self.name}: kein Wert für {namen}")
+        
+        rendered = {}
+        for name in self.placeholders:
+            value = values[name]
+            rendered[name] = value if isinstance(value, RawHTML) else escape(str(value))
+        
+        segments = self._segments.copy()
+        for i, name in self._slots:
+            segments[i] = rendered[name]
+        return "".join(segments)
+
+
+# Kompilierte Templates: Pfad -> (mtime, Template)
+_TEMPLATE_CACHE = {}
+
+
+def load_template(name: str, templates_dir: Optional[Path] = None) -> Template:
+    """Lädt ein Template aus dem Cache; wird neu eingelesen, sobald sich die Datei ändert
+    
+    Args:
+        name: Dateiname im Template-Verzeichnis (z.B. "anschreiben.html")
+        templates_dir: Template-Verzeichnis (Standard: templates/)
+    """
+    path = Path(templates_dir or TEMPLATES_DIR) / name
+    mtime = path.stat().st_mtime_ns
+    
+    cached = _TEMPLATE_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        template = Template(path.read_text(encoding='utf-8'), name=name)
+        _TEMPLATE_CACHE[path] = cached = (mtime, template)
+    return cached[1]
+
+
+def render_template(name: str, values: dict) -> str:
+    """Lädt ein Template (gecacht) und rendert es"""
+    return load_template(name).render(values)
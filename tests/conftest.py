@@ -0,0 +1,37 @@
+"""
+Gemeinsame Einrichtung der Tests
+================================
+Die Tests laufen gegen das Test-Profil in tests/fixtures statt gegen
+data/persoenliche_daten.py, und Caches landen im temporären Verzeichnis
+statt in output/.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent
+BASE_DIR = TESTS_DIR.parent
+
+# Projektpfad wie in analyze_stelle.py / generator.py, Beispiel-Anzeigen aus benchmarks/_common
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / "benchmarks"))
+
+# Test-Profil vor data/persoenliche_daten.py; der Import legt es für alle
+# Module fest, auch wenn sie data/ später selbst in sys.path eintragen
+sys.path.insert(0, str(TESTS_DIR / "fixtures"))
+import persoenliche_daten  # noqa: E402,F401
+
+from data import bewerbungs_firma  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_in_tmp(tmp_path_factory):
+    """Skill-Profil und Embeddings nicht nach output/cache schreiben"""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    patch = pytest.MonkeyPatch()
+    patch.setattr(bewerbungs_firma, "SKILL_PROFIL_CACHE_PATH", cache_dir / "skill_profil.json")
+    patch.setattr(bewerbungs_firma, "EMBEDDING_CACHE_DIR", cache_dir / "embeddings")
+    yield cache_dir
+    patch.undo()
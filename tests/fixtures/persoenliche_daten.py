@@ -0,0 +1,77 @@
+"""
+Test-Profil für die Tests (ersetzt data/persoenliche_daten.py)
+==============================================================
+Enthält bewusst kurze Keys ("Go", "C#", "R"), Skills mit Schrägstrich
+("Git/GitHub") und Einträge, die nur über Synonyme erreichbar sind.
+"""
+
+from datetime import datetime
+
+PERSOENLICHE_DATEN = {
+    "vorname": "Erika",
+    "nachname": "Beispiel",
+    "titel": "",
+    "strasse": "Allee 2",
+    "plz": "54321",
+    "ort": "Dorf",
+    "telefon": "0456",
+    "email": "erika@example.com",
+    "geburtsdatum": "02.02.1990",
+    "geburtsort": "Dorf",
+    "nationalitaet": "Deutsch",
+    "github": "https://github.com/e",
+    "linkedin": "https://linkedin.com/in/e",
+    "website": "https://e.example.com",
+}
+
+BERUFSERFAHRUNG = [
+    {"zeitraum": "2020-2024", "position": "Entwicklerin", "firma": "ACME GmbH", "ort": "Mannheim",
+     "tatigkeiten": ["Backend-Entwicklung", "Code Reviews"]},
+]
+
+AUSBILDUNG = [
+    {"zeitraum": "2024-2026", "abschluss": "Fachinformatikerin (IHK)", "institution": "IHK", "ort": "Mannheim",
+     "note": "1,5", "details": []},
+]
+
+KENNTNISSE = {
+    "programmiersprachen": [
+        {"name": "Python", "level": 90},
+        {"name": "JavaScript", "level": 70},
+        {"name": "TypeScript", "level": 55},
+        {"name": "Go", "level": 60},
+        {"name": "C#", "level": 45},
+        {"name": "R", "level": 30},
+        {"name": "SQL", "level": 65},
+        {"name": "HTML/CSS", "level": 75},
+    ],
+    "ai_ml": [
+        {"name": "PyTorch", "level": 50},
+        {"name": "RAG", "level": 60},
+        {"name": "NLP", "level": 60},
+        {"name": "Pandas", "level": 65},
+    ],
+    "frameworks": [
+        {"name": "Vue.js", "level": 60},
+        {"name": "React", "level": 50},
+        {"name": "Node.js", "level": 55},
+        {"name": "Spring Boot", "level": 40},
+    ],
+    "tools": [
+        {"name": "Git/GitHub", "level": 80},
+        {"name": "Docker", "level": 60},
+        {"name": "Linux", "level": 70},
+        {"name": "PostgreSQL", "level": 55},
+        {"name": "Scrum", "level": 50},
+        {"name": "REST API Design", "level": 60},
+        {"name": "Jira", "level": 60},
+        {"name": "CI/CD", "level": 45},
+    ],
+}
+
+SPRACHEN = [{"sprache": "Deutsch", "niveau": "Muttersprache"}, {"sprache": "Englisch", "niveau": "B2"}]
+ZERTIFIKATE = [{"name": "Python Grundlagen", "datum": "2025"}]
+WEITERBILDUNGEN = ["Docker für Entwickler"]
+HOBBYS = []
+SOFTSKILLS = ["Teamfähigkeit", "Kommunikationsstärke", "Selbstständigkeit"]
+BEWERBUNG = {"datum": datetime.now().strftime("%d.%m.%Y")}
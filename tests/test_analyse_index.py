@@ -0,0 +1,107 @@
+"""
+Tests für AnalyseIndex
+======================
+Lookups müssen glob("<präfix>_*.json") plus max(st_mtime) entsprechen, auch
+wenn eine Datei an Ort und Stelle neu geschrieben wurde (die mtime des
+Verzeichnisses bleibt dabei gleich), und dürfen dafür nicht jede Datei per
+stat() prüfen.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from data.bewerbungs_firma import AnalyseIndex
+
+
+def schreiben(verzeichnis, name: str, mtime: float):
+    pfad = verzeichnis / name
+    pfad.write_text("{}", encoding="utf-8")
+    os.utime(pfad, (mtime, mtime))
+    return pfad
+
+
+def referenz(verzeichnis, muster: str):
+    dateien = list(verzeichnis.glob(muster))
+    return max(dateien, key=lambda p: (p.stat().st_mtime, p.name)) if dateien else None
+
+
+@pytest.fixture
+def archiv(tmp_path):
+    verzeichnis = tmp_path / "analysen"
+    verzeichnis.mkdir()
+    jetzt = time.time()
+    schreiben(verzeichnis, "ACME_GmbH_20250101.json", jetzt - 300)
+    schreiben(verzeichnis, "ACME_GmbH_20250201.json", jetzt - 200)
+    schreiben(verzeichnis, "Beispiel_AG_20250301.json", jetzt - 100)
+    return verzeichnis
+
+
+def test_lookups_wie_glob(archiv):
+    index = AnalyseIndex(archiv)
+    assert index.find_prefix("ACME") == referenz(archiv, "ACME_*.json")
+    assert index.find_prefix("ACME_GmbH") == referenz(archiv, "ACME_GmbH_*.json")
+    assert index.find_prefix("Nix") is None
+    assert index.find_substring("gmbh") == referenz(archiv, "*GmbH*.json")
+    assert index.neueste() == referenz(archiv, "*.json")
+
+
+def test_treffer_neu_geschrieben(archiv):
+    index = AnalyseIndex(archiv)
+    assert index.neueste().name == "Beispiel_AG_20250301.json"
+    assert index.find_prefix("ACME").name == "ACME_GmbH_20250201.json"
+    
+    # Gelieferte Dateien mit älterer mtime neu schreiben (z.B. aus einem
+    # Backup): das Verzeichnis selbst ändert sich nicht
+    dir_state = index.dir_state()
+    frueher = time.time() - 1000
+    schreiben(archiv, "Beispiel_AG_20250301.json", frueher)
+    schreiben(archiv, "ACME_GmbH_20250201.json", frueher)
+    assert index.dir_state() == dir_state
+    
+    assert index.neueste() == referenz(archiv, "*.json")
+    assert index.find_prefix("ACME") == referenz(archiv, "ACME_*.json")
+    assert index.find_substring("gmbh") == referenz(archiv, "*GmbH*.json")
+    
+    # Auch ein neuer Prozess (Index aus der Datei) sieht den neuen Stand
+    assert AnalyseIndex(archiv).neueste() == referenz(archiv, "*.json")
+
+
+def test_add_nach_neu_schreiben(archiv):
+    index = AnalyseIndex(archiv)
+    assert index.neueste().name == "Beispiel_AG_20250301.json"
+    
+    # Wie save_analysis: eine ältere Datei an Ort und Stelle neu schreiben
+    dir_state = index.dir_state()
+    pfad = schreiben(archiv, "ACME_GmbH_20250101.json", time.time() + 100)
+    index.add(pfad, dir_state)
+    
+    assert index.neueste() == pfad
+    assert index.find_prefix("ACME") == pfad
+    assert AnalyseIndex(archiv).neueste() == pfad
+
+
+def test_lookup_ohne_scan(tmp_path, monkeypatch):
+    verzeichnis = tmp_path / "analysen"
+    verzeichnis.mkdir()
+    jetzt = time.time()
+    for i in range(500):
+        schreiben(verzeichnis, f"Firma{i}_GmbH_2025.json", jetzt - i)
+    AnalyseIndex(verzeichnis).neueste()
+    
+    aufrufe = []
+    original_stat = Path.stat
+    
+    def stat(self, *args, **kwargs):
+        aufrufe.append(self)
+        return original_stat(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Path, "stat", stat)
+    index = AnalyseIndex(verzeichnis)
+    assert index.neueste().name == "Firma0_GmbH_2025.json"
+    assert index.find_prefix("Firma42").name == "Firma42_GmbH_2025.json"
+    assert index.find_substring("firma7_").name == "Firma7_GmbH_2025.json"
+    # Pro Lookup: Verzeichnis + gelieferte Datei
+    assert len(aufrufe) == 6
@@ -0,0 +1,43 @@
+"""
+Tests für die Zertifikats-Auswahl der Bewerbungsmappe
+=====================================================
+Zertifikate ohne Bezug zur Stelle kommen nicht in die Mappe - auch dann
+nicht, wenn keine Stellenanalyse vorhanden ist.
+"""
+
+import pytest
+
+import generator
+from generator import ApplicationContext, select_bundle_attachments, select_relevant_kurse
+
+
+@pytest.fixture
+def zertifikate(tmp_path, monkeypatch):
+    verzeichnis = tmp_path / "zertifikate"
+    verzeichnis.mkdir()
+    for name in ("PythonGrundlagen", "DockerFuerEntwickler", "Excel", "Zeitmanagement"):
+        (verzeichnis / f"{name}.pdf").write_bytes(b"%PDF-1.4\n")
+    monkeypatch.setattr(generator, "ZERTIFIKATE_DIR", verzeichnis)
+    return verzeichnis
+
+
+def test_kurse_ohne_analyse():
+    kurse = ["Python Grundlagen", "Excel"]
+    assert select_relevant_kurse(kurse, context=ApplicationContext()) == kurse
+    assert select_relevant_kurse(kurse, context=ApplicationContext(), nur_treffer=True) == []
+    assert select_relevant_kurse(kurse, nur_treffer=True) == []
+
+
+def test_mappe_ohne_analyse(zertifikate):
+    assert select_bundle_attachments(ApplicationContext()) == []
+
+
+def test_mappe_nur_treffer(zertifikate):
+    context = ApplicationContext(analyse={
+        "anforderungen": {"must_have": ["Docker"], "nice_to_have": ["Python"]},
+        "matching": {"top_matches": []},
+    })
+    assert select_bundle_attachments(context) == [
+        zertifikate / "DockerFuerEntwickler.pdf",
+        zertifikate / "PythonGrundlagen.pdf",
+    ]
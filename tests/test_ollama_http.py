@@ -0,0 +1,194 @@
+"""
+Tests für OllamaHTTPBackend und den CLI-Fallback von OllamaClient
+=================================================================
+Gegen einen lokalen http.server-Stub statt eines echten Ollama.
+"""
+
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from data import bewerbungs_firma
+from data.bewerbungs_firma import OllamaClient, OllamaHTTPBackend
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimaler Ollama-Server; Verhalten pro Test über server.antworten"""
+    
+    protocol_version = "HTTP/1.1"  # Keep-Alive
+    
+    def setup(self):
+        super().setup()
+        self.server.verbindungen += 1
+    
+    def log_message(self, *args):
+        pass
+    
+    def _antworten(self):
+        laenge = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(laenge)) if laenge else None
+        self.server.anfragen.append((self.command, self.path, payload))
+        
+        status, daten, verzoegerung, schliessen = self.server.antworten.get(
+            self.path, (404, {"error": "not found"}, 0, False)
+        )
+        time.sleep(verzoegerung)
+        if isinstance(daten, list):
+            # Streaming wie Ollama: NDJSON in Chunked-Encoding
+            self.send_response(status)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for obj in daten:
+                zeile = json.dumps(obj).encode("utf-8") + b"\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(zeile), zeile))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        
+        body = json.dumps(daten).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Verbindung ohne "Connection: close" trennen, wie ein Server nach Idle-Timeout
+        self.close_connection = schliessen
+    
+    do_GET = _antworten
+    do_POST = _antworten
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def handle_error(self, request, client_address):
+        pass  # z.B. Client nach Timeout schon weg
+
+
+@pytest.fixture
+def server():
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    server.verbindungen = 0
+    server.anfragen = []
+    server.antworten = {
+        "/api/tags": (200, {"models": [{"name": "mistral:7b"}]}, 0, False),
+        "/api/generate": (200, {"response": " Hallo ", "done": True, "eval_count": 2}, 0, False),
+        "/api/chat": (200, {"message": {"role": "assistant", "content": " Hi "}, "done": True}, 0, False),
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    """OllamaClient gegen den Stub; die CLI wird nur gezählt, nie gestartet"""
+    monkeypatch.setitem(bewerbungs_firma._llm_cache_config, "enabled", False)
+    client = OllamaClient(host=f"127.0.0.1:{server.server_port}")
+    client.cli_aufrufe = []
+    
+    def query_cli(model, prompt, system_prompt):
+        client.cli_aufrufe.append(prompt)
+        return "cli"
+    
+    monkeypatch.setattr(client, "_query_cli", query_cli)
+    assert client.is_available() and client.backend == "http"
+    return client
+
+
+def test_keep_alive_wiederverwendung(server):
+    backend = OllamaHTTPBackend(f"127.0.0.1:{server.server_port}")
+    for _ in range(5):
+        assert backend.request("GET", "/api/tags", timeout=5)["models"]
+    assert server.verbindungen == 1
+
+
+def test_retry_nach_getrennter_verbindung(server):
+    backend = OllamaHTTPBackend(f"127.0.0.1:{server.server_port}")
+    server.antworten["/api/tags"] = (200, {"models": []}, 0, True)
+    
+    # Jede Antwort trennt die Verbindung; die nächste Anfrage trifft auf die
+    # tote Pool-Verbindung und muss einmal mit einer frischen wiederholt werden
+    for _ in range(3):
+        assert backend.request("GET", "/api/tags", timeout=5) == {"models": []}
+    assert server.verbindungen == 3
+    assert len(server.anfragen) == 3
+
+
+@pytest.mark.parametrize("chunked", [True, False])
+def test_stream_verbindung_wiederverwendbar(server, chunked):
+    objekte = [{"response": "Hal"}, {"response": "lo"}, {"response": "", "done": True}]
+    if not chunked:
+        # Ein einzelnes Objekt mit Content-Length (z.B. hinter einem Proxy)
+        objekte = objekte[-1:]
+    server.antworten["/api/generate"] = (200, objekte if chunked else objekte[0], 0, False)
+    
+    backend = OllamaHTTPBackend(f"127.0.0.1:{server.server_port}")
+    assert list(backend.stream("/api/generate", {"prompt": "x"}, timeout=5)) == objekte
+    assert backend.request("GET", "/api/tags", timeout=5)
+    assert server.verbindungen == 1
+
+
+def test_stream_ueber_client(client, server):
+    server.antworten["/api/generate"] = (200, [
+        {"response": "Hal"}, {"response": "lo"}, {"response": "", "done": True, "eval_count": 2},
+    ], 0, False)
+    assert "".join(client.stream("Frage")) == "Hallo"
+    assert client.cli_aufrufe == []
+    assert client.metriken[-1].backend == "http"
+
+
+def test_query_ueber_http(client, server):
+    assert client.query("Frage") == "Hallo"
+    assert client.cli_aufrufe == []
+    assert client.metriken[-1].backend == "http"
+
+
+def test_fallback_bei_http_fehler(client, server):
+    server.antworten["/api/generate"] = (500, {"error": "model not found"}, 0, False)
+    assert client.query("Frage") == "cli"
+    assert client.cli_aufrufe == ["Frage"]
+    assert client.backend == "cli"
+
+
+def test_chat_metriken(client, server):
+    server.antworten["/api/chat"] = (200, {
+        "message": {"role": "assistant", "content": " Hi "}, "done": True,
+        "eval_count": 4, "eval_duration": 2_000_000_000, "load_duration": 500_000_000,
+    }, 0, False)
+    assert client.chat([{"role": "user", "content": "Hallo"}]) == "Hi"
+    assert len(client.metriken) == 1
+    metriken = client.metriken[0]
+    assert (metriken.backend, metriken.tokens, metriken.tokens_pro_s, metriken.ttft) == ("http", 4, 2.0, 0.5)
+
+
+def test_chat_fallback_bei_http_fehler(client, server):
+    server.antworten["/api/chat"] = (503, {"error": "busy"}, 0, False)
+    assert client.chat([{"role": "user", "content": "Hallo"}]) == "cli"
+    assert client.cli_aufrufe == ["User: Hallo"]
+
+
+def test_chat_kein_fallback_bei_timeout(client, server, monkeypatch):
+    monkeypatch.setattr(client, "TIMEOUT", 0.2)
+    server.antworten["/api/chat"] = (200, {"message": {"content": "spät"}}, 1.0, False)
+    assert client.chat([{"role": "user", "content": "Hallo"}]) is None
+    assert client.cli_aufrufe == []
+    assert client.backend == "http"
+
+
+def test_cache_treffer_ohne_ttft(client, server, monkeypatch, tmp_path):
+    monkeypatch.setitem(bewerbungs_firma._llm_cache_config, "enabled", True)
+    monkeypatch.setitem(bewerbungs_firma._llm_cache_config, "path", tmp_path / "llm_cache.sqlite3")
+    monkeypatch.setattr(bewerbungs_firma, "_llm_cache_instance", None)
+    
+    assert client.query("Frage") == "Hallo"
+    assert client.query("Frage") == "Hallo"
+    assert len([a for a in server.anfragen if a[1] == "/api/generate"]) == 1
+    
+    treffer = client.metriken[-1]
+    assert (treffer.backend, treffer.ttft, treffer.tokens_pro_s) == ("cache", None, 0.0)
@@ -0,0 +1,157 @@
+"""
+Tests für SkillMatcher
+======================
+Der Lookup über Synonym- und N-Gramm-Index muss für jede Anforderung
+denselben Skill liefern wie die lineare Suche vor Einführung des Index;
+match_many() muss pro Anzeige dasselbe Ergebnis liefern wie match().
+"""
+
+import random
+import string
+import builtins
+from typing import Optional
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from _common import BEISPIEL_ANZEIGEN
+from data.bewerbungs_firma import Anforderungen, RegexExtractor, SkillMatcher
+
+
+def lineare_suche(matcher: SkillMatcher, anforderung: str) -> Optional[dict]:
+    """_find_match vor Einführung des Index (Referenz)"""
+    anforderung_clean = anforderung.strip().lower()
+    
+    # Direkte Übereinstimmung
+    if anforderung_clean in matcher.meine_skills:
+        return matcher.meine_skills[anforderung_clean]
+    
+    # Prüfe Synonyme
+    for haupt_skill, synonyme in matcher.SYNONYME.items():
+        if anforderung_clean in synonyme or anforderung_clean == haupt_skill:
+            if haupt_skill in matcher.meine_skills:
+                return matcher.meine_skills[haupt_skill]
+            for syn in synonyme:
+                if syn in matcher.meine_skills:
+                    return matcher.meine_skills[syn]
+    
+    # Teilübereinstimmung
+    for skill_key, skill_data in matcher.meine_skills.items():
+        if anforderung_clean in skill_key or skill_key in anforderung_clean:
+            return skill_data
+    
+    return None
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return SkillMatcher(embeddings=False)
+
+
+def zufalls_anforderungen(matcher: SkillMatcher, anzahl: int, seed: int) -> list:
+    """Anforderungen für alle Zweige von _find_match (Keys, Synonyme, Teilstrings, Rauschen)"""
+    rnd = random.Random(seed)
+    keys = list(matcher.meine_skills)
+    aliase = [alias for haupt, syns in SkillMatcher.SYNONYME.items() for alias in (haupt, *syns)]
+    woerter = ["erfahrung", "mit", "kenntnisse", "in", "und", "sehr gute", "api", "design", "(m/w/d)"]
+    
+    def teilstring(text: str) -> str:
+        i = rnd.randrange(len(text) + 1)
+        return text[i:rnd.randrange(i, len(text) + 1)]
+    
+    erzeuger = [
+        lambda: rnd.choice(keys),
+        lambda: rnd.choice(aliase),
+        lambda: teilstring(rnd.choice(keys)),
+        lambda: teilstring(rnd.choice(aliase)),
+        lambda: rnd.choice(keys)[:rnd.randrange(SkillMatcher.NGRAM)],
+        lambda: f"{rnd.choice(woerter)} {rnd.choice(keys)} {rnd.choice(woerter)}",
+        lambda: " ".join(rnd.sample(keys, 2)),
+        lambda: "".join(rnd.choices(string.ascii_lowercase + " ./#+", k=rnd.randrange(7))),
+        lambda: f"  {rnd.choice(aliase).upper()} ",
+    ]
+    return [rnd.choice(erzeuger)() for _ in range(anzahl)]
+
+
+@pytest.mark.parametrize("anforderung", [
+    "", " ", "\t", "g", "go", "c#", "r", "#", "py", "js", "ts", "k8s", "es6", "postgres",
+    "github", "gitlab", "GitHub Actions", "kanban", "bash", "reactjs", "vue.js", "node.js",
+    "rest", "api", "css", "html/css", "spring", "teamfähigkeit", "kotlin", "cobol",
+])
+def test_find_match_feste_faelle(matcher, anforderung):
+    assert matcher._find_match(anforderung) == lineare_suche(matcher, anforderung)
+
+
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_find_match_zufall(matcher, seed):
+    for anforderung in zufalls_anforderungen(matcher, 3000, seed):
+        assert matcher._find_match(anforderung) == lineare_suche(matcher, anforderung), anforderung
+
+
+def test_find_match_kurz_und_leer(matcher):
+    # Alle Strings kürzer als NGRAM aus den Zeichen der eigenen Skills
+    zeichen = sorted({c for key in matcher.meine_skills for c in key})
+    kurze = [""] + zeichen + [a + b for a in zeichen for b in zeichen]
+    for anforderung in kurze:
+        assert matcher._find_match(anforderung) == lineare_suche(matcher, anforderung), anforderung
+
+
+def test_find_match_synonyme(matcher):
+    for haupt, synonyme in SkillMatcher.SYNONYME.items():
+        for alias in (haupt, *synonyme):
+            assert matcher._find_match(alias) == lineare_suche(matcher, alias), alias
+
+
+def zufalls_anzeigen(matcher: SkillMatcher, anzahl: int, seed: int) -> list:
+    """Anforderungen pro Anzeige, inkl. leerer Anzeigen und doppelter Begriffe"""
+    rnd = random.Random(seed)
+    begriffe = zufalls_anforderungen(matcher, 300, seed)
+    return [
+        Anforderungen(
+            must_have=rnd.choices(begriffe, k=rnd.randrange(8)),
+            nice_to_have=rnd.choices(begriffe, k=rnd.randrange(5)),
+            soft_skills=rnd.choices(begriffe + list(matcher.meine_skills), k=rnd.randrange(4)),
+        )
+        for _ in range(anzahl)
+    ]
+
+
+def test_match_many_wie_match(matcher):
+    anzeigen = zufalls_anzeigen(matcher, 500, 3) + [Anforderungen()]
+    anzeigen += [RegexExtractor().extract_all(ad).anforderungen for ad in BEISPIEL_ANZEIGEN]
+    
+    stapel = matcher.match_many(anzeigen)
+    assert len(stapel) == len(anzeigen)
+    for anforderungen, ergebnis in zip(anzeigen, stapel):
+        assert asdict(ergebnis) == asdict(matcher.match(anforderungen))
+
+
+def test_match_many_leer(matcher):
+    assert matcher.match_many([]) == []
+
+
+def test_match_many_ohne_numpy(matcher, monkeypatch):
+    original_import = builtins.__import__
+    
+    def ohne_numpy(name, *args, **kwargs):
+        if name == "numpy":
+            raise ImportError(name)
+        return original_import(name, *args, **kwargs)
+    
+    monkeypatch.setattr(builtins, "__import__", ohne_numpy)
+    anzeigen = zufalls_anzeigen(matcher, 50, 5)
+    assert [asdict(e) for e in matcher.match_many(anzeigen)] == [asdict(matcher.match(a)) for a in anzeigen]
+
+
+def test_find_match_threads(matcher):
+    # Wie die LLM-Threads in analyze_batch: ein Matcher, kleiner Cache, der ständig geleert wird
+    lokal = SkillMatcher(embeddings=False)
+    lokal.TREFFER_CACHE_SIZE = 8
+    anforderungen = zufalls_anforderungen(lokal, 4000, 11)
+    erwartet = [matcher._find_match(a) for a in anforderungen]
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ergebnisse = list(pool.map(lokal._find_match, anforderungen))
+    assert ergebnisse == erwartet
+    assert len(lokal._treffer) <= lokal.TREFFER_CACHE_SIZE